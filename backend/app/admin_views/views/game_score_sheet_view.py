@@ -2,11 +2,13 @@ from flask_babel import lazy_gettext as _
 from flask_admin.contrib.sqla import ModelView
 from flask import request, url_for, flash, redirect, jsonify
 from flask_admin import expose
+from pydantic import ValidationError
 from app.utils.display import format_end_game_score
 from app.utils.choices import get_team_players
 from app.utils.game_utils import load_existing_throws, set_player_choices
 from app.services.game_service import GameService
-from app.forms.throw_forms import GameScoreSheetForm 
+from app.forms.throw_forms import GameScoreSheetForm, score_sheet_form
+from app.models.schemas import ScoreSheet
 import logging
 from app.utils.constants import GameScores  # Ensure this import is correct
 
@@ -75,7 +77,7 @@ class GameScoreSheetAdmin(ModelView):  # Changed from CustomModelView to ModelVi
 
         game_type = game.series.game_type
         
-        form = GameScoreSheetForm(request.form if request.method == 'POST' else None, game_type=game_type)
+        form = score_sheet_form(game_type, request.form if request.method == 'POST' else None)
         
         team1_players = get_team_players(game.team_1_id, self.session) or [('-1', 'No players')]
         team2_players = get_team_players(game.team_2_id, self.session) or [('-1', 'No players')]
@@ -105,15 +107,6 @@ class GameScoreSheetAdmin(ModelView):  # Changed from CustomModelView to ModelVi
         # GET request
         load_existing_throws(self.session, form, game)
 
-        # Add safer debug logging for form fields
-        self.logger.debug("Form field values after loading:")
-        if hasattr(form, '_fields'):
-            for field_name, field in form._fields.items():
-                try:
-                    self.logger.debug(f"{field_name}: {field.data if hasattr(field, 'data') else 'NO DATA'}")
-                except Exception as e:
-                    self.logger.debug(f"Could not get data for {field_name}: {e}")
-
         return self.render(
             self.edit_template,
             form=form,
@@ -125,6 +118,68 @@ class GameScoreSheetAdmin(ModelView):  # Changed from CustomModelView to ModelVi
             team2_players=team2_players
         )
 
+    @expose('/sheet/<int:game_id>', methods=('POST',))
+    def score_sheet_json_view(self, game_id):
+        """Save a whole score sheet posted as JSON (see ScoreSheet), used by the mobile form"""
+        if self.get_game(game_id) is None:
+            return jsonify({'error': 'Game not found'}), 404
+        try:
+            sheet = ScoreSheet.model_validate(request.get_json(silent=True) or {})
+        except ValidationError as e:
+            errors = [{'loc': list(error['loc']), 'msg': error['msg']} for error in e.errors()]
+            return jsonify({'error': 'Invalid score sheet', 'details': errors}), 400
+        try:
+            self.game_service.save_score_sheet(self.session, game_id, sheet)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Error saving score sheet of game {game_id}: {e}", exc_info=True)
+            return jsonify({'error': 'Error saving throws'}), 500
+        return jsonify({'status': 'success', 'redirect': url_for('.index_view')})
+
+    @expose('/draft/<int:game_id>', methods=('GET', 'PATCH', 'DELETE'))
+    def draft_view(self, game_id):
+        """Server side draft of a score sheet, patched with JSON {"base_version": n, "cells": {...}}"""
+        draft_service = self.game_service.draft_service
+        if self.get_game(game_id) is None:
+            return jsonify({'error': 'Game not found'}), 404
+
+        if request.method == 'GET':
+            draft = draft_service.get_draft(self.session, game_id)
+            return jsonify(draft or {'game_id': game_id, 'version': 0, 'cells': {}})
+
+        if request.method == 'DELETE':
+            draft_service.delete_draft(self.session, game_id)
+            self.session.commit()
+            return jsonify({'status': 'success'})
+
+        payload = request.get_json(silent=True) or {}
+        cells = payload.get('cells')
+        if not isinstance(cells, dict):
+            return jsonify({'error': 'cells must be an object'}), 400
+        try:
+            draft = draft_service.patch_draft(
+                self.session, game_id, cells, int(payload.get('base_version') or 0)
+            )
+            self.session.commit()
+            return jsonify(draft)
+        except ValueError as e:
+            self.session.rollback()
+            return jsonify({'error': str(e)}), 400
+
+    @expose('/draft/<int:game_id>/promote', methods=('POST',))
+    def promote_draft_view(self, game_id):
+        """Save the draft as the final score sheet"""
+        try:
+            if not self.game_service.promote_draft(self.session, game_id):
+                return jsonify({'error': 'No draft for this game'}), 404
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Error promoting draft of game {game_id}: {e}", exc_info=True)
+            return jsonify({'error': 'Error saving throws'}), 500
+        return jsonify({'status': 'success', 'redirect': url_for('.index_view')})
+
     def get_game(self, game_id):
         return self.session.query(self.model).get(game_id)
 
@@ -4,8 +4,11 @@ from wtforms.validators import DataRequired
 from flask_admin.base import expose
 from .base import CustomModelView
 from app.utils.choices import get_series_choices, get_team_choices_by_series, get_series_participant_choices
-from flask import redirect, url_for, request, render_template
-from app.utils.display import format_team_name, format_series_name, format_end_game_score
+from flask import redirect, url_for, request, render_template, flash
+from app.utils.display import format_team_name, format_series_name, format_end_game_score, prefetch_display_lookups
+from app.services.standings_service import StandingsService
+from app.services.import_service import GameImportService
+import io
 import logging
 
 class GameTypeAdmin(CustomModelView):
@@ -48,6 +51,25 @@ class GameAdmin(CustomModelView):
                 admin_view=self)
         return super().create_view()
 
+    @expose('/import/', methods=('GET', 'POST'))
+    def import_view(self):
+        summary = None
+        if request.method == 'POST':
+            upload = request.files.get('file')
+            if not upload or not upload.filename:
+                flash(_('Select a file to import'), 'error')
+            else:
+                file_format = request.form.get('format') or upload.filename.rsplit('.', 1)[-1].lower()
+                file_format = 'json' if file_format == 'jsonl' else file_format
+                stream = io.TextIOWrapper(upload.stream, encoding='utf-8', newline='')
+                try:
+                    summary = GameImportService().import_file(self.session, stream, file_format)
+                except Exception as e:
+                    self.session.rollback()
+                    logging.error(f"Error importing games: {e}")
+                    flash(str(e), 'error')
+        return self.render('admin/game_import.html', summary=summary, admin_view=self)
+
     def create_form(self, obj=None):
         form = super().create_form(obj)
         series_choices, _ = get_series_choices()
@@ -100,6 +122,10 @@ class GameAdmin(CustomModelView):
 
     def on_model_change(self, form, model, is_created):
         try:
+            previous = None if is_created else self.standings_service.game_snapshot(model, committed=True)
+            self.standings_service.apply_game_change(
+                self.session, previous, self.standings_service.game_snapshot(model)
+            )
             result = super().on_model_change(form, model, is_created)
             if is_created and 'next_step' in request.form:
                 return redirect(url_for('gamescoresheetadmin.edit_view', id=model.id))
@@ -108,7 +134,14 @@ class GameAdmin(CustomModelView):
             logging.error(f"Error in on_model_change: {e}")
             raise
 
+    def on_model_delete(self, model):
+        self.standings_service.apply_game_change(
+            self.session, self.standings_service.game_snapshot(model, committed=True), None
+        )
+        return super().on_model_delete(model)
+
     def __init__(self, model, session, **kwargs):
+        self.standings_service = StandingsService()
         self.form_extra_fields = {
             'series_id': SelectField('series', coerce=str, render_kw={'readonly': True,'disabled': 'disabled'}),
             'team_1_id': SelectField('team_1', coerce=str, validators=[DataRequired(message='Please select team 1')]),
@@ -116,6 +149,18 @@ class GameAdmin(CustomModelView):
         }
         super().__init__(model, session, **kwargs)
 
+    def get_list(self, page, sort_column, sort_desc, search, filters, execute=True, page_size=None):
+        result = super().get_list(page, sort_column, sort_desc, search, filters, execute, page_size)
+        if execute:
+            # Load the teams and series of the visible page for the column formatters
+            _, games = result
+            prefetch_display_lookups(
+                self.session,
+                team_ids=[id for game in games for id in (game.team_1_id, game.team_2_id)],
+                series_ids=[game.series_id for game in games]
+            )
+        return result
+
     def _team_formatter(view, context, model, name):
         return format_team_name(view.session, getattr(model, name))
     def _series_formatter(view, context, model, name):
@@ -1,42 +1,59 @@
 from flask_babel import lazy_gettext as _
 from wtforms import SelectField
 from flask_admin.model.form import InlineFormAdmin
-from app.utils.choices import get_team_choices_with_player_count, get_player_choices_for_form, get_registration_choices
+from flask_admin.contrib.sqla.ajax import QueryAjaxModelLoader
+from app.utils.choices import get_team_choices_with_player_count, get_registration_choices
+from app.services.player_service import player_search_query
 from .base import CustomModelView
-from app.models import db, RosterPlayersInSeries, SeriesRegistration
+from app.models import db, RosterPlayersInSeries, SeriesRegistration, Player
+
+class PlayerSearchAjaxLoader(QueryAjaxModelLoader):
+    """Player lookup for the roster form's AJAX select.
+
+    Uses the same search as the /players/search API instead of rendering
+    every player into the page.
+    """
+    def format(self, model):
+        if not model:
+            return None
+        return model.id, f"{model.name} ({model.email})"
+
+    def get_list(self, term, offset=0, limit=10):
+        return self.session.execute(player_search_query(term, limit, offset)).scalars().all()
 
 class RosterAdmin(CustomModelView):
     column_list = ['registration_id', 'player_id']
-    form_columns = ['registration_id', 'player_id']
+    form_columns = ['registration_id', 'player']
 
     form_overrides = {
         'registration_id': SelectField,
-        'player_id': SelectField,
     }
 
+    form_ajax_refs = {
+        'player': {
+            'fields': ['name', 'email'],
+            'page_size': 10,
+            'minimum_input_length': 2,
+        }
+    }
+
+    def _create_ajax_loader(self, name, options):
+        if name == 'player':
+            return PlayerSearchAjaxLoader(name, self.session, Player, **options)
+        return super()._create_ajax_loader(name, options)
+
     def create_form(self):
         form = super().create_form()
-        registration_choices = get_registration_choices()
-        player_choices = [(str(id), name) for id, name in get_player_choices_for_form()]
-        
-        if not player_choices:
-            player_choices = [('', 'No players available')]
-            
-        form.registration_id.choices = registration_choices
-        form.player_id.choices = player_choices
+        form.registration_id.choices = get_registration_choices()
         form.registration_id.coerce = str
-        form.player_id.coerce = str
         return form
 
     def edit_form(self, obj):
         form = super().edit_form(obj)
         form.registration_id.choices = get_registration_choices()
-        form.player_id.choices = [(str(id), name) for id, name in get_player_choices_for_form()] or [('', 'No players available')]
         form.registration_id.coerce = str
-        form.player_id.coerce = str
         if obj is not None:
             form.registration_id.data = str(obj.registration_id)
-            form.player_id.data = str(obj.player_id)
         return form
 
     def _registration_formatter(view, context, model, name):
@@ -64,7 +81,8 @@ class RosterAdmin(CustomModelView):
 
     column_labels = {
         'registration_id': _('team'),
-        'player_id': _('player')
+        'player_id': _('player'),
+        'player': _('player')
     }
 
     form_labels = column_labels
@@ -102,5 +120,4 @@ class RosterAdmin(CustomModelView):
     def on_model_change(self, form, model, is_created):
         """Convert string IDs back to integers before saving to database"""
         model.registration_id = int(form.registration_id.data)
-        model.player_id = int(form.player_id.data)
         return super().on_model_change(form, model, is_created)
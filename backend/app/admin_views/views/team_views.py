@@ -2,7 +2,7 @@ from flask_babel import lazy_gettext as _
 from wtforms import StringField, SelectField
 from .base import CustomModelView
 from app.utils.choices import get_series_choices, get_player_choices_with_contact
-from app.utils.display import format_series_name, format_player_contact_info
+from app.utils.display import format_series_name, format_player_contact_info, prefetch_display_lookups
 from flask import flash
 from app.utils.validation_messages import validate_team_form
 from app.models import SeriesRegistration 
@@ -64,6 +64,17 @@ class SeriesRegistrationAdmin(CustomModelView):
         'lohko': _('group') 
     }
 
+    def get_list(self, page, sort_column, sort_desc, search, filters, execute=True, page_size=None):
+        result = super().get_list(page, sort_column, sort_desc, search, filters, execute, page_size)
+        if execute:
+            _, registrations = result
+            prefetch_display_lookups(
+                self.session,
+                series_ids=[reg.series_id for reg in registrations],
+                player_ids=[reg.contact_player_id for reg in registrations]
+            )
+        return result
+
     # Add formatters to display names instead of IDs
     def _contact_player_formatter(view, context, model, name):
         return format_player_contact_info(view.session, model.contact_player_id)
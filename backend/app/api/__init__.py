@@ -1,9 +1,11 @@
 from fastapi import APIRouter
-from .v1 import game_types, series, players, games
+from .v1 import game_types, series, players, games, exports, metrics
 
 api_router = APIRouter()
 api_router.include_router(series.router, prefix="/series", tags=["series"])
 api_router.include_router(game_types.router, prefix="/game_types", tags=["game_types"])
 api_router.include_router(players.router, prefix="/players", tags=["players"])
 api_router.include_router(games.router, prefix="/games", tags=["games"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import series, game_types, games, players, series_admin
+from app.api.v1 import series, game_types, games, players, series_admin, exports, metrics
 
 api_router = APIRouter()
 api_router.include_router(series.router, prefix="/series", tags=["series"])
@@ -7,5 +7,7 @@ api_router.include_router(game_types.router, prefix="/game_types", tags=["game_t
 api_router.include_router(games.router, prefix="/games", tags=["games"])
 api_router.include_router(players.router, prefix="/players", tags=["players"])
 api_router.include_router(series_admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
 # Add other routers here as needed
\ No newline at end of file
@@ -1,3 +1,3 @@
-from . import game_types, series, players, games
+from . import game_types, series, players, games, exports, metrics
 # This file can be empty or contain package-level imports
 # ...other package-level imports if needed...
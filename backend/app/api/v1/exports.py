@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from database.database import get_db
+from ...services import export_service
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: str = Query("csv", pattern="^(csv|parquet)$"),
+    series_id: Optional[int] = Query(None),
+    year: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream the throws or games dataset as CSV or Parquet"""
+    if dataset not in export_service.EXPORT_QUERIES:
+        raise HTTPException(status_code=404, detail="Unknown export dataset")
+    try:
+        chunks = export_service.stream_export(db, dataset, format, series_id=series_id, year=year)
+        # Fail before the response starts, e.g. when pyarrow is missing
+        first_chunk = await chunks.__anext__()
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting {dataset}: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    async def body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=export_service.EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{format}"'}
+    )
@@ -1,14 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from database.database import get_db
-from ...models.schemas import Game as GameSchema, GameCreate  # Update this import
+from ...models.schemas import Game as GameSchema, GameDetail, GameCreate, GameTotals, LiveThrowCreate, ThrowCorrection  # Update this import
 from ...services import game_service
+from ...utils.constants import Pagination
+from ...utils.pagination import set_page_headers
+from ...utils.live_hub import live_hub
+import asyncio
+import json
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Comment lines sent to idle live streams so proxies keep them open
+LIVE_KEEPALIVE_SECONDS = 15
+
 @router.post("/", response_model=GameSchema)  # Use GameSchema
 async def create_game(
     game: GameCreate,
@@ -21,21 +30,32 @@ async def create_game(
         logger.error(f"Error creating game: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-@router.get("/{game_id}", response_model=GameSchema)  # Use GameSchema
+@router.get("/{game_id}", response_model=GameDetail)
 async def get_game(game_id: int, db: AsyncSession = Depends(get_db)):
     try:
         db_game = await game_service.get_game(db=db, game_id=game_id)
         if db_game is None:
             raise HTTPException(status_code=404, detail="Game not found")
         return db_game
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching game: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.get("/", response_model=List[GameSchema])  # Use GameSchema
-async def list_games(db: AsyncSession = Depends(get_db)):
+async def list_games(
+    response: Response,
+    limit: int = Query(Pagination.DEFAULT_LIMIT, ge=1, le=Pagination.MAX_LIMIT),
+    after: Optional[int] = Query(None, description="Id of the last game of the previous page"),
+    series_id: Optional[int] = Query(None),
+    year: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
     try:
-        games = await game_service.list_games(db=db)
+        games = await game_service.list_games(db=db, limit=limit, after=after, series_id=series_id, year=year)
+        total = await game_service.count_games(db=db, series_id=series_id, year=year)
+        set_page_headers(response, games, limit, total)
         return games
     except Exception as e:
         logger.error(f"Error fetching games: {e}")
@@ -52,6 +72,8 @@ async def update_game(
         if db_game is None:
             raise HTTPException(status_code=404, detail="Game not found")
         return db_game
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error updating game: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -63,6 +85,99 @@ async def delete_game(game_id: int, db: AsyncSession = Depends(get_db)):
         if not success:
             raise HTTPException(status_code=404, detail="Game not found")
         return {"status": "success"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error deleting game: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@router.post("/{game_id}/throws", response_model=GameTotals)
+async def append_throw(
+    game_id: int,
+    throw: LiveThrowCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Save one throw of a game in progress and broadcast the new totals to live subscribers"""
+    try:
+        totals = await game_service.append_throw(db=db, game_id=game_id, throw=throw)
+        if totals is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error saving throw of game {game_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    live_hub.publish(game_id, {'throw': throw.model_dump(), 'totals': totals})
+    return totals
+
+@router.patch("/{game_id}/throws/{game_set_index}/{throw_round}/{team}/{round_throw_number}", response_model=GameTotals)
+async def correct_throw(
+    game_id: int,
+    correction: ThrowCorrection,
+    game_set_index: int = Path(ge=1, le=2),
+    throw_round: int = Path(ge=1, le=5),
+    team: int = Path(ge=1, le=2, description="1 for the home team, 2 for the away team"),
+    round_throw_number: int = Path(ge=1, le=4),
+    db: AsyncSession = Depends(get_db)
+):
+    """Correct one saved throw in place and return the new totals of its set"""
+    try:
+        totals = await game_service.correct_throw(
+            db=db, game_id=game_id, game_set_index=game_set_index, throw_round=throw_round,
+            is_home_team=team == 1, round_throw_number=round_throw_number, correction=correction
+        )
+        if totals is None:
+            raise HTTPException(status_code=404, detail="Throw not found")
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error correcting throw of game {game_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    live_hub.publish(game_id, {
+        'throw': {
+            'game_set_index': game_set_index, 'throw_round': throw_round, 'is_home_team': team == 1,
+            'round_throw_number': round_throw_number, **correction.model_dump()
+        },
+        'totals': totals
+    })
+    return totals
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.get("/{game_id}/live")
+async def follow_game(game_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """Server-Sent Events stream of a game: the current totals, then one event per saved throw"""
+    try:
+        totals = await game_service.get_game_totals(db=db, game_id=game_id)
+        if totals is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching totals of game {game_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    # The stream can stay open for the whole game, don't hold a connection meanwhile
+    await db.close()
+
+    async def events():
+        async with live_hub.subscribe(game_id) as queue:
+            yield _sse("totals", totals)
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), LIVE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse("throw", event)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,21 @@
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from database.database import engine
+from ...metrics import REGISTRY, CONTENT_TYPE, register_engine, scrape_status
+
+router = APIRouter()
+
+register_engine('api', engine.sync_engine)
+
+@router.get("", response_class=PlainTextResponse)
+async def metrics(authorization: Optional[str] = Header(None)):
+    """Metrics of this process in the Prometheus text format.
+
+    Needs ``Authorization: Bearer <METRICS_TOKEN>``. Request latencies are
+    recorded once the app is wrapped in app.metrics.MetricsMiddleware.
+    """
+    status = scrape_status(authorization)
+    if status != 200:
+        raise HTTPException(status_code=status, detail="Not Found" if status == 404 else "Invalid metrics token")
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
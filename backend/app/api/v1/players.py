@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from database.database import get_db
-from ...models.schemas import Player, PlayerCreate  # Update import to use Pydantic schema
-from ...services import player_service
+from ...models.schemas import Player, PlayerCreate, PlayerStats, LeaderboardEntry  # Update import to use Pydantic schema
+from ...services import player_service, player_stats_service
+from ...utils.constants import Pagination
+from ...utils.pagination import set_page_headers
 
 router = APIRouter()
 
@@ -15,6 +17,36 @@ async def create_player(
     db_player = await player_service.create_player(db=db, player=player)
     return db_player
 
+@router.get("/leaderboard", response_model=List[LeaderboardEntry])
+async def get_leaderboard(
+    order_by: str = Query("average_score"),
+    min_throws: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
+    if order_by not in player_stats_service.LEADERBOARD_ORDER:
+        raise HTTPException(status_code=400, detail=f"Invalid order_by: {order_by}")
+    return await player_stats_service.get_leaderboard(
+        db=db, order_by=order_by, min_throws=min_throws, limit=limit, offset=offset
+    )
+
+@router.get("/search", response_model=List[Player])
+async def search_players(
+    q: str = Query(..., min_length=2, description="Part of the player's name or email"),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
+    return await player_service.search_players(db=db, term=q, limit=limit, offset=offset)
+
+@router.get("/{player_id}/stats", response_model=PlayerStats)
+async def get_player_stats(player_id: int, db: AsyncSession = Depends(get_db)):
+    stats = await player_stats_service.get_player_stats(db=db, player_id=player_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return stats
+
 @router.get("/{player_id}", response_model=Player)
 async def get_player(player_id: int, db: AsyncSession = Depends(get_db)):
     db_player = await player_service.get_player(db=db, player_id=player_id)
@@ -23,8 +55,19 @@ async def get_player(player_id: int, db: AsyncSession = Depends(get_db)):
     return db_player
 
 @router.get("/", response_model=List[Player])
-async def list_players(db: AsyncSession = Depends(get_db)):
-    players = await player_service.list_players(db=db)
+async def list_players(
+    response: Response,
+    limit: int = Query(Pagination.DEFAULT_LIMIT, ge=1, le=Pagination.MAX_LIMIT),
+    after: Optional[int] = Query(None, description="Id of the last player of the previous page"),
+    name: Optional[str] = Query(None, min_length=1, description="Name prefix"),
+    series_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
+    players = await player_service.list_players(
+        db=db, limit=limit, after=after, name_prefix=name, series_id=series_id
+    )
+    total = await player_service.count_players(db=db, name_prefix=name, series_id=series_id)
+    set_page_headers(response, players, limit, total)
     return players
 
 @router.put("/{player_id}", response_model=Player)
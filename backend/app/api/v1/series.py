@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Form
+from fastapi import APIRouter, Depends, HTTPException, Form, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from typing import List
+from typing import List, Dict, Optional
 from database.database import get_db
-from ...models.schemas import SeriesCreate, Series, SeriesRegistrationCreate, SeriesRegistration
-from ...services import series_service
+from ...models.schemas import SeriesCreate, Series, SeriesRegistrationCreate, SeriesRegistration, SeriesStanding
+from ...services import series_service, standings_service
+from ...utils.constants import Pagination
+from ...utils.pagination import set_page_headers
 import logging
 
 router = APIRouter()
@@ -50,14 +52,34 @@ async def get_series(series_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.get("/", response_model=List[Series])
-async def list_series(db: AsyncSession = Depends(get_db)):
+async def list_series(
+    response: Response,
+    limit: int = Query(Pagination.DEFAULT_LIMIT, ge=1, le=Pagination.MAX_LIMIT),
+    after: Optional[int] = Query(None, description="Id of the last series of the previous page"),
+    year: Optional[int] = Query(None),
+    name: Optional[str] = Query(None, min_length=1, description="Name prefix"),
+    db: AsyncSession = Depends(get_db)
+):
     try:
-        series_list = await series_service.list_series(db=db)  # Ensure this is awaited
+        series_list = await series_service.list_series(
+            db=db, limit=limit, after=after, year=year, name_prefix=name
+        )  # Ensure this is awaited
+        total = await series_service.count_series(db=db, year=year, name_prefix=name)
+        set_page_headers(response, series_list, limit, total)
         return series_list
     except Exception as e:
         logger.error(f"Error fetching series: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
+@router.get("/{series_id}/standings", response_model=Dict[str, List[SeriesStanding]])
+async def get_series_standings(series_id: int, db: AsyncSession = Depends(get_db)):
+    """Standings of a series grouped by lohko, read from the materialized standings table"""
+    try:
+        return await standings_service.get_series_standings(db=db, series_id=series_id)
+    except Exception as e:
+        logger.error(f"Error fetching standings: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
 @router.post("/{series_id}/teams", response_model=SeriesRegistration)
 async def add_team_to_series(
     series_id: int,
@@ -1,3 +1,7 @@
-from .throw_forms import GameScoreSheetForm, SingleRoundThrowForm, TeamRoundThrowsForm
+from .throw_forms import (
+    GameScoreSheetForm, SingleRoundThrowForm, TeamRoundThrowsForm, score_sheet_form, score_sheet_form_class
+)
 
-__all__ = ['GameScoreSheetForm', 'SingleRoundThrowForm', 'TeamRoundThrowsForm']
\ No newline at end of file
+__all__ = [
+    'GameScoreSheetForm', 'SingleRoundThrowForm', 'TeamRoundThrowsForm', 'score_sheet_form', 'score_sheet_form_class'
+]
\ No newline at end of file
@@ -4,7 +4,8 @@ from flask_wtf import FlaskForm
 from wtforms.validators import DataRequired, ValidationError, NumberRange
 from app.utils.throw_input import ThrowInputField
 from app.utils.constants import GameScores
-import logging
+from functools import lru_cache
+from types import SimpleNamespace
 
 class SingleRoundThrowForm(FlaskForm):
     """Form for single_round_throws table"""
@@ -34,6 +35,17 @@ class SingleRoundThrowForm(FlaskForm):
         if not self.player_2_id.choices:
             self.player_2_id.choices = [('-1', '-- Select Player 2 --')]
 
+    def process(self, formdata=None, obj=None, data=None, extra_filters=None, **kwargs):
+        super().process(formdata, obj, data=data, extra_filters=extra_filters, **kwargs)
+        self.posted = formdata is not None and any(field.name in formdata for field in self)
+
+    def validate(self, *args, **kwargs):
+        # The score sheet posts flat set_N_round_M_* fields (see GameService),
+        # so a round is only validated when its nested fields were posted
+        if not self.posted:
+            return True
+        return super().validate(*args, **kwargs)
+
     def validate_player_1_id(self, field):
         if not field.data or field.data == '-1':
             raise ValidationError(_('Player 1 selection is required'))
@@ -47,59 +59,30 @@ class SingleRoundThrowForm(FlaskForm):
             raise ValidationError(_('Invalid player selection'))
 
 class TeamRoundThrowsForm(FlaskForm):
+    """Rounds of one team; the round_N fields are added by round_throws_form_class"""
     class Meta:
         csrf = False
 
     def __init__(self, *args, **kwargs):
-        self.logger = logging.getLogger(__name__)
+        # Accepted for backwards compatibility, the rounds come from the class
         self.game_type = kwargs.pop('game_type', None)
-        
-        # Initialize base form first
         super().__init__(*args, **kwargs)
 
-        if self.game_type:
-            self.logger.debug(f"Initializing TeamRoundThrowsForm with game_type: {self.game_type}")
-            
-            # Create round fields based on game type
-            for round_num in range(1, self.game_type.throw_round_amount + 1):
-                field_name = f'round_{round_num}'
-                
-                # Create the field
-                round_form = SingleRoundThrowForm()
-                field = FormField(SingleRoundThrowForm, default=round_form)
-                
-                # Add field to form
-                setattr(self, field_name, field)
-                field.bind(form=self, name=field_name)
-                self._fields[field_name] = field
-                
-                # Initialize field data
-                if field.form:
-                    field.form.game_set_index.data = 1
-                    field.form.throw_position.data = round_num
-                
-                self.logger.debug(f"Created and bound field {field_name}")
-
     def get_round(self, round_num):
         """Safe method to get round data"""
-        field_name = f'round_{round_num}'
-        if field_name in self._fields:
-            return self._fields[field_name]
-        self.logger.error(f"Field {field_name} not found in {list(self._fields.keys())}")
-        return None
-
-    def __iter__(self):
-        """Yield all form fields including dynamically added ones"""
-        for name, field in self._fields.items():
-            yield field
-
-    def __getattr__(self, name):
-        """Handle dynamic round field access"""
-        if name.startswith('round_'):
-            if name in self._fields:
-                return self._fields[name]
-            self.logger.error(f"Field {name} not found in {list(self._fields.keys())}")
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        return self._fields.get(f'round_{round_num}')
+
+@lru_cache(maxsize=None)
+def round_throws_form_class(throw_round_amount: int):
+    """TeamRoundThrowsForm subclass with round_1..round_N fields, built once per round count"""
+    fields = {
+        f'round_{round_num}': FormField(
+            SingleRoundThrowForm,
+            default=SimpleNamespace(game_set_index=1, throw_position=round_num)
+        )
+        for round_num in range(1, throw_round_amount + 1)
+    }
+    return type(f'TeamRoundThrowsForm{throw_round_amount}', (TeamRoundThrowsForm,), fields)
 
 class GameScoreSheetForm(Form):
     team_1_round_throws = FieldList(FormField(TeamRoundThrowsForm), min_entries=1, max_entries=1)
@@ -132,28 +115,27 @@ class GameScoreSheetForm(Form):
     def __init__(self, formdata=None, **kwargs):
         self.game_type = kwargs.pop('game_type', None)
         super().__init__(formdata, **kwargs)
-        
-        logger = logging.getLogger(__name__)
-        logger.debug(f"Initializing GameScoreSheetForm with game_type: {self.game_type}")
-
-        if not self.game_type:
-            logger.error("No game type provided!")
-            return
-
-        # Initialize team round forms with game type
-        for field_name in ['team_1_round_throws', 'team_2_round_throws']:
-            field = getattr(self, field_name)
-            logger.debug(f"Setting up {field_name}")
-            
-            if not field.entries:
-                # Pass game_type when creating new entries
-                field.append_entry({'game_type': self.game_type})
-                entry = field.entries[0]
-                entry.game_type = self.game_type
-                logger.debug(f"Created entry for {field_name} with game_type")
 
     def __contains__(self, key):
         """Allow checking if score fields exist"""
         if key.startswith('score_'):
             return key in self._fields
-        return super().__contains__(key)
\ No newline at end of file
+        return super().__contains__(key)
+
+@lru_cache(maxsize=None)
+def score_sheet_form_class(throw_round_amount: int):
+    """GameScoreSheetForm subclass whose team forms have the rounds of a game type.
+
+    WTForms collects the fields of a form class on its first instantiation,
+    so caching the class per round count leaves only field binding to each
+    request.
+    """
+    round_form = round_throws_form_class(throw_round_amount)
+    return type(f'GameScoreSheetForm{throw_round_amount}', (GameScoreSheetForm,), {
+        'team_1_round_throws': FieldList(FormField(round_form), min_entries=1, max_entries=1),
+        'team_2_round_throws': FieldList(FormField(round_form), min_entries=1, max_entries=1),
+    })
+
+def score_sheet_form(game_type, formdata=None, **kwargs) -> GameScoreSheetForm:
+    """Score sheet form for a game of ``game_type``"""
+    return score_sheet_form_class(game_type.throw_round_amount)(formdata, game_type=game_type, **kwargs)
@@ -7,10 +7,16 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 import traceback
+from database.config import sync_database_url, sync_engine_options
+from database.query_stats import init_flask as init_query_stats
+from app.metrics import init_flask as init_metrics
 load_dotenv()
 
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+# Same pool and timeout settings as the FastAPI engine, see database/config.py
+database_url = sync_database_url()
+app.config['SQLALCHEMY_DATABASE_URI'] = database_url.render_as_string(hide_password=False)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = sync_engine_options(database_url)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
 app.config.update(
     BABEL_DEFAULT_LOCALE='fi',
@@ -49,6 +55,18 @@ app.logger.addHandler(file_handler)
 app.logger.setLevel(logging.DEBUG)  # Set to debug level
 app.logger.info('Application startup')
 
+# Per-request query counts and slow statements, see database/query_stats.py
+sql_handler = RotatingFileHandler('logs/sql.log', maxBytes=1024 * 1024, backupCount=5)
+sql_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
+sql_logger = logging.getLogger('app.sql')
+sql_logger.addHandler(sql_handler)
+sql_logger.setLevel(logging.INFO)
+
+with app.app_context():
+    init_query_stats(app, db.engine)
+    # Prometheus metrics at /metrics, see app/metrics.py
+    init_metrics(app, db.engine)
+
 
 try:
     from app.models.models import User, Player, GameType, Series, SeriesRegistration, TeamHistory, Game, SingleThrow, SingleRoundThrow, RosterPlayersInSeries
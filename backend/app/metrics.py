@@ -0,0 +1,257 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Both the Flask admin and the FastAPI app serve ``/metrics`` from the same
+registry. Request latency is recorded per route, database pool usage and
+cache hit ratios are read when the endpoint is scraped.
+
+Metrics live in the process that records them, so with several Gunicorn
+workers every scrape sees one worker; scrape each worker, or run one worker
+during tournaments if exact totals are needed.
+
+The endpoints expose pool, cache and error internals, so they are only
+served when METRICS_TOKEN is set, and only to scrapers sending it as
+``Authorization: Bearer <token>``; without the setting they answer 404.
+
+This module must not import app.utils (see app/main.py import order).
+"""
+import hmac
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] += amount
+
+    def collect(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(dict(zip(self.labelnames, key)))} {_format_value(value)}')
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # labels -> [bucket counts..., sum, count]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            series = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def time(self, **labels):
+        """Context manager observing the duration of its block"""
+        return _Timer(self, labels)
+
+    def collect(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, series in sorted(self._values.items()):
+                labels = dict(zip(self.labelnames, key))
+                for bound, count in zip(self.buckets, series):
+                    bucket_labels = _format_labels({**labels, 'le': _format_value(bound)})
+                    lines.append(f'{self.name}_bucket{bucket_labels} {count}')
+                lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(series[-2])}')
+                lines.append(f'{self.name}_count{_format_labels(labels)} {series[-1]}')
+        return lines
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+class GaugeCollector:
+    """Gauge family whose samples are read from ``callback`` at scrape time.
+
+    The callback returns (labels, value) pairs.
+    """
+    def __init__(self, name: str, documentation: str, callback: Callable[[], Iterable[Tuple[dict, float]]],
+                 metric_type: str = 'gauge'):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.metric_type = metric_type
+
+    def collect(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.metric_type}']
+        for labels, value in self.callback():
+            lines.append(f'{self.name}{_format_labels(labels)} {_format_value(value)}')
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.register(Histogram(
+    'kyykka_http_request_duration_seconds', 'HTTP request latency by app and route',
+    ('app', 'method', 'route', 'status')
+))
+SCORE_SHEET_SAVE_DURATION = REGISTRY.register(Histogram(
+    'kyykka_score_sheet_save_duration_seconds', 'Time to save a game score sheet with its throws',
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+))
+
+SCORE_SHEET_SAVE_ERRORS = REGISTRY.register(Counter(
+    'kyykka_score_sheet_save_errors_total', 'Score sheet saves that failed and were rolled back'
+))
+
+# Engines are registered by the apps that create them
+_engines: Dict[str, object] = {}
+
+def register_engine(name: str, engine) -> None:
+    """Report the connection pool of ``engine`` (a sync Engine) under ``name``"""
+    _engines[name] = engine
+
+def _pool_samples():
+    for name, engine in _engines.items():
+        pool = engine.pool
+        for stat in ('size', 'checkedout', 'checkedin', 'overflow'):
+            method = getattr(pool, stat, None)
+            if callable(method):
+                yield {'engine': name, 'state': stat}, method()
+
+def _cache_samples(attribute: str):
+    # Imported at scrape time, app.utils imports the Flask app
+    from app.utils.cache import registered_caches
+    for name, cache in registered_caches().items():
+        yield {'cache': name}, getattr(cache, attribute)
+
+REGISTRY.register(GaugeCollector(
+    'kyykka_db_pool_connections', 'Database connections per pool state', _pool_samples
+))
+REGISTRY.register(GaugeCollector(
+    'kyykka_cache_hits_total', 'In-process cache hits', lambda: _cache_samples('hits'), 'counter'
+))
+REGISTRY.register(GaugeCollector(
+    'kyykka_cache_misses_total', 'In-process cache misses', lambda: _cache_samples('misses'), 'counter'
+))
+REGISTRY.register(GaugeCollector(
+    'kyykka_cache_entries', 'Entries currently held by in-process caches', lambda: _cache_samples('size')
+))
+
+def scrape_status(authorization: Optional[str]) -> int:
+    """HTTP status for a scrape: 200, 401 for a wrong token or 404 when METRICS_TOKEN is not set"""
+    token = os.getenv('METRICS_TOKEN')
+    if not token:
+        return 404
+    if not hmac.compare_digest((authorization or '').encode(), f'Bearer {token}'.encode()):
+        return 401
+    return 200
+
+def init_flask(app, engine) -> None:
+    """Time every Flask request per URL rule and serve /metrics"""
+    from flask import abort, g, request, Response
+
+    register_engine('flask', engine)
+
+    @app.before_request
+    def _start_request_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                app='flask', method=request.method, route=route, status=response.status_code
+            )
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        status = scrape_status(request.headers.get('Authorization'))
+        if status != 200:
+            abort(status)
+        return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+class MetricsMiddleware:
+    """ASGI middleware timing FastAPI requests per route template:
+    ``app.add_middleware(MetricsMiddleware)``
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {'code': 500}
+
+        async def send_with_status(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope
+            route = scope.get('route')
+            REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                app='api', method=scope['method'],
+                route=getattr(route, 'path', 'unmatched'), status=status['code']
+            )
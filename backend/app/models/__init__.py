@@ -13,6 +13,9 @@ from .models import (
     SingleThrow,
     SingleRoundThrow,
     RosterPlayersInSeries,
+    SeriesStanding,
+    ThrowFact,
+    GameDraft,
     Base
 )
 
@@ -28,6 +31,12 @@ from .schemas import (
     SeriesRegistrationCreate,  
     SeriesRegistration as SeriesRegistrationSchema,
     SeriesParticipant, 
+    SeriesStanding as SeriesStandingSchema,
+    ThrowStats,
+    ThrowIndexStats,
+    SeasonStats,
+    PlayerStats,
+    LeaderboardEntry,
     TeamHistoryCreate,
     TeamHistory as TeamHistorySchema,
     SingleThrowCreate,
@@ -35,7 +44,10 @@ from .schemas import (
     SingleRoundThrowCreate,
     SingleRoundThrow as SingleRoundThrowSchema,
     GameCreate,
+    GameTeam,
+    GameRound,
     Game as GameSchema,
+    GameDetail,
     UserBase,
     UserCreate,
     User as UserSchema
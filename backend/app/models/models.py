@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Enum, Text, TIMESTAMP, UniqueConstraint, CheckConstraint
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Enum, Text, TIMESTAMP, UniqueConstraint, CheckConstraint, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship, backref
 import enum
 from datetime import datetime, timezone
@@ -110,6 +111,11 @@ class Game(Base):
     team_2 = relationship("SeriesRegistration", foreign_keys=[team_2_id])
     throw_rounds = relationship("SingleRoundThrow", back_populates="game")
     
+    @property
+    def type_id(self):
+        """Game type of the game, defined by its series"""
+        return self.series.game_type_id if self.series else None
+
     @property
     def round_count(self): #Fixme - this should be calculated based on game type
         if self.series.game_type.team_player_amount == 2:
@@ -119,6 +125,21 @@ class Game(Base):
         else:
             return 5
 
+class SeriesStanding(Base):
+    """Materialized standings row of one registration in a series, kept up to date incrementally"""
+    __tablename__ = "series_standings"
+    series_id = Column(Integer, ForeignKey("series.id"), primary_key=True)
+    registration_id = Column(Integer, ForeignKey("series_registrations.id"), primary_key=True)
+    games_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
+    score_for = Column(Integer, nullable=False, default=0)
+    score_against = Column(Integer, nullable=False, default=0)
+
+    registration = relationship("SeriesRegistration")
+
 class SingleThrow(Base):
     __tablename__ = "single_throw"
     id = Column(Integer, primary_key=True, index=True)
@@ -142,10 +163,10 @@ class SingleRoundThrow(Base):
     throw_position = Column(Integer, nullable=False)  # 1 to throw_round_amount
     home_team = Column(Boolean, nullable=False)
     team_id = Column(Integer, ForeignKey("series_registrations.id"))
-    throw_1 = Column(Integer, ForeignKey("single_throw.id"))
-    throw_2 = Column(Integer, ForeignKey("single_throw.id"))
-    throw_3 = Column(Integer, ForeignKey("single_throw.id"))
-    throw_4 = Column(Integer, ForeignKey("single_throw.id"))
+    throw_1 = Column(Integer, ForeignKey("single_throw.id"), index=True)
+    throw_2 = Column(Integer, ForeignKey("single_throw.id"), index=True)
+    throw_3 = Column(Integer, ForeignKey("single_throw.id"), index=True)
+    throw_4 = Column(Integer, ForeignKey("single_throw.id"), index=True)
 
     game = relationship("Game", back_populates="throw_rounds")
     team = relationship("SeriesRegistration")
@@ -160,6 +181,38 @@ class SingleRoundThrow(Base):
         UniqueConstraint('game_id', 'game_set_index', 'throw_position', 'home_team', name='unique_round_throw')
     )
 
+class ThrowFact(Base):
+    """Denormalized copy of one throw with its game context, rebuilt by ThrowService on save"""
+    __tablename__ = "throw_facts"
+    throw_id = Column(Integer, ForeignKey("single_throw.id", ondelete="CASCADE"), primary_key=True)
+    game_id = Column(Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False)
+    series_id = Column(Integer, ForeignKey("series.id", ondelete="CASCADE"), nullable=False)
+    game_set_index = Column(Integer, nullable=False)
+    throw_round = Column(Integer, nullable=False)
+    round_throw_number = Column(Integer, nullable=False)  # 1 to 4, the throw_N column of the round
+    home_team = Column(Boolean, nullable=False)
+    team_id = Column(Integer, ForeignKey("series_registrations.id"))
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    throw_index = Column(Integer, nullable=False)
+    throw_type = Column(Enum(ThrowType), nullable=False)
+    throw_score = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_throw_facts_player_series', 'player_id', 'series_id'),
+        Index('ix_throw_facts_series_player', 'series_id', 'player_id'),
+        Index('ix_throw_facts_game', 'game_id'),
+    )
+
+class GameDraft(Base):
+    """Score sheet cells saved while a game is being entered, promoted to throws on final save"""
+    __tablename__ = "game_drafts"
+    game_id = Column(Integer, ForeignKey("games.id", ondelete="CASCADE"), primary_key=True)
+    # Field name -> [value, version of the patch that last wrote it]
+    cells = Column(JSON().with_variant(JSONB, 'postgresql'), nullable=False, default=dict)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
+
 class RosterPlayersInSeries(Base):
     __tablename__ = 'roster_players_in_series'
     registration_id = Column(Integer, ForeignKey('series_registrations.id'), primary_key=True)
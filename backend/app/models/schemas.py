@@ -1,7 +1,8 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator, model_validator
 from enum import Enum
-from typing import Optional, Literal
+from typing import Optional, Literal, List, Annotated
 from datetime import date, datetime
+from .score_limits import GameScores
 
 class ThrowInput(str, Enum):
     VALID = "valid"
@@ -94,12 +95,58 @@ class SeriesParticipant(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class SeriesStanding(BaseModel):
+    registration_id: int
+    team_name: Optional[str]
+    team_abbreviation: Optional[str]
+    lohko: Optional[str]
+    games_played: int
+    wins: int
+    draws: int
+    losses: int
+    points: int
+    score_for: int
+    score_against: int
+    score_difference: int
+
+    model_config = ConfigDict(from_attributes=True)
+
 class Team(BaseModel):
     id: Optional[int]
     name: str
 
     model_config = ConfigDict(from_attributes=True)
 
+class ThrowStats(BaseModel):
+    throw_count: int
+    total_score: int
+    average_score: Optional[float]
+    hauki_count: int
+    fault_count: int
+    zero_count: int
+    hauki_rate: Optional[float]
+    fault_rate: Optional[float]
+    zero_rate: Optional[float]
+
+class ThrowIndexStats(ThrowStats):
+    throw_index: int
+
+class SeasonStats(ThrowStats):
+    year: int
+    season_type: str
+    game_count: int
+
+class PlayerStats(ThrowStats):
+    player_id: int
+    player_name: str
+    by_throw_index: List[ThrowIndexStats] = []
+    by_season: List[SeasonStats] = []
+
+class LeaderboardEntry(ThrowStats):
+    rank: int
+    player_id: int
+    player_name: str
+
 class TeamHistoryCreate(BaseModel):
     previous_registration_id: int
     next_registration_id: int
@@ -180,15 +227,38 @@ class GameCreate(BaseModel):
             raise ValueError("team_1_id and team_2_id must be different")
         return self
 
+class GameTeam(BaseModel):
+    id: int
+    team_name: Optional[str] = None
+    team_abbreviation: Optional[str] = None
+    lohko: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class GameRound(BaseModel):
+    id: int
+    game_set_index: int
+    throw_position: int
+    home_team: bool
+    team_id: Optional[int] = None
+    throw_1: Optional[int] = None
+    throw_2: Optional[int] = None
+    throw_3: Optional[int] = None
+    throw_4: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
 class Game(BaseModel):
     id: Optional[int]
-    type_id: int
+    type_id: Optional[int] = None
     series_id: int
     round: Optional[str]
     is_playoff: Optional[bool]
     game_date: date
-    team_1: SeriesRegistration
-    team_2: SeriesRegistration
+    team_1_id: int
+    team_2_id: int
+    team_1: Optional[GameTeam] = None
+    team_2: Optional[GameTeam] = None
     score_1_1: int
     score_1_2: int
     score_2_1: int
@@ -196,6 +266,71 @@ class Game(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class GameDetail(Game):
+    throw_rounds: List[GameRound] = []
+
+class LiveThrowCreate(BaseModel):
+    game_set_index: int = Field(ge=1, le=2)
+    throw_round: int = Field(ge=1, le=5)
+    is_home_team: bool
+    round_throw_number: int = Field(ge=1, le=4)
+    player_id: int
+    value: str = Field(max_length=3, description="Throw score, H (hauki), F (fault) or E (unused)")
+
+class ThrowCorrection(BaseModel):
+    value: str = Field(max_length=3, description="Throw score, H (hauki), F (fault) or E (unused)")
+    player_id: Optional[int] = Field(None, description="Set when the throw was credited to the wrong player")
+
+class RoundTotal(BaseModel):
+    game_set_index: int
+    throw_round: int
+    is_home_team: bool
+    score: int
+    throw_count: int
+
+class SetTotal(BaseModel):
+    game_set_index: int
+    is_home_team: bool
+    score: int
+
+class GameTotals(BaseModel):
+    game_id: int
+    rounds: List[RoundTotal] = []
+    sets: List[SetTotal] = []
+
+class ScoreSheetRound(BaseModel):
+    players: List[int] = Field(min_length=2, max_length=2)
+    throws: List[str] = Field(min_length=4, max_length=4, description="Throw score, H (hauki), F (fault) or E (unused)")
+
+    @field_validator('throws')
+    @classmethod
+    def validate_throws(cls, throws):
+        for value in throws:
+            value = value.strip().upper()
+            if value in ('H', 'F', 'E'):
+                continue
+            try:
+                score = int(value)
+            except ValueError:
+                raise ValueError(f"Invalid throw value: {value}")
+            if not GameScores.validate_throw(score):
+                raise ValueError(
+                    f"Throw score must be between {GameScores.SINGLE_THROW_MIN} and "
+                    f"{GameScores.SINGLE_THROW_MAX}, got {score}"
+                )
+        return throws
+
+SetScore = Annotated[int, Field(ge=GameScores.ROUND_SCORE_MIN, le=GameScores.ROUND_SCORE_MAX)]
+TeamRounds = Annotated[List[Optional[ScoreSheetRound]], Field(min_length=2, max_length=2)]
+
+class ScoreSheet(BaseModel):
+    """Whole score sheet: ``scores[team][set]`` and ``sets[set][round][team]``.
+
+    Team 0 is the home team; rounds that are not entered yet are null.
+    """
+    scores: List[Annotated[List[SetScore], Field(min_length=2, max_length=2)]] = Field(min_length=2, max_length=2)
+    sets: List[Annotated[List[TeamRounds], Field(max_length=5)]] = Field(min_length=2, max_length=2)
+
 class UserBase(BaseModel):
     username: str
     email: EmailStr
@@ -1,7 +1,9 @@
 from .game_service import GameService
 from .series_service import SeriesService
+from .standings_service import StandingsService
 
 __all__ = [
     "GameService",
-    "SeriesService"
+    "SeriesService",
+    "StandingsService"
 ]
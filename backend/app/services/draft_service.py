@@ -0,0 +1,100 @@
+import re
+import logging
+from typing import Optional
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session
+from app.models.models import GameDraft
+from app.utils.db_utils import dialect_insert
+
+# Score sheet fields a draft may hold, named as in the score sheet form
+DRAFT_FIELD_PATTERN = re.compile(
+    r'^(set_[12]_round_[1-5]_team_[12]_(player|throw)_[1-4]|score_[12]_[12])$'
+)
+MAX_CELL_LENGTH = 16
+
+class DraftService:
+    """Server side score sheet drafts, patched one cell at a time.
+
+    Every patch bumps the draft version and stamps the cells it wrote with
+    it. A client sends the version it last saw; cells that another client
+    wrote after that version are merged cell by cell, the incoming value
+    wins and the overwritten cells are reported back as conflicts.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def get_draft(self, session: Session, game_id: int) -> Optional[dict]:
+        draft = session.get(GameDraft, game_id)
+        return self._as_dict(draft) if draft else None
+
+    def get_cells(self, session: Session, game_id: int) -> Optional[dict]:
+        """Field name -> value of a game's draft, or None without a draft"""
+        draft = session.get(GameDraft, game_id)
+        if draft is None:
+            return None
+        return {field: value for field, (value, _) in draft.cells.items()}
+
+    def patch_draft(self, session: Session, game_id: int, changes: dict, base_version: int = 0) -> dict:
+        """
+        Merge changed cells into a game's draft, creating the draft if needed.
+
+        Args:
+            session: Database session
+            game_id: Game ID
+            changes: Field name -> value of the cells edited since base_version
+            base_version: Draft version the client last loaded or saved
+
+        Returns:
+            dict: The merged draft, with ``conflicts`` listing the cells that
+                were changed by another client since base_version
+        """
+        for field, value in changes.items():
+            if not DRAFT_FIELD_PATTERN.match(field):
+                raise ValueError(f"Unknown score sheet field: {field}")
+            if value is not None and len(str(value)) > MAX_CELL_LENGTH:
+                raise ValueError(f"Value of {field} is too long")
+
+        # Concurrent first patches must not both insert the draft
+        session.execute(
+            dialect_insert(session, GameDraft.__table__)
+            .values(game_id=game_id, cells={}, version=0)
+            .on_conflict_do_nothing(index_elements=['game_id'])
+        )
+        draft = session.execute(
+            select(GameDraft).where(GameDraft.game_id == game_id)
+            .with_for_update().execution_options(populate_existing=True)
+        ).scalar_one()
+
+        version = draft.version + 1
+        cells = dict(draft.cells)
+        conflicts = []
+        for field, value in changes.items():
+            value = None if value is None else str(value)
+            stored = cells.get(field)
+            if stored and stored[1] > base_version and stored[0] != value:
+                conflicts.append({'field': field, 'value': stored[0]})
+            cells[field] = [value, version]
+
+        # Assign a new dict so the JSON column is marked as changed
+        draft.cells = cells
+        draft.version = version
+        session.flush()
+        self.logger.debug(f"Draft of game {game_id}: version {version}, {len(changes)} cells, {len(conflicts)} conflicts")
+
+        result = self._as_dict(draft)
+        result['conflicts'] = conflicts
+        return result
+
+    def delete_draft(self, session: Session, game_id: int) -> bool:
+        result = session.execute(
+            delete(GameDraft).where(GameDraft.game_id == game_id),
+            execution_options={'synchronize_session': False}
+        )
+        return result.rowcount > 0
+
+    def _as_dict(self, draft: GameDraft) -> dict:
+        return {
+            'game_id': draft.game_id,
+            'version': draft.version,
+            'cells': {field: value for field, (value, _) in draft.cells.items()},
+        }
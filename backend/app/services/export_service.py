@@ -0,0 +1,242 @@
+import csv
+import enum
+import io
+import logging
+from typing import Optional
+from sqlalchemy import select, union_all, literal, Integer, Boolean, Date, DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from ..models.models import Player, SingleThrow, SingleRoundThrow, Game, Series, SeriesRegistration
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip; the database cursor is server side, so only
+# one partition is held in memory at a time.
+EXPORT_BATCH_SIZE = 5000
+EXPORT_FORMATS = {'csv': 'text/csv', 'parquet': 'application/vnd.apache.parquet'}
+
+def _round_throws():
+    """Subquery with one row per throw referenced by a round"""
+    return union_all(*[
+        select(
+            SingleRoundThrow.game_id,
+            SingleRoundThrow.game_set_index,
+            SingleRoundThrow.throw_position,
+            SingleRoundThrow.home_team,
+            SingleRoundThrow.team_id,
+            literal(i).label('round_throw_number'),
+            getattr(SingleRoundThrow, f'throw_{i}').label('throw_id'),
+        )
+        for i in range(1, 5)
+    ]).subquery('round_throws')
+
+def throws_export_query(series_id: Optional[int] = None, year: Optional[int] = None):
+    """Select every throw with its round, game, series, team and player"""
+    round_throws = _round_throws()
+    query = select(
+        SingleThrow.id.label('throw_id'),
+        Game.id.label('game_id'),
+        Game.game_date,
+        Game.round,
+        Game.is_playoff,
+        Series.id.label('series_id'),
+        Series.name.label('series_name'),
+        Series.year,
+        Series.season_type,
+        round_throws.c.game_set_index,
+        round_throws.c.throw_position.label('throw_round'),
+        round_throws.c.round_throw_number,
+        round_throws.c.home_team,
+        round_throws.c.team_id,
+        SeriesRegistration.team_abbreviation,
+        SingleThrow.player_id,
+        Player.name.label('player_name'),
+        SingleThrow.throw_index,
+        SingleThrow.throw_type,
+        SingleThrow.throw_score,
+    ).select_from(SingleThrow).join(
+        round_throws, round_throws.c.throw_id == SingleThrow.id
+    ).join(
+        Game, Game.id == round_throws.c.game_id
+    ).join(
+        Series, Series.id == Game.series_id
+    ).join(
+        Player, Player.id == SingleThrow.player_id
+    ).outerjoin(
+        SeriesRegistration, SeriesRegistration.id == round_throws.c.team_id
+    )
+    return _filter_series(query, series_id, year).order_by(SingleThrow.id)
+
+def games_export_query(series_id: Optional[int] = None, year: Optional[int] = None):
+    """Select every game with its series and team names"""
+    team_1 = aliased(SeriesRegistration)
+    team_2 = aliased(SeriesRegistration)
+    query = select(
+        Game.id.label('game_id'),
+        Game.game_date,
+        Game.round,
+        Game.is_playoff,
+        Series.id.label('series_id'),
+        Series.name.label('series_name'),
+        Series.year,
+        Series.season_type,
+        Game.team_1_id,
+        team_1.team_abbreviation.label('team_1_abbreviation'),
+        Game.team_2_id,
+        team_2.team_abbreviation.label('team_2_abbreviation'),
+        Game.score_1_1,
+        Game.score_1_2,
+        Game.score_2_1,
+        Game.score_2_2,
+    ).join(
+        Series, Series.id == Game.series_id
+    ).outerjoin(
+        team_1, team_1.id == Game.team_1_id
+    ).outerjoin(
+        team_2, team_2.id == Game.team_2_id
+    )
+    return _filter_series(query, series_id, year).order_by(Game.id)
+
+EXPORT_QUERIES = {
+    'throws': throws_export_query,
+    'games': games_export_query,
+}
+
+def _filter_series(query, series_id, year):
+    if series_id is not None:
+        query = query.where(Series.id == series_id)
+    if year is not None:
+        query = query.where(Series.year == year)
+    return query
+
+def export_query(dataset: str, series_id: Optional[int] = None, year: Optional[int] = None):
+    """Build the export query of a dataset, streamed in EXPORT_BATCH_SIZE partitions"""
+    if dataset not in EXPORT_QUERIES:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+    return EXPORT_QUERIES[dataset](series_id, year).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+def _plain(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+def csv_chunk(rows, header=None) -> bytes:
+    """Encode rows (and optionally the header) as one CSV chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header is not None:
+        writer.writerow(header)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue().encode('utf-8')
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what has been written since the last take()"""
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def take(self) -> bytes:
+        data, self._chunks = b''.join(self._chunks), []
+        return data
+
+class ParquetChunkWriter:
+    """Write partitions as Parquet row groups and return the bytes produced so far.
+
+    pyarrow is imported here so the CSV export works without it.
+    """
+    def __init__(self, query):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet export needs the pyarrow package") from e
+        self._pa = pa
+        self._schema = pa.schema([
+            (column.name, _arrow_type(pa, column.type)) for column in query.selected_columns
+        ])
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema)
+
+    def write(self, rows) -> bytes:
+        columns = list(zip(*rows)) if rows else [() for _ in self._schema]
+        table = self._pa.Table.from_arrays(
+            [self._pa.array([_plain(v) for v in values], type=field.type) for values, field in zip(columns, self._schema)],
+            schema=self._schema
+        )
+        self._writer.write_table(table)
+        return self._sink.take()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.take()
+
+def _arrow_type(pa, column_type):
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp('us')
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+def _encoder(query, file_format: str):
+    """Return encode(rows, first) and finish() callables for a format"""
+    if file_format == 'csv':
+        header = [column.name for column in query.selected_columns]
+        return lambda rows, first: csv_chunk(rows, header if first else None), lambda: b''
+    if file_format == 'parquet':
+        writer = ParquetChunkWriter(query)
+        return lambda rows, first: writer.write(rows), writer.close
+    raise ValueError(f"Unsupported export format: {file_format}")
+
+async def stream_export(
+    db: AsyncSession,
+    dataset: str,
+    file_format: str = 'csv',
+    series_id: Optional[int] = None,
+    year: Optional[int] = None
+):
+    """Yield the export file in chunks, reading rows through a server side cursor"""
+    query = export_query(dataset, series_id, year)
+    encode, finish = _encoder(query, file_format)
+    result = await db.stream(query)
+    first = True
+    async for rows in result.partitions():
+        yield encode(rows, first)
+        first = False
+    if first:
+        yield encode([], True)
+    yield finish()
+
+def export_to_file(
+    session: Session,
+    dataset: str,
+    target,
+    file_format: str = 'csv',
+    series_id: Optional[int] = None,
+    year: Optional[int] = None
+) -> int:
+    """Write an export to a binary file object, returns the number of rows"""
+    query = export_query(dataset, series_id, year)
+    encode, finish = _encoder(query, file_format)
+    result = session.execute(query)
+    count = 0
+    for rows in result.partitions():
+        target.write(encode(rows, count == 0))
+        count += len(rows)
+    if count == 0:
+        target.write(encode([], True))
+    target.write(finish())
+    logger.info(f"Exported {count} {dataset} rows as {file_format}")
+    return count
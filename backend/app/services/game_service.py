@@ -1,13 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from flask import request
-from ..models.models import Game as GameModel, SingleRoundThrow
+from typing import List, Optional
+from ..models.models import Game as GameModel, SingleRoundThrow, SingleThrow, ThrowFact, Series as SeriesModel
+from ..models.schemas import GameCreate, LiveThrowCreate, ThrowCorrection, ScoreSheet
+from ..utils.pagination import keyset_page, cached_total_count, total_count_cache
+from ..utils.game_utils import build_throw_field_values, load_game_round_throws
 import logging
 from app.services.throw_service import ThrowService
+from app.services.standings_service import StandingsService
+from app.services.draft_service import DraftService
+from app.metrics import SCORE_SHEET_SAVE_DURATION, SCORE_SHEET_SAVE_ERRORS
+
+SCORE_FIELDS = ('score_1_1', 'score_1_2', 'score_2_1', 'score_2_2')
 
 class GameService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.throw_service = ThrowService()
+        self.standings_service = StandingsService()
+        self.draft_service = DraftService()
 
     def process_game_throws(self, game_id: int, form, session: Session):
         """Process and save throws for both teams"""
@@ -16,55 +29,127 @@ class GameService:
             raise ValueError("Game not found")
 
         self.logger.debug(f"Processing game throws for game {game_id}")
-        
-        try:
-            # Update game scores
-            game.score_1_1 = form.score_1_1.data
-            game.score_1_2 = form.score_1_2.data
-            game.score_2_1 = form.score_2_1.data
-            game.score_2_2 = form.score_2_2.data
-
-            # Get form data
-            form_data = request.form
-            
-            # Process throws for both sets
-            for set_index in [1, 2]:
-                for round_num in range(1, game.series.game_type.throw_round_amount + 1):
-                    for team_num, is_home_team in [(1, True), (2, False)]:
-                        team_id = game.team_1_id if is_home_team else game.team_2_id
-                        prefix = f"set_{set_index}_round_{round_num}_team_{team_num}"
-                        
-                        # Get player IDs
-                        player_1_id = form_data.get(f"{prefix}_player_1")
-                        player_2_id = form_data.get(f"{prefix}_player_2")
-                        
-                        # Get throws
-                        throws = [form_data.get(f"{prefix}_throw_{i}") for i in range(1, 5)]
-
-                        # Only save if we have all required data
-                        if all(throws) and player_1_id and player_2_id:
-                            self.logger.debug(f"Saving throws for {prefix}: p1={player_1_id}, p2={player_2_id}, throws={throws}")
-                            
-                            self.throw_service.save_round_throw(
-                                session=session,
-                                game_id=game.id,
-                                game_set_index=set_index,
-                                throw_round=round_num,
-                                is_home_team=is_home_team,
-                                team_id=team_id,
-                                player_1_id=player_1_id,
-                                player_2_id=player_2_id,
-                                throws=throws
-                            )
-
-            session.commit()
-            self.logger.debug("Successfully saved all throws and scores")
+        scores = {field: getattr(form, field).data for field in SCORE_FIELDS}
+        self._save_score_sheet(session, game, scores, self._form_round_entries(game, request.form))
+
+    def save_score_sheet(self, session: Session, game_id: int, sheet: ScoreSheet):
+        """
+        Save a score sheet posted as JSON.
+
+        ``sheet.sets[set][round][team]`` holds the round of the home (0) or
+        away (1) team, None for rounds that are not entered yet.
+        """
+        game = session.get(GameModel, game_id)
+        if not game:
+            raise ValueError("Game not found")
+        throw_round_amount = game.series.game_type.throw_round_amount
+
+        scores = {
+            f'score_{team}_{set_index}': sheet.scores[team - 1][set_index - 1]
+            for team in (1, 2) for set_index in (1, 2)
+        }
+        round_entries = []
+        for set_index, rounds in enumerate(sheet.sets, 1):
+            if len(rounds) > throw_round_amount:
+                raise ValueError(f"Set {set_index} has {len(rounds)} rounds, the game type has {throw_round_amount}")
+            for throw_round, teams in enumerate(rounds, 1):
+                for team_index, team_round in enumerate(teams):
+                    if team_round is None:
+                        continue
+                    is_home_team = team_index == 0
+                    round_entries.append({
+                        'game_set_index': set_index,
+                        'throw_round': throw_round,
+                        'is_home_team': is_home_team,
+                        'team_id': game.team_1_id if is_home_team else game.team_2_id,
+                        'player_1_id': team_round.players[0],
+                        'player_2_id': team_round.players[1],
+                        'throws': team_round.throws
+                    })
+
+        self.logger.debug(f"Saving JSON score sheet for game {game_id}")
+        self._save_score_sheet(session, game, scores, round_entries)
+
+    def promote_draft(self, session: Session, game_id: int) -> bool:
+        """
+        Save a game's server side draft as its final score sheet.
 
+        The draft holds only the cells edited on the sheet, so they are merged
+        on top of the stored throws and players; scores and cells missing
+        from the draft keep their stored values. Returns False when the game
+        has no draft.
+        """
+        game = session.get(GameModel, game_id)
+        if not game:
+            raise ValueError("Game not found")
+        cells = self.draft_service.get_cells(session, game_id)
+        if cells is None:
+            return False
+
+        scores = {
+            field: int(cells[field]) if cells.get(field) not in (None, '') else getattr(game, field)
+            for field in SCORE_FIELDS
+        }
+        self.logger.debug(f"Promoting draft of game {game_id} with {len(cells)} cells")
+        values = build_throw_field_values(load_game_round_throws(session, game_id))
+        values.update({field: value for field, value in cells.items() if value not in (None, '')})
+        self._save_score_sheet(session, game, scores, self._form_round_entries(game, values))
+        return True
+
+    def _save_score_sheet(self, session: Session, game: GameModel, scores: dict, round_entries: list):
+        """Save scores and throws in one transaction, removing the game's draft"""
+        try:
+            with SCORE_SHEET_SAVE_DURATION.time():
+                self.draft_service.delete_draft(session, game.id)
+                self._save_game_throws(session, game, scores, round_entries)
+                session.commit()
         except Exception as e:
+            SCORE_SHEET_SAVE_ERRORS.inc()
             session.rollback()
             self.logger.error(f"Error saving throws: {e}", exc_info=True)
             raise
 
+    def _save_game_throws(self, session: Session, game: GameModel, scores: dict, round_entries: list):
+        """Update the scores and standings of a game and save its throws in one batch"""
+        # Update game scores and the series standings they feed into
+        previous = self.standings_service.game_snapshot(game)
+        for field, value in scores.items():
+            setattr(game, field, value)
+        self.standings_service.apply_game_change(session, previous, self.standings_service.game_snapshot(game))
+
+        self.logger.debug(f"Saving {len(round_entries)} rounds for game {game.id}")
+        self.throw_service.save_game_throws(session, game.id, round_entries)
+        self.logger.debug("Successfully saved all throws and scores")
+
+    def _form_round_entries(self, game: GameModel, form_data) -> list:
+        """Collect the complete rounds of both sets from flat score sheet fields"""
+        round_entries = []
+        for set_index in [1, 2]:
+            for round_num in range(1, game.series.game_type.throw_round_amount + 1):
+                for team_num, is_home_team in [(1, True), (2, False)]:
+                    team_id = game.team_1_id if is_home_team else game.team_2_id
+                    prefix = f"set_{set_index}_round_{round_num}_team_{team_num}"
+                    
+                    # Get player IDs
+                    player_1_id = form_data.get(f"{prefix}_player_1")
+                    player_2_id = form_data.get(f"{prefix}_player_2")
+                    
+                    # Get throws
+                    throws = [form_data.get(f"{prefix}_throw_{i}") for i in range(1, 5)]
+
+                    # Only save if we have all required data
+                    if all(throws) and player_1_id and player_2_id:
+                        round_entries.append({
+                            'game_set_index': set_index,
+                            'throw_round': round_num,
+                            'is_home_team': is_home_team,
+                            'team_id': team_id,
+                            'player_1_id': player_1_id,
+                            'player_2_id': player_2_id,
+                            'throws': throws
+                        })
+        return round_entries
+
     def get_game(self, session: Session, game_id: int) -> GameModel:
         """Get a game by its ID"""
         return session.query(GameModel).get(game_id)
@@ -102,4 +187,149 @@ class GameService:
         """Calculate game score with multiplier."""
         if points_multiplier not in [1, 2]:
             raise ValueError("Points multiplier must be 1 (regular season) or 2 (playoffs)")
-        return team_score * points_multiplier
\ No newline at end of file
+        return team_score * points_multiplier
+
+# Async game service used by the FastAPI games router
+
+_standings_service = StandingsService()
+_throw_service = ThrowService()
+
+# Teams and series (for type_id) are needed to serialize any game
+GAME_LOAD_OPTIONS = (
+    selectinload(GameModel.team_1),
+    selectinload(GameModel.team_2),
+    selectinload(GameModel.series),
+)
+
+async def calculate_game_score(team_score: int, points_multiplier: int = 1) -> int:
+    """Calculate game score with multiplier."""
+    if points_multiplier not in [1, 2]:
+        raise ValueError("Points multiplier must be 1 (regular season) or 2 (playoffs)")
+    return team_score * points_multiplier
+
+async def create_game(db: AsyncSession, game: GameCreate) -> GameModel:
+    db_game = GameModel(**game.model_dump())
+    db.add(db_game)
+    await db.flush()
+    game_id = db_game.id
+    snapshot = _standings_service.game_snapshot(db_game)
+    await db.run_sync(lambda session: _standings_service.apply_game_change(session, None, snapshot))
+    await db.commit()
+    total_count_cache.invalidate('games')
+    return await get_game(db, game_id)
+
+async def get_game(db: AsyncSession, game_id: int) -> Optional[GameModel]:
+    """Get a game with its teams and throw rounds loaded"""
+    result = await db.execute(
+        select(GameModel)
+        .options(*GAME_LOAD_OPTIONS, selectinload(GameModel.throw_rounds))
+        .where(GameModel.id == game_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+def games_query(series_id: Optional[int] = None, year: Optional[int] = None):
+    query = select(GameModel)
+    if series_id is not None:
+        query = query.where(GameModel.series_id == series_id)
+    if year is not None:
+        query = query.join(SeriesModel, SeriesModel.id == GameModel.series_id).where(SeriesModel.year == year)
+    return query
+
+async def list_games(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    series_id: Optional[int] = None,
+    year: Optional[int] = None
+) -> List[GameModel]:
+    query = keyset_page(games_query(series_id, year), GameModel.id, limit, after).options(*GAME_LOAD_OPTIONS)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def count_games(db: AsyncSession, series_id: Optional[int] = None, year: Optional[int] = None) -> int:
+    return await cached_total_count(db, games_query(series_id, year), ('games', series_id, year))
+
+async def update_game(db: AsyncSession, game_id: int, game: GameCreate) -> Optional[GameModel]:
+    db_game = await db.get(GameModel, game_id)
+    if db_game is None:
+        return None
+    previous = _standings_service.game_snapshot(db_game)
+    for key, value in game.model_dump().items():
+        setattr(db_game, key, value)
+    current = _standings_service.game_snapshot(db_game)
+    await db.run_sync(lambda session: _standings_service.apply_game_change(session, previous, current))
+    if previous['series_id'] != current['series_id']:
+        await db.execute(
+            update(ThrowFact).where(ThrowFact.game_id == game_id).values(series_id=current['series_id'])
+        )
+    await db.commit()
+    total_count_cache.invalidate('games')
+    return await get_game(db, game_id)
+
+async def delete_game(db: AsyncSession, game_id: int) -> bool:
+    """Delete a game together with its throw rounds and their single throws"""
+    db_game = await db.get(GameModel, game_id)
+    if db_game is None:
+        return False
+    previous = _standings_service.game_snapshot(db_game)
+    await db.run_sync(lambda session: _standings_service.apply_game_change(session, previous, None))
+    round_throw_ids = (await db.execute(
+        select(SingleRoundThrow.throw_1, SingleRoundThrow.throw_2, SingleRoundThrow.throw_3, SingleRoundThrow.throw_4)
+        .where(SingleRoundThrow.game_id == game_id)
+    )).all()
+    throw_ids = [throw_id for row in round_throw_ids for throw_id in row if throw_id is not None]
+    await db.execute(delete(ThrowFact).where(ThrowFact.game_id == game_id))
+    await db.execute(delete(SingleRoundThrow).where(SingleRoundThrow.game_id == game_id))
+    if throw_ids:
+        await db.execute(delete(SingleThrow).where(SingleThrow.id.in_(throw_ids)))
+    await db.delete(db_game)
+    await db.commit()
+    total_count_cache.invalidate('games')
+    return True
+
+async def append_throw(db: AsyncSession, game_id: int, throw: LiveThrowCreate) -> Optional[dict]:
+    """Save one throw of a game in progress and return the game's round and set totals"""
+    db_game = await db.get(GameModel, game_id)
+    if db_game is None:
+        return None
+
+    def save(session):
+        _throw_service.append_throw(
+            session, db_game, throw.game_set_index, throw.throw_round, throw.is_home_team,
+            throw.round_throw_number, throw.player_id, throw.value
+        )
+        return _throw_service.game_totals(session, game_id)
+
+    totals = await db.run_sync(save)
+    await db.commit()
+    return totals
+
+async def correct_throw(
+    db: AsyncSession,
+    game_id: int,
+    game_set_index: int,
+    throw_round: int,
+    is_home_team: bool,
+    round_throw_number: int,
+    correction: ThrowCorrection
+) -> Optional[dict]:
+    """Update one stored throw in place and return the totals of its set, None if there is no such throw"""
+    def save(session):
+        changed = _throw_service.correct_throw(
+            session, game_id, game_set_index, throw_round, is_home_team,
+            round_throw_number, correction.value, correction.player_id
+        )
+        if changed is None:
+            return None
+        return _throw_service.game_totals(session, game_id, game_set_index)
+
+    totals = await db.run_sync(save)
+    if totals is not None:
+        await db.commit()
+    return totals
+
+async def get_game_totals(db: AsyncSession, game_id: int) -> Optional[dict]:
+    if await db.get(GameModel, game_id) is None:
+        return None
+    return await db.run_sync(lambda session: _throw_service.game_totals(session, game_id))
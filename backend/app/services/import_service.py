@@ -0,0 +1,305 @@
+import csv
+import json
+import logging
+from datetime import date
+from itertools import islice
+from sqlalchemy import insert, select, func
+from sqlalchemy.orm import Session, joinedload
+from app.models.models import Game, Series, SeriesRegistration, Player
+from app.services.throw_service import ThrowService
+from app.services.standings_service import StandingsService
+from app.utils.constants import GameScores
+from app.utils.game_utils import process_throw_data
+
+GAME_COLUMNS = ('series_id', 'game_date', 'round', 'is_playoff', 'team_1', 'team_2',
+                'score_1_1', 'score_1_2', 'score_2_1', 'score_2_2')
+SCORE_FIELDS = ('score_1_1', 'score_1_2', 'score_2_1', 'score_2_2')
+
+def read_csv_games(stream):
+    """Yield game records from a CSV score sheet export.
+
+    One row per round; the game columns are repeated on every row of the
+    game and rows without a ``set`` only define the game. Rows of a game
+    must be consecutive, so the file is read one game at a time.
+    """
+    current_key, current = None, None
+    for line, row in enumerate(csv.DictReader(stream), start=2):
+        row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+        key = tuple(row.get(column, '') for column in GAME_COLUMNS[:6])
+        if key != current_key:
+            if current:
+                yield current
+            current_key = key
+            current = {'line': line, **{column: row.get(column) for column in GAME_COLUMNS}, 'rounds': []}
+        if row.get('set'):
+            current['rounds'].append({
+                'set': row.get('set'),
+                'throw_round': row.get('throw_round'),
+                'team': row.get('team'),
+                'player_1': row.get('player_1'),
+                'player_2': row.get('player_2'),
+                'throws': [row.get(f'throw_{i}', '') for i in range(1, 5)],
+            })
+    if current:
+        yield current
+
+def read_json_games(stream):
+    """Yield game records from a JSON array or from JSON lines (one game per line).
+
+    JSON lines files are streamed; an array has to be parsed as a whole.
+    """
+    first = stream.read(1)
+    while first and first.isspace():
+        first = stream.read(1)
+    if first == '[':
+        records = json.loads(first + stream.read())
+        for index, record in enumerate(records, start=1):
+            yield {'line': index, **record}
+        return
+
+    pending = first
+    for line, text in enumerate(stream, start=1):
+        text = pending + text
+        pending = ''
+        if text.strip():
+            yield {'line': line, **json.loads(text)}
+    if pending.strip():
+        yield {'line': 1, **json.loads(pending)}
+
+class GameImportService:
+    """Import historical games and their throws in batches.
+
+    Team abbreviations (or names) and player names are resolved through
+    lookup maps that are filled with one query per batch, throws are
+    validated with the same rules as the score sheet form and every batch
+    is written with multi-row inserts and committed on its own. Records
+    with errors are reported and skipped, the rest of the file is imported.
+    """
+    def __init__(self, batch_size: int = 100):
+        self.logger = logging.getLogger(__name__)
+        self.batch_size = batch_size
+        self.throw_service = ThrowService()
+        self.standings_service = StandingsService()
+
+    def import_file(self, session: Session, stream, file_format: str) -> dict:
+        """Import a text stream in 'csv' or 'json' format"""
+        readers = {'csv': read_csv_games, 'json': read_json_games}
+        if file_format not in readers:
+            raise ValueError(f"Unsupported import format: {file_format}")
+        return self.import_records(session, readers[file_format](stream))
+
+    def import_records(self, session: Session, records) -> dict:
+        """Import an iterable of game records, returns a summary with per-record errors"""
+        summary = {'games': 0, 'rounds': 0, 'throws': 0, 'errors': []}
+        self._series, self._teams, self._players = {}, {}, {}
+        self._imported_keys = set()
+        records = iter(records)
+        imported_series = set()
+
+        while True:
+            batch = list(islice(records, self.batch_size))
+            if not batch:
+                break
+            try:
+                games, rounds, throws, series_ids, keys = self._import_batch(session, batch, summary['errors'])
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                self.logger.error(f"Error importing batch starting at line {batch[0].get('line')}: {e}", exc_info=True)
+                summary['errors'].append((batch[0].get('line'), f"Batch failed: {e}"))
+                continue
+            # Only committed games count as duplicates for the following batches
+            self._imported_keys |= keys
+            summary['games'] += games
+            summary['rounds'] += rounds
+            summary['throws'] += throws
+            imported_series |= series_ids
+
+        for series_id in imported_series:
+            self.standings_service.rebuild_series(session, series_id)
+        session.commit()
+
+        self.logger.info(
+            f"Imported {summary['games']} games, {summary['rounds']} rounds and "
+            f"{summary['throws']} throws with {len(summary['errors'])} errors"
+        )
+        return summary
+
+    def _import_batch(self, session: Session, batch: list, errors: list):
+        self._load_lookups(session, batch)
+        existing = self._existing_game_keys(session, batch)
+
+        game_rows, round_entries, keys = [], [], set()
+        for record in batch:
+            try:
+                game_row, entries = self._validate_record(record)
+            except ValueError as e:
+                errors.append((record.get('line'), str(e)))
+                continue
+            key = self._game_key(game_row)
+            if key in existing or key in self._imported_keys or key in keys:
+                errors.append((record.get('line'), "Game already exists"))
+                continue
+            keys.add(key)
+            game_rows.append(game_row)
+            round_entries.append(entries)
+
+        if not game_rows:
+            return 0, 0, 0, set(), keys
+
+        game_ids = session.execute(
+            insert(Game).returning(Game.id, sort_by_parameter_order=True), game_rows
+        ).scalars().all()
+        game_rounds = [
+            (game_id, entry)
+            for game_id, entries in zip(game_ids, round_entries)
+            for entry in entries
+        ]
+        throws = self.throw_service.insert_game_rounds(session, game_rounds)
+        return len(game_ids), len(game_rounds), throws, {row['series_id'] for row in game_rows}, keys
+
+    def _load_lookups(self, session: Session, batch: list) -> None:
+        """Fill the series, team and player maps with what this batch needs"""
+        series_ids = {_to_int(record.get('series_id')) for record in batch} - {None} - set(self._series)
+        if series_ids:
+            for series in session.query(Series).options(joinedload(Series.game_type)).filter(Series.id.in_(series_ids)):
+                game_type = series.game_type
+                self._series[series.id] = game_type.throw_round_amount if game_type else 4
+            for reg in session.query(SeriesRegistration).filter(SeriesRegistration.series_id.in_(series_ids)):
+                for label in (reg.team_abbreviation, reg.team_name):
+                    if label:
+                        self._teams[(reg.series_id, label.lower())] = reg.id
+
+        names = {
+            (round_entry.get(field) or '').strip().lower()
+            for record in batch for round_entry in record.get('rounds') or []
+            for field in ('player_1', 'player_2')
+        } - {''} - set(self._players)
+        if names:
+            rows = session.execute(
+                select(func.lower(Player.name), Player.id).where(func.lower(Player.name).in_(names))
+            ).all()
+            for name in names:
+                self._players[name] = None
+            for name, player_id in rows:
+                # Several players with the same name can't be resolved by name
+                self._players[name] = player_id if self._players[name] is None else False
+
+    def _existing_game_keys(self, session: Session, batch: list) -> set:
+        series_ids = {_to_int(record.get('series_id')) for record in batch} - {None}
+        dates = {_to_date(record.get('game_date')) for record in batch} - {None}
+        if not series_ids or not dates:
+            return set()
+        rows = session.execute(
+            select(Game.series_id, Game.game_date, Game.team_1_id, Game.team_2_id, Game.round)
+            .where(Game.series_id.in_(series_ids), Game.game_date.in_(dates))
+        ).all()
+        return {tuple(row) for row in rows}
+
+    def _validate_record(self, record: dict):
+        """Resolve and validate one game record, raise ValueError on the first problem"""
+        series_id = _to_int(record.get('series_id'))
+        if series_id not in self._series:
+            raise ValueError(f"Unknown series: {record.get('series_id')}")
+        game_date = _to_date(record.get('game_date'))
+        if game_date is None:
+            raise ValueError(f"Invalid game date: {record.get('game_date')}")
+
+        team_ids = []
+        for field in ('team_1', 'team_2'):
+            label = str(record.get(field) or '').strip()
+            team_id = self._teams.get((series_id, label.lower()))
+            if team_id is None:
+                raise ValueError(f"Unknown team in series {series_id}: {label}")
+            team_ids.append(team_id)
+        if team_ids[0] == team_ids[1]:
+            raise ValueError("team_1 and team_2 must be different")
+
+        game_row = {
+            'series_id': series_id,
+            'game_date': game_date,
+            'round': str(record['round']) if record.get('round') not in (None, '') else None,
+            'is_playoff': _to_bool(record.get('is_playoff')),
+            'team_1_id': team_ids[0],
+            'team_2_id': team_ids[1],
+        }
+        for field in SCORE_FIELDS:
+            score = _to_int(record.get(field))
+            if score is None or not GameScores.validate_round_score(score):
+                raise ValueError(f"Invalid {field}: {record.get(field)}")
+            game_row[field] = score
+
+        entries = []
+        seen_rounds = set()
+        throw_round_amount = self._series[series_id]
+        for round_data in record.get('rounds') or []:
+            entry = self._validate_round(round_data, team_ids, throw_round_amount)
+            round_key = (entry['game_set_index'], entry['throw_round'], entry['is_home_team'])
+            if round_key in seen_rounds:
+                raise ValueError(f"Duplicate round {round_key}")
+            seen_rounds.add(round_key)
+            entries.append(entry)
+        return game_row, entries
+
+    def _validate_round(self, round_data: dict, team_ids: list, throw_round_amount: int) -> dict:
+        game_set_index = _to_int(round_data.get('set'))
+        if game_set_index not in (1, 2):
+            raise ValueError(f"Invalid set: {round_data.get('set')}")
+        throw_round = _to_int(round_data.get('throw_round'))
+        if throw_round is None or not 1 <= throw_round <= throw_round_amount:
+            raise ValueError(f"Invalid throw round: {round_data.get('throw_round')}")
+        team = str(round_data.get('team') or '').strip()
+        if team not in ('1', '2'):
+            raise ValueError(f"Invalid team number: {team}")
+
+        player_ids = []
+        for field in ('player_1', 'player_2'):
+            name = str(round_data.get(field) or '').strip()
+            player_id = self._players.get(name.lower())
+            if player_id is False:
+                raise ValueError(f"Ambiguous player name: {name}")
+            if player_id is None:
+                raise ValueError(f"Unknown player: {name}")
+            player_ids.append(player_id)
+
+        throws = [str(value if value is not None else '') for value in (round_data.get('throws') or [])]
+        if len(throws) != 4:
+            raise ValueError("A round needs exactly 4 throws")
+        for value in throws:
+            # Empty throws are unused (E), as in the score sheet form
+            if process_throw_data(value or 'E')[0] is None:
+                raise ValueError(f"Invalid throw value: {value}")
+
+        return {
+            'game_set_index': game_set_index,
+            'throw_round': throw_round,
+            'is_home_team': team == '1',
+            'team_id': team_ids[0] if team == '1' else team_ids[1],
+            'player_1_id': player_ids[0],
+            'player_2_id': player_ids[1],
+            'throws': [value or 'E' for value in throws],
+        }
+
+    @staticmethod
+    def _game_key(game_row: dict) -> tuple:
+        return (game_row['series_id'], game_row['game_date'], game_row['team_1_id'],
+                game_row['team_2_id'], game_row['round'])
+
+def _to_int(value):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def _to_date(value):
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def _to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or '').strip().lower() in ('1', 'true', 'yes', 'kyllä', 'x')
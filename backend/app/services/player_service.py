@@ -1,23 +1,71 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import or_, case
+from typing import Optional
 from ..models.schemas import PlayerCreate
-from ..models.models import Player
+from ..models.models import Player, RosterPlayersInSeries, SeriesRegistration
+from ..utils.pagination import keyset_page, escape_like, cached_total_count, total_count_cache
 
 async def create_player(db: AsyncSession, player: PlayerCreate) -> Player:
     db_player = Player(**player.model_dump())
     db.add(db_player)
     await db.commit()
     await db.refresh(db_player)
+    total_count_cache.invalidate('players')
     return db_player
 
 async def get_player(db: AsyncSession, player_id: int) -> Player:
     result = await db.execute(select(Player).filter(Player.id == player_id))
     return result.scalars().first()
 
-async def list_players(db: AsyncSession) -> list[Player]:
-    result = await db.execute(select(Player))
+def players_query(name_prefix: Optional[str] = None, series_id: Optional[int] = None):
+    query = select(Player)
+    if name_prefix:
+        query = query.where(Player.name.ilike(f"{escape_like(name_prefix)}%", escape='\\'))
+    if series_id is not None:
+        query = query.where(Player.id.in_(
+            select(RosterPlayersInSeries.player_id)
+            .join(SeriesRegistration, SeriesRegistration.id == RosterPlayersInSeries.registration_id)
+            .where(SeriesRegistration.series_id == series_id)
+        ))
+    return query
+
+async def list_players(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    series_id: Optional[int] = None
+) -> list[Player]:
+    query = keyset_page(players_query(name_prefix, series_id), Player.id, limit, after)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+def player_search_query(term: str, limit: int = 10, offset: int = 0):
+    """Select players whose name or email contains ``term``.
+
+    Name prefix matches are listed first. The ILIKE '%term%' filters are
+    served by the pg_trgm GIN indexes on players.name and players.email.
+    """
+    pattern = f"%{escape_like(term)}%"
+    prefix = f"{escape_like(term)}%"
+    return select(Player).where(
+        or_(Player.name.ilike(pattern, escape='\\'), Player.email.ilike(pattern, escape='\\'))
+    ).order_by(
+        case((Player.name.ilike(prefix, escape='\\'), 0), else_=1),
+        Player.name,
+        Player.id
+    ).limit(limit).offset(offset)
+
+async def search_players(db: AsyncSession, term: str, limit: int = 10, offset: int = 0) -> list[Player]:
+    result = await db.execute(player_search_query(term, limit, offset))
     return result.scalars().all()
 
+async def count_players(db: AsyncSession, name_prefix: Optional[str] = None, series_id: Optional[int] = None) -> int:
+    return await cached_total_count(
+        db, players_query(name_prefix, series_id), ('players', name_prefix, series_id)
+    )
+
 async def update_player(db: AsyncSession, player_id: int, player: PlayerCreate) -> Player:
     result = await db.execute(select(Player).filter(Player.id == player_id))
     db_player = result.scalars().first()
@@ -26,6 +74,7 @@ async def update_player(db: AsyncSession, player_id: int, player: PlayerCreate)
             setattr(db_player, key, value)
         await db.commit()
         await db.refresh(db_player)
+        total_count_cache.invalidate('players')
     return db_player
 
 async def delete_player(db: AsyncSession, player_id: int) -> bool:
@@ -34,5 +83,6 @@ async def delete_player(db: AsyncSession, player_id: int) -> bool:
     if db_player:
         await db.delete(db_player)
         await db.commit()
+        total_count_cache.invalidate('players')
         return True
     return False
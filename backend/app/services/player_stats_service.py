@@ -0,0 +1,132 @@
+from sqlalchemy import select, func, cast, Numeric
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
+from ..models.models import Player, ThrowFact, Series, ThrowType
+
+# Columns a leaderboard can be ordered by, mapped to their sort direction
+LEADERBOARD_ORDER = {
+    'average_score': 'desc',
+    'total_score': 'desc',
+    'throw_count': 'desc',
+    'hauki_rate': 'asc',
+    'fault_rate': 'asc',
+    'zero_rate': 'asc',
+}
+
+def _throw_aggregates():
+    """Aggregate columns shared by all player statistics queries.
+
+    Everything is computed by the database in a single pass over
+    throw_facts, no throw rows are loaded into Python. throw_facts only
+    holds throws referenced by a round, so SingleThrow rows orphaned by
+    re-saves or deleted games are not counted.
+    """
+    throw_count = func.count(ThrowFact.throw_id)
+    hauki_count = func.count(ThrowFact.throw_id).filter(ThrowFact.throw_type == ThrowType.HAUKI)
+    fault_count = func.count(ThrowFact.throw_id).filter(ThrowFact.throw_type == ThrowType.FAULT)
+    zero_count = func.count(ThrowFact.throw_id).filter(
+        ThrowFact.throw_type == ThrowType.VALID, ThrowFact.throw_score == 0
+    )
+    return [
+        throw_count.label('throw_count'),
+        func.coalesce(func.sum(ThrowFact.throw_score), 0).label('total_score'),
+        func.round(func.avg(ThrowFact.throw_score), 2).label('average_score'),
+        hauki_count.label('hauki_count'),
+        fault_count.label('fault_count'),
+        zero_count.label('zero_count'),
+        func.round(cast(hauki_count * 1.0 / throw_count, Numeric), 4).label('hauki_rate'),
+        func.round(cast(fault_count * 1.0 / throw_count, Numeric), 4).label('fault_rate'),
+        func.round(cast(zero_count * 1.0 / throw_count, Numeric), 4).label('zero_rate'),
+    ]
+
+def player_totals_query(player_id: Optional[int] = None):
+    """Select overall throw statistics per player"""
+    query = select(
+        ThrowFact.player_id,
+        Player.name.label('player_name'),
+        *_throw_aggregates()
+    ).join(
+        Player, Player.id == ThrowFact.player_id
+    ).group_by(ThrowFact.player_id, Player.name)
+    if player_id is not None:
+        query = query.where(ThrowFact.player_id == player_id)
+    return query
+
+def throw_index_query(player_id: int):
+    """Select a player's statistics split by throw index within a set"""
+    return select(
+        ThrowFact.throw_index,
+        *_throw_aggregates()
+    ).where(
+        ThrowFact.player_id == player_id
+    ).group_by(ThrowFact.throw_index).order_by(ThrowFact.throw_index)
+
+def season_query(player_id: int):
+    """Select a player's statistics split by season (year and season type)"""
+    return select(
+        Series.year,
+        Series.season_type,
+        func.count(func.distinct(ThrowFact.game_id)).label('game_count'),
+        *_throw_aggregates()
+    ).join(
+        Series, Series.id == ThrowFact.series_id
+    ).where(
+        ThrowFact.player_id == player_id
+    ).group_by(Series.year, Series.season_type).order_by(Series.year.desc(), Series.season_type)
+
+def leaderboard_query(order_by: str = 'average_score', min_throws: int = 1, limit: int = 50, offset: int = 0):
+    """Select ranked player statistics for the leaderboard"""
+    if order_by not in LEADERBOARD_ORDER:
+        raise ValueError(f"Invalid leaderboard order: {order_by}")
+
+    totals = player_totals_query().having(func.count(ThrowFact.throw_id) >= min_throws).subquery('totals')
+    sort_column = totals.c[order_by]
+    sort = sort_column.desc() if LEADERBOARD_ORDER[order_by] == 'desc' else sort_column.asc()
+    return select(
+        func.rank().over(order_by=sort).label('rank'),
+        *[column for column in totals.c]
+    ).order_by(sort, totals.c.throw_count.desc(), totals.c.player_id).limit(limit).offset(offset)
+
+async def get_player_stats(db: AsyncSession, player_id: int) -> Optional[dict]:
+    """Get overall, per throw index and per season statistics of a player.
+
+    Returns None if the player does not exist.
+    """
+    player = await db.get(Player, player_id)
+    if player is None:
+        return None
+
+    totals = (await db.execute(player_totals_query(player_id))).first()
+    by_throw_index = (await db.execute(throw_index_query(player_id))).all()
+    by_season = (await db.execute(season_query(player_id))).all()
+    return {
+        **_empty_totals(player),
+        **(dict(totals._mapping) if totals else {}),
+        'by_throw_index': [dict(row._mapping) for row in by_throw_index],
+        'by_season': [dict(row._mapping) for row in by_season],
+    }
+
+async def get_leaderboard(
+    db: AsyncSession,
+    order_by: str = 'average_score',
+    min_throws: int = 1,
+    limit: int = 50,
+    offset: int = 0
+) -> List[dict]:
+    result = await db.execute(leaderboard_query(order_by, min_throws, limit, offset))
+    return [dict(row._mapping) for row in result.all()]
+
+def _empty_totals(player: Player) -> dict:
+    return {
+        'player_id': player.id,
+        'player_name': player.name,
+        'throw_count': 0,
+        'total_score': 0,
+        'average_score': None,
+        'hauki_count': 0,
+        'fault_count': 0,
+        'zero_count': 0,
+        'hauki_rate': None,
+        'fault_rate': None,
+        'zero_rate': None,
+    }
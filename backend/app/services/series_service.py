@@ -4,10 +4,11 @@ from app.models.models import RosterPlayersInSeries, Player, SeriesRegistration
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from app.models.models import Series as SeriesModel, SeriesRegistration as SeriesRegistrationModel
 from ..models.schemas import SeriesCreate, SeriesRegistration
+from ..utils.pagination import keyset_page, escape_like, cached_total_count, total_count_cache
 
 class SeriesService:
     def __init__(self):
@@ -103,6 +104,7 @@ async def create_series(db: AsyncSession, series: SeriesCreate) -> SeriesModel:
     try:
         await db.commit()
         await db.refresh(db_series)
+        total_count_cache.invalidate('series')
         return db_series
     except IntegrityError as e:
         await db.rollback()
@@ -112,10 +114,28 @@ async def get_series(db: AsyncSession, series_id: int) -> SeriesModel:
     result = await db.execute(select(SeriesModel).filter(SeriesModel.id == series_id))
     return result.scalar_one_or_none()
 
-async def list_series(db: AsyncSession) -> List[SeriesModel]:
-    result = await db.execute(select(SeriesModel))
+def series_query(year: Optional[int] = None, name_prefix: Optional[str] = None):
+    query = select(SeriesModel)
+    if year is not None:
+        query = query.where(SeriesModel.year == year)
+    if name_prefix:
+        query = query.where(SeriesModel.name.ilike(f"{escape_like(name_prefix)}%", escape='\\'))
+    return query
+
+async def list_series(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    year: Optional[int] = None,
+    name_prefix: Optional[str] = None
+) -> List[SeriesModel]:
+    query = keyset_page(series_query(year, name_prefix), SeriesModel.id, limit, after)
+    result = await db.execute(query)
     return result.scalars().all()
 
+async def count_series(db: AsyncSession, year: Optional[int] = None, name_prefix: Optional[str] = None) -> int:
+    return await cached_total_count(db, series_query(year, name_prefix), ('series', year, name_prefix))
+
 async def add_team_to_series(db: AsyncSession, series_id: int, team: SeriesRegistration) -> SeriesRegistrationModel:
     db_team = SeriesRegistrationModel(series_id=series_id, **team.model_dump())
     db.add(db_team)
@@ -131,6 +151,9 @@ async def update_series(db: AsyncSession, series_id: int, series: SeriesCreate)
         setattr(db_series, key, value)
     await db.commit()
     await db.refresh(db_series)
+    # Game counts filtered by year depend on the series as well
+    total_count_cache.invalidate('series')
+    total_count_cache.invalidate('games')
     return db_series
 
 async def delete_series(db: AsyncSession, series_id: int) -> bool:
@@ -139,4 +162,6 @@ async def delete_series(db: AsyncSession, series_id: int) -> bool:
         return False
     await db.delete(db_series)
     await db.commit()
+    total_count_cache.invalidate('series')
+    total_count_cache.invalidate('games')
     return True
@@ -0,0 +1,167 @@
+import logging
+from collections import defaultdict
+from sqlalchemy import select, delete, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Optional
+from app.models.models import Game, SeriesRegistration, SeriesStanding
+from app.utils.constants import StandingsPoints
+from app.utils.db_utils import dialect_insert
+
+SNAPSHOT_FIELDS = ('series_id', 'team_1_id', 'team_2_id', 'is_playoff',
+                   'score_1_1', 'score_1_2', 'score_2_1', 'score_2_2')
+COUNTER_COLUMNS = ('games_played', 'wins', 'draws', 'losses', 'points', 'score_for', 'score_against')
+
+class StandingsService:
+    """Keeps the series_standings table in sync with games.
+
+    Every change to a game is applied as a delta: the contribution of the
+    game's previous state is subtracted and the contribution of its new state
+    added, so standings never have to be recomputed from all games.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def game_snapshot(self, game: Game, committed: bool = False) -> Optional[dict]:
+        """Return the standings-relevant values of a game.
+
+        Args:
+            game: Game model instance
+            committed: Return the values currently stored in the database,
+                ignoring unflushed changes. Returns None for games that are
+                not in the database yet.
+        """
+        state = inspect(game)
+        if committed and state.key is None:
+            return None
+
+        if committed:
+            with state.session.no_autoflush:
+                values, unknown = {}, []
+                for field in SNAPSHOT_FIELDS:
+                    history = state.attrs[field].load_history()
+                    if history.deleted:
+                        values[field] = history.deleted[0]
+                    elif history.added:
+                        # Assigned while expired, the old value was never loaded
+                        unknown.append(field)
+                    else:
+                        values[field] = getattr(game, field)
+                if unknown:
+                    stored = state.session.execute(
+                        select(*[getattr(Game, field) for field in unknown]).where(Game.id == game.id)
+                    ).one()
+                    values.update(stored._mapping)
+        else:
+            values = {field: getattr(game, field) for field in SNAPSHOT_FIELDS}
+
+        return {
+            field: bool(value) if field == 'is_playoff' else (int(value) if value is not None else None)
+            for field, value in values.items()
+        }
+
+    def apply_game_change(self, session: Session, previous: Optional[dict], current: Optional[dict]) -> None:
+        """Apply the difference between two game snapshots to the standings.
+
+        Pass previous=None for a new game and current=None for a deleted game.
+        """
+        deltas = defaultdict(lambda: dict.fromkeys(COUNTER_COLUMNS, 0))
+        for snapshot, sign in ((previous, -1), (current, 1)):
+            if snapshot is None or snapshot['is_playoff']:
+                continue
+            for registration_id, counters in self._game_contributions(snapshot):
+                key = (snapshot['series_id'], registration_id)
+                for column, value in counters.items():
+                    deltas[key][column] += sign * value
+
+        rows = [
+            {'series_id': series_id, 'registration_id': registration_id, **counters}
+            for (series_id, registration_id), counters in deltas.items()
+            if any(counters.values())
+        ]
+        if not rows:
+            return
+
+        table = SeriesStanding.__table__
+        stmt = dialect_insert(session, table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['series_id', 'registration_id'],
+            set_={column: table.c[column] + stmt.excluded[column] for column in COUNTER_COLUMNS}
+        )
+        session.execute(stmt)
+        self.logger.debug(f"Applied standings deltas for {len(rows)} registrations")
+
+    def rebuild_series(self, session: Session, series_id: int) -> int:
+        """Recompute the standings of a series from all its games.
+
+        Only needed for backfilling; regular game edits go through
+        apply_game_change.
+        """
+        session.execute(delete(SeriesStanding).where(SeriesStanding.series_id == series_id))
+        games = session.execute(
+            select(Game).where(Game.series_id == series_id, Game.is_playoff.isnot(True))
+        ).scalars().all()
+        for game in games:
+            self.apply_game_change(session, None, self.game_snapshot(game))
+        return len(games)
+
+    def get_standings(self, session: Session, series_id: int) -> Dict[str, List[dict]]:
+        """Get standings of a series grouped by lohko"""
+        return group_standings(session.execute(standings_query(series_id)).all())
+
+    def _game_contributions(self, snapshot: dict):
+        """Yield (registration_id, counters) for both teams of a game"""
+        team_1_total = snapshot['score_1_1'] + snapshot['score_1_2']
+        team_2_total = snapshot['score_2_1'] + snapshot['score_2_2']
+        for registration_id, own, opponent in (
+            (snapshot['team_1_id'], team_1_total, team_2_total),
+            (snapshot['team_2_id'], team_2_total, team_1_total)
+        ):
+            won, drawn, lost = own > opponent, own == opponent, own < opponent
+            yield registration_id, {
+                'games_played': 1,
+                'wins': int(won),
+                'draws': int(drawn),
+                'losses': int(lost),
+                'points': StandingsPoints.WIN if won else StandingsPoints.DRAW if drawn else StandingsPoints.LOSS,
+                'score_for': own,
+                'score_against': opponent,
+            }
+
+def standings_query(series_id: int):
+    """Select standings rows of a series ordered for display"""
+    score_difference = (SeriesStanding.score_for - SeriesStanding.score_against).label('score_difference')
+    return select(
+        SeriesStanding.registration_id,
+        SeriesRegistration.team_name,
+        SeriesRegistration.team_abbreviation,
+        SeriesRegistration.lohko,
+        SeriesStanding.games_played,
+        SeriesStanding.wins,
+        SeriesStanding.draws,
+        SeriesStanding.losses,
+        SeriesStanding.points,
+        SeriesStanding.score_for,
+        SeriesStanding.score_against,
+        score_difference
+    ).join(
+        SeriesRegistration, SeriesRegistration.id == SeriesStanding.registration_id
+    ).where(
+        SeriesStanding.series_id == series_id
+    ).order_by(
+        SeriesRegistration.lohko,
+        SeriesStanding.points.desc(),
+        score_difference.desc(),
+        SeriesRegistration.team_name
+    )
+
+def group_standings(rows) -> Dict[str, List[dict]]:
+    """Group standings rows by lohko, keeping the query order"""
+    groups = {}
+    for row in rows:
+        groups.setdefault(row.lohko or '', []).append(dict(row._mapping))
+    return groups
+
+async def get_series_standings(db: AsyncSession, series_id: int) -> Dict[str, List[dict]]:
+    result = await db.execute(standings_query(series_id))
+    return group_standings(result.all())
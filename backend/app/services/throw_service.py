@@ -1,9 +1,63 @@
+from sqlalchemy import insert, select, update, delete, exists, union_all, literal, func
+from typing import Optional
 from sqlalchemy.orm import Session
-from app.models.models import ThrowType, SingleThrow, SingleRoundThrow
-from app.utils.game_utils import process_throw_data
+from app.models.models import ThrowType, SingleThrow, SingleRoundThrow, ThrowFact, Game
+from app.utils.game_utils import process_throw_data, load_game_round_throws
+from app.utils.db_utils import dialect_insert
 import logging
 from app.utils.throw_input import ThrowInputField
 
+THROW_FACT_COLUMNS = (
+    'throw_id', 'game_id', 'series_id', 'game_set_index', 'throw_round', 'round_throw_number',
+    'home_team', 'team_id', 'player_id', 'throw_index', 'throw_type', 'throw_score',
+)
+
+def throw_facts_query(game_ids: list, game_set_index: Optional[int] = None, throw_round: Optional[int] = None,
+                      is_home_team: Optional[bool] = None, round_throw_number: Optional[int] = None):
+    """Select the throw_facts rows of the given games from their rounds and throws.
+
+    The optional arguments narrow the selection down to one set, round,
+    team or throw_N column.
+    """
+    round_filter = [SingleRoundThrow.game_id.in_(game_ids)]
+    if game_set_index is not None:
+        round_filter.append(SingleRoundThrow.game_set_index == game_set_index)
+    if throw_round is not None:
+        round_filter.append(SingleRoundThrow.throw_position == throw_round)
+    if is_home_team is not None:
+        round_filter.append(SingleRoundThrow.home_team == is_home_team)
+    numbers = range(1, 5) if round_throw_number is None else [round_throw_number]
+    round_throws = union_all(*[
+        select(
+            SingleRoundThrow.game_id,
+            SingleRoundThrow.game_set_index,
+            SingleRoundThrow.throw_position,
+            SingleRoundThrow.home_team,
+            SingleRoundThrow.team_id,
+            literal(i).label('round_throw_number'),
+            getattr(SingleRoundThrow, f'throw_{i}').label('throw_id'),
+        ).where(*round_filter)
+        for i in numbers
+    ]).subquery('round_throws')
+    return select(
+        SingleThrow.id,
+        round_throws.c.game_id,
+        Game.series_id,
+        round_throws.c.game_set_index,
+        round_throws.c.throw_position,
+        round_throws.c.round_throw_number,
+        round_throws.c.home_team,
+        round_throws.c.team_id,
+        SingleThrow.player_id,
+        SingleThrow.throw_index,
+        SingleThrow.throw_type,
+        SingleThrow.throw_score,
+    ).join(
+        round_throws, round_throws.c.throw_id == SingleThrow.id
+    ).join(
+        Game, Game.id == round_throws.c.game_id
+    )
+
 class ThrowService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -45,7 +99,7 @@ class ThrowService:
             # Update round throw record with new throw IDs
             round_throw.throw_1, round_throw.throw_2, round_throw.throw_3, round_throw.throw_4 = throw_ids
             session.add(round_throw)
-            session.flush()
+            self.refresh_round_throw_facts(session, game_id, game_set_index, throw_round, is_home_team)
 
             return True
 
@@ -53,6 +107,400 @@ class ThrowService:
             self.logger.error(f"Error saving round throw: {e}", exc_info=True)
             raise
 
+    def append_throw(self, session: Session, game: Game, game_set_index: int, throw_round: int,
+                     is_home_team: bool, round_throw_number: int, player_id: int, value: str) -> bool:
+        """
+        Save one throw of a round while the game is being played.
+
+        The round row is created on its first throw; a throw already stored at
+        the same position is updated in place.
+
+        Args:
+            session: Database session
+            game: Game the throw belongs to
+            game_set_index: Set number (1 or 2)
+            throw_round: Round number within the set
+            is_home_team: Whether this is home team
+            round_throw_number: Position of the throw within the round (1-4)
+            player_id: ID of the throwing player
+            value: Throw value as entered on the score sheet
+
+        Returns:
+            bool: True if the stored throws changed
+        """
+        throw_type, throw_score = process_throw_data(str(value))
+        if throw_type is None:
+            raise ValueError(f"Invalid throw value: {value}")
+        row = {
+            'throw_type': ThrowType(throw_type),
+            'throw_score': throw_score,
+            'player_id': player_id,
+            'throw_index': (throw_round - 1) * 4 + round_throw_number,
+        }
+
+        team_id = game.team_1_id if is_home_team else game.team_2_id
+        round_throw = self._get_or_create_round_throw(
+            session, game.id, game_set_index, throw_round, is_home_team, team_id
+        )
+        single_throw = getattr(round_throw, f'throws_{round_throw_number}')
+        if single_throw is not None:
+            if not self._update_throw_if_changed(single_throw, row):
+                return False
+        else:
+            single_throw = SingleThrow(**row)
+            session.add(single_throw)
+            session.flush()
+            setattr(round_throw, f'throw_{round_throw_number}', single_throw.id)
+            session.add(round_throw)
+
+        self.refresh_round_throw_facts(
+            session, game.id, game_set_index, throw_round, is_home_team, round_throw_number
+        )
+        return True
+
+    def correct_throw(self, session: Session, game_id: int, game_set_index: int, throw_round: int,
+                      is_home_team: bool, round_throw_number: int, value: str,
+                      player_id: Optional[int] = None) -> Optional[bool]:
+        """
+        Correct one stored throw in place.
+
+        Only the SingleThrow row and its throw_facts row are updated, the rest
+        of the game is left untouched.
+
+        Returns:
+            bool: True if the throw changed, None if there is no such throw
+        """
+        throw_type, throw_score = process_throw_data(str(value))
+        if throw_type is None:
+            raise ValueError(f"Invalid throw value: {value}")
+
+        throw_column = getattr(SingleRoundThrow, f'throw_{round_throw_number}')
+        single_throw = session.execute(
+            select(SingleThrow).join(
+                SingleRoundThrow, throw_column == SingleThrow.id
+            ).where(
+                SingleRoundThrow.game_id == game_id,
+                SingleRoundThrow.game_set_index == game_set_index,
+                SingleRoundThrow.throw_position == throw_round,
+                SingleRoundThrow.home_team == is_home_team,
+            )
+        ).scalar_one_or_none()
+        if single_throw is None:
+            return None
+
+        row = {'throw_type': ThrowType(throw_type), 'throw_score': throw_score}
+        if player_id is not None:
+            row['player_id'] = player_id
+        if not self._update_throw_if_changed(single_throw, row):
+            return False
+
+        session.execute(
+            update(ThrowFact).where(ThrowFact.throw_id == single_throw.id).values(**row),
+            execution_options={'synchronize_session': False}
+        )
+        self.logger.debug(f"Corrected throw {single_throw.id} of game {game_id}")
+        return True
+
+    def game_totals(self, session: Session, game_id: int, game_set_index: Optional[int] = None) -> dict:
+        """
+        Sum the throw scores of a game per round and per set, from throw_facts.
+
+        With ``game_set_index`` only that set is summed.
+
+        Returns:
+            dict: ``rounds`` and ``sets`` lists, each item with game_set_index,
+                is_home_team and score, rounds also with throw_round and
+                throw_count
+        """
+        query = select(
+            ThrowFact.game_set_index,
+            ThrowFact.throw_round,
+            ThrowFact.home_team,
+            func.sum(ThrowFact.throw_score),
+            func.count(ThrowFact.throw_id),
+        ).where(
+            ThrowFact.game_id == game_id
+        ).group_by(
+            ThrowFact.game_set_index, ThrowFact.throw_round, ThrowFact.home_team
+        ).order_by(
+            ThrowFact.game_set_index, ThrowFact.throw_round, ThrowFact.home_team.desc()
+        )
+        if game_set_index is not None:
+            query = query.where(ThrowFact.game_set_index == game_set_index)
+        rows = session.execute(query).all()
+
+        rounds = []
+        sets = {}
+        for game_set_index, throw_round, home_team, score, throw_count in rows:
+            rounds.append({
+                'game_set_index': game_set_index,
+                'throw_round': throw_round,
+                'is_home_team': home_team,
+                'score': score,
+                'throw_count': throw_count,
+            })
+            key = (game_set_index, home_team)
+            sets[key] = sets.get(key, 0) + score
+
+        return {
+            'game_id': game_id,
+            'rounds': rounds,
+            'sets': [
+                {'game_set_index': game_set_index, 'is_home_team': home_team, 'score': score}
+                for (game_set_index, home_team), score in sets.items()
+            ],
+        }
+
+    def save_game_throws(self, session: Session, game_id: int, round_entries: list) -> int:
+        """
+        Save every round of a score sheet in one batch.
+
+        Rounds that already exist are diffed against the stored throws and only
+        the throws whose value changed are updated in place, so re-saving a sheet
+        does not leave orphaned SingleThrow rows behind. Throws missing from a
+        partially stored round (see append_throw) are inserted and linked to the
+        existing round row. Throws of new rounds are written with a single
+        multi-row INSERT ... RETURNING and their round rows with a single upsert
+        on ``unique_round_throw``.
+
+        Args:
+            session: Database session
+            game_id: Game ID
+            round_entries: List of dicts with keys game_set_index, throw_round,
+                is_home_team, team_id, player_1_id, player_2_id and throws
+                (list of 4 throw values)
+
+        Returns:
+            int: Number of SingleThrow rows inserted or updated
+        """
+        if not round_entries:
+            return 0
+
+        try:
+            existing_rounds = {
+                (round_throw.game_set_index, round_throw.throw_position, round_throw.home_team): round_throw
+                for round_throw in load_game_round_throws(session, game_id)
+            }
+
+            new_rounds = []
+            missing_throws = []
+            updated_count = 0
+            team_changed = False
+            for entry in round_entries:
+                throw_rows = self._build_round_throw_rows(entry)
+                round_throw = existing_rounds.get(
+                    (entry['game_set_index'], entry['throw_round'], entry['is_home_team'])
+                )
+                if round_throw is None:
+                    new_rounds.append((game_id, entry, throw_rows))
+                    continue
+
+                if round_throw.team_id != entry['team_id']:
+                    round_throw.team_id = entry['team_id']
+                    team_changed = True
+                existing_throws = [
+                    round_throw.throws_1, round_throw.throws_2,
+                    round_throw.throws_3, round_throw.throws_4
+                ]
+                for round_throw_number, (single_throw, row) in enumerate(zip(existing_throws, throw_rows), 1):
+                    if single_throw is None:
+                        missing_throws.append((round_throw, round_throw_number, row))
+                    elif self._update_throw_if_changed(single_throw, row):
+                        updated_count += 1
+
+            inserted_count = self._insert_missing_throws(session, missing_throws)
+            inserted_count += self._insert_new_rounds(session, new_rounds)
+            if inserted_count or updated_count or team_changed:
+                self.refresh_throw_facts(session, [game_id])
+
+            self.logger.debug(f"Game {game_id}: inserted {inserted_count} and updated {updated_count} throws")
+            return inserted_count + updated_count
+
+        except Exception as e:
+            self.logger.error(f"Error saving game throws: {e}", exc_info=True)
+            raise
+
+    def insert_game_rounds(self, session: Session, game_rounds: list) -> int:
+        """
+        Insert the rounds of any number of games that have no stored rounds yet.
+
+        Used by bulk imports: all throws go into one multi-row INSERT and all
+        round rows into one upsert, instead of a round trip per game.
+
+        Args:
+            session: Database session
+            game_rounds: List of (game_id, round_entry) tuples, round entries
+                as in save_game_throws
+
+        Returns:
+            int: Number of SingleThrow rows inserted
+        """
+        new_rounds = [
+            (game_id, entry, self._build_round_throw_rows(entry))
+            for game_id, entry in game_rounds
+        ]
+        inserted_count = self._insert_new_rounds(session, new_rounds)
+        self.refresh_throw_facts(session, {game_id for game_id, _ in game_rounds})
+        return inserted_count
+
+    def refresh_throw_facts(self, session: Session, game_ids) -> None:
+        """
+        Rebuild the throw_facts rows of the given games.
+
+        The rows are replaced with one DELETE and one INSERT ... SELECT, so the
+        four throw_N joins are paid once on save instead of by every
+        analytics query.
+        """
+        game_ids = list(game_ids)
+        if not game_ids:
+            return
+        session.flush()
+        session.execute(
+            delete(ThrowFact).where(ThrowFact.game_id.in_(game_ids)),
+            execution_options={'synchronize_session': False}
+        )
+        session.execute(
+            insert(ThrowFact).from_select(THROW_FACT_COLUMNS, throw_facts_query(game_ids))
+        )
+
+    def refresh_round_throw_facts(self, session: Session, game_id: int, game_set_index: int, throw_round: int,
+                                  is_home_team: bool, round_throw_number: Optional[int] = None) -> None:
+        """
+        Rebuild the throw_facts rows of one round, or of one throw of it.
+
+        Used for single round and single throw saves, so a live game does
+        not rebuild the facts of the whole game on every throw.
+        """
+        session.flush()
+        fact_filter = [
+            ThrowFact.game_id == game_id,
+            ThrowFact.game_set_index == game_set_index,
+            ThrowFact.throw_round == throw_round,
+            ThrowFact.home_team == is_home_team,
+        ]
+        if round_throw_number is not None:
+            fact_filter.append(ThrowFact.round_throw_number == round_throw_number)
+        session.execute(
+            delete(ThrowFact).where(*fact_filter),
+            execution_options={'synchronize_session': False}
+        )
+        session.execute(
+            insert(ThrowFact).from_select(THROW_FACT_COLUMNS, throw_facts_query(
+                [game_id], game_set_index, throw_round, is_home_team, round_throw_number
+            ))
+        )
+
+    def _insert_missing_throws(self, session: Session, missing_throws: list) -> int:
+        """Insert the missing throws of stored rounds in one statement and link them to their rounds"""
+        if not missing_throws:
+            return 0
+
+        result = session.execute(
+            insert(SingleThrow).returning(SingleThrow.id, sort_by_parameter_order=True),
+            [row for _, _, row in missing_throws]
+        )
+        for (round_throw, round_throw_number, _), throw_id in zip(missing_throws, result.scalars().all()):
+            setattr(round_throw, f'throw_{round_throw_number}', throw_id)
+        return len(missing_throws)
+
+    def _insert_new_rounds(self, session: Session, new_rounds: list) -> int:
+        """Insert throws of new rounds in one statement and upsert their round rows"""
+        if not new_rounds:
+            return 0
+
+        result = session.execute(
+            insert(SingleThrow).returning(SingleThrow.id, sort_by_parameter_order=True),
+            [row for _, _, throw_rows in new_rounds for row in throw_rows]
+        )
+        throw_ids = result.scalars().all()
+
+        round_rows = []
+        for i, (game_id, entry, _) in enumerate(new_rounds):
+            ids = throw_ids[i * 4:i * 4 + 4]
+            round_rows.append({
+                'game_id': game_id,
+                'game_set_index': entry['game_set_index'],
+                'throw_position': entry['throw_round'],
+                'home_team': entry['is_home_team'],
+                'team_id': entry['team_id'],
+                'throw_1': ids[0],
+                'throw_2': ids[1],
+                'throw_3': ids[2],
+                'throw_4': ids[3],
+            })
+
+        stmt = dialect_insert(session, SingleRoundThrow.__table__).values(round_rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['game_id', 'game_set_index', 'throw_position', 'home_team'],
+            set_={
+                column: stmt.excluded[column]
+                for column in ('team_id', 'throw_1', 'throw_2', 'throw_3', 'throw_4')
+            }
+        )
+        session.execute(stmt)
+        return len(throw_ids)
+
+    def _update_throw_if_changed(self, single_throw: SingleThrow, row: dict) -> bool:
+        """Apply row values to an existing throw, return True if anything changed"""
+        changed = False
+        for key, value in row.items():
+            if getattr(single_throw, key) != value:
+                setattr(single_throw, key, value)
+                changed = True
+        return changed
+
+    def delete_orphan_throws(self, session: Session, batch_size: int = 1000) -> int:
+        """
+        Delete SingleThrow rows no longer referenced by any round, in batches.
+
+        Each batch is committed separately so the job can run against a live
+        database without holding long locks.
+
+        Returns:
+            int: Total number of deleted throws
+        """
+        orphan_filter = [
+            ~exists().where(column == SingleThrow.id)
+            for column in (SingleRoundThrow.throw_1, SingleRoundThrow.throw_2,
+                           SingleRoundThrow.throw_3, SingleRoundThrow.throw_4)
+        ]
+        total_deleted = 0
+        while True:
+            orphan_ids = session.execute(
+                select(SingleThrow.id).where(*orphan_filter).order_by(SingleThrow.id).limit(batch_size)
+            ).scalars().all()
+            if not orphan_ids:
+                break
+
+            session.execute(
+                delete(SingleThrow).where(SingleThrow.id.in_(orphan_ids)),
+                execution_options={'synchronize_session': False}
+            )
+            session.commit()
+            total_deleted += len(orphan_ids)
+            self.logger.info(f"Deleted {len(orphan_ids)} orphan throws ({total_deleted} total)")
+
+        return total_deleted
+
+    def _build_round_throw_rows(self, entry: dict) -> list:
+        """Build the 4 SingleThrow insert rows of one round, in throw_1..throw_4 order"""
+        rows = []
+        for i, (player_id, throws_pair) in enumerate([
+            (int(entry['player_1_id']), entry['throws'][0:2]),
+            (int(entry['player_2_id']), entry['throws'][2:4])
+        ]):
+            for j, throw in enumerate(throws_pair):
+                throw_type, throw_score = process_throw_data(str(throw))
+                if throw_type is None:
+                    raise ValueError(f"Invalid throw value: {throw}")
+                rows.append({
+                    'throw_type': ThrowType(throw_type),
+                    'throw_score': throw_score,
+                    'player_id': player_id,
+                    'throw_index': entry['throw_round'] * 4 - (3 - (i * 2 + j)),
+                })
+        return rows
+
     def _get_or_create_round_throw(self, session: Session, game_id: int, game_set_index: int,
                                  throw_round: int, is_home_team: bool, team_id: int) -> SingleRoundThrow:
         """Get existing round throw record or create new one"""
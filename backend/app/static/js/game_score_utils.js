@@ -1,7 +1,19 @@
 let GAME_SCORES;
-
-function initializeGameScores(constants) {
+let DRAFT_URL = null;
+let SCORE_SHEET_URL = null;
+let draftVersion = 0;
+let pendingDraftCells = {};
+let draftSaveTimer = null;
+const DRAFT_SAVE_DELAY_MS = 800;
+
+function initializeGameScores(constants, draftUrl = null, scoreSheetUrl = null) {
     GAME_SCORES = constants;
+    DRAFT_URL = draftUrl;
+    SCORE_SHEET_URL = scoreSheetUrl;
+    if (DRAFT_URL) {
+        // Send each edited cell to the server side draft
+        document.addEventListener('change', queueDraftCell);
+    }
     // Make all necessary functions available globally
     window.showTab = showTab;
     window.validateAndCalculateTotalScores = validateAndCalculateTotalScores;
@@ -10,6 +22,7 @@ function initializeGameScores(constants) {
     window.saveDraft = saveDraft;
     window.loadDraft = loadDraft;
     window.clearDraft = clearDraft;
+    window.promoteDraft = promoteDraft;
 }
 
 function validateAndCalculateTotalScores(input) {
@@ -175,35 +188,102 @@ function autoFillPlayers() {
 }
 
 // Draft management functions
-function saveDraft(draftKey) {
-    const form = document.querySelector('form');
-    const formData = new FormData(form);
-    const draftData = Object.fromEntries(formData.entries());
-    localStorage.setItem(draftKey, JSON.stringify(draftData));
-    showToast('Draft saved successfully');
+// Drafts are stored on the server one cell at a time, see DraftService
+function queueDraftCell(event) {
+    const input = event.target;
+    if (!input.name || !input.form || !/^(set_|score_)/.test(input.name)) {
+        return;
+    }
+    pendingDraftCells[input.name] = input.value;
+    clearTimeout(draftSaveTimer);
+    draftSaveTimer = setTimeout(() => saveDraft(true), DRAFT_SAVE_DELAY_MS);
 }
 
-function loadDraft(draftKey) {
-    const draftData = localStorage.getItem(draftKey);
-    if (!draftData) {
-        showToast('No draft found');
-        return;
+async function draftRequest(method, body = null, url = DRAFT_URL) {
+    const response = await fetch(url, {
+        method,
+        headers: body ? { 'Content-Type': 'application/json' } : {},
+        body: body ? JSON.stringify(body) : null
+    });
+    const data = await response.json();
+    if (!response.ok) {
+        throw new Error(data.error || response.statusText);
     }
+    return data;
+}
 
-    const data = JSON.parse(draftData);
+function fillDraftCells(cells) {
     const form = document.querySelector('form');
-    Object.entries(data).forEach(([key, value]) => {
-        const input = form.querySelector(`[name="${key}"]`);
-        if (input) input.value = value;
+    Object.entries(cells).forEach(([key, value]) => {
+        form.querySelectorAll(`[name="${key}"]`).forEach(input => {
+            input.value = value ?? '';
+        });
     });
-    
-    showToast('Draft loaded successfully');
 }
 
-function clearDraft(draftKey) {
+async function saveDraft(quiet = false) {
+    clearTimeout(draftSaveTimer);
+    const cells = pendingDraftCells;
+    if (Object.keys(cells).length === 0) {
+        if (!quiet) showToast('Draft saved successfully');
+        return;
+    }
+    pendingDraftCells = {};
+    try {
+        const draft = await draftRequest('PATCH', { base_version: draftVersion, cells });
+        draftVersion = draft.version;
+        if (draft.conflicts.length > 0) {
+            // Another device edited these cells too, show the merged draft
+            fillDraftCells(draft.cells);
+            showToast(`Draft merged with changes from another device (${draft.conflicts.length} cells)`);
+        } else if (!quiet) {
+            showToast('Draft saved successfully');
+        }
+    } catch (error) {
+        // Keep the cells for the next attempt
+        pendingDraftCells = { ...cells, ...pendingDraftCells };
+        showToast(`Draft not saved: ${error.message}`);
+    }
+}
+
+async function loadDraft() {
+    try {
+        const draft = await draftRequest('GET');
+        if (Object.keys(draft.cells).length === 0) {
+            showToast('No draft found');
+            return;
+        }
+        draftVersion = draft.version;
+        fillDraftCells(draft.cells);
+        showToast('Draft loaded successfully');
+    } catch (error) {
+        showToast(`Draft not loaded: ${error.message}`);
+    }
+}
+
+async function clearDraft() {
     if (confirm('Are you sure you want to clear the draft?')) {
-        localStorage.removeItem(draftKey);
-        showToast('Draft cleared');
+        try {
+            await draftRequest('DELETE');
+            pendingDraftCells = {};
+            draftVersion = 0;
+            showToast('Draft cleared');
+        } catch (error) {
+            showToast(`Draft not cleared: ${error.message}`);
+        }
+    }
+}
+
+async function promoteDraft() {
+    await saveDraft(true);
+    if (Object.keys(pendingDraftCells).length > 0) {
+        return;
+    }
+    try {
+        const result = await draftRequest('POST', null, `${DRAFT_URL}/promote`);
+        window.location.href = result.redirect;
+    } catch (error) {
+        showToast(`Throws not saved: ${error.message}`);
     }
 }
 
@@ -277,10 +357,58 @@ function handleFormSubmit(event) {
     const activeForm = document.querySelector('.mobile-form').style.display === 'none' 
         ? '.desktop-form' 
         : '.mobile-form';
+    if (activeForm === '.mobile-form' && SCORE_SHEET_URL) {
+        // The mobile form posts the sheet as compact JSON instead of form fields
+        event.preventDefault();
+        submitScoreSheet(document.querySelector('.mobile-form'));
+        return;
+    }
     const inactiveForm = activeForm === '.desktop-form' ? '.mobile-form' : '.desktop-form';
     syncFormData(activeForm, inactiveForm);
 }
 
+// Score sheet as JSON: scores[team][set] and sets[set][round][team], see ScoreSheet
+function buildScoreSheet(container) {
+    const value = name => container.querySelector(`[name="${name}"]`)?.value.trim() ?? '';
+    const sets = [1, 2].map(set => {
+        const rounds = [];
+        for (let round = 1; container.querySelector(`[name="set_${set}_round_${round}_team_1_throw_1"]`); round++) {
+            rounds.push([1, 2].map(team => {
+                const prefix = `set_${set}_round_${round}_team_${team}`;
+                const players = [value(`${prefix}_player_1`), value(`${prefix}_player_2`)];
+                const throws = [1, 2, 3, 4].map(i => value(`${prefix}_throw_${i}`).toUpperCase());
+                // Incomplete rounds are not saved, as with the form post
+                if (players.some(player => !player || player === '-1') || throws.some(throwValue => !throwValue)) {
+                    return null;
+                }
+                return { players: players.map(Number), throws };
+            }));
+        }
+        return rounds;
+    });
+    const scores = [1, 2].map(team => [1, 2].map(set => parseInt(value(`score_${team}_${set}`), 10)));
+    return { scores, sets };
+}
+
+async function submitScoreSheet(container) {
+    try {
+        const response = await fetch(SCORE_SHEET_URL, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(buildScoreSheet(container))
+        });
+        const result = await response.json();
+        if (!response.ok) {
+            const details = (result.details || []).map(detail => `${detail.loc.join('.')}: ${detail.msg}`);
+            showToast([result.error, ...details].join('\n'));
+            return;
+        }
+        window.location.href = result.redirect;
+    } catch (error) {
+        showToast(`Throws not saved: ${error.message}`);
+    }
+}
+
 function initializeFormVisibility(activeView) {
     const desktopForm = document.querySelector('.desktop-form');
     const mobileForm = document.querySelector('.mobile-form');
@@ -363,6 +491,7 @@ export {
     saveDraft,
     loadDraft,
     clearDraft,
+    promoteDraft,
     showTab,
     displayFormErrors,
     clearFormErrors,
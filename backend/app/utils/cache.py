@@ -0,0 +1,55 @@
+import time
+import threading
+
+# Named caches, reported by the /metrics endpoint
+_registry = {}
+
+def registered_caches() -> dict:
+    return dict(_registry)
+
+class TTLCache:
+    """Small in-process cache whose entries expire after ``ttl`` seconds.
+
+    Keys are tuples whose first element is a namespace (e.g. 'players'),
+    so all entries of one kind can be invalidated when that data changes.
+    Caches created with a ``name`` report their hits and misses as metrics.
+    """
+    def __init__(self, ttl: float, name: str = None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        if name:
+            _registry[name] = self
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, namespace=None):
+        """Drop all entries, or only those whose key starts with ``namespace``"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
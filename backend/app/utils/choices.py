@@ -1,34 +1,35 @@
 from app.main import db, app
 from app.models.models import GameType, Series, Player, SeriesRegistration, RosterPlayersInSeries
+from app.utils.choices_cache import cached_choices
 from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 import logging
 
+@cached_choices(GameType)
 def get_game_type_choices():
     with app.app_context():
-        choices = [(str(gt.id), gt.name) for gt in db.session.query(GameType).all()]
-        default = next((str(gt.id) for gt in db.session.query(GameType).all() if gt.name == "Joukkue"), None)
+        game_types = db.session.query(GameType.id, GameType.name).all()
+        choices = [(str(gt.id), gt.name) for gt in game_types]
+        default = next((str(gt.id) for gt in game_types if gt.name == "Joukkue"), None)
     return choices, default
 
+@cached_choices(Series)
 def get_series_choices():
     """Returns a list of tuples containing (id, name, year) for all series with open registration"""
     with app.app_context():
-        series_list = db.session.query(Series).filter(Series.registration_open == True).all()
+        series_list = db.session.query(Series.id, Series.name, Series.year).filter(Series.registration_open == True).all()
         choices = [(str(s.id), s.name, s.year) for s in series_list]
         default = choices[0][0] if choices else None
         return choices, default
 
+@cached_choices(Player)
 def get_player_choices_with_contact():
     """Returns a list of tuples containing (id, display_name, email) for all players"""
     with current_app.app_context():
-        players = db.session.query(Player).all()
+        players = db.session.query(Player.id, Player.name, Player.email).all()
         return [(player.id, player.name, player.email) for player in players]
 
-def get_player_choices_for_form():
-    """Returns a list of tuples containing (id, name) for all players"""
-    with current_app.app_context():
-        players = db.session.query(Player).all()
-        return [(player.id, player.name) for player in players]
-
 def get_team_choices_by_series():
     with current_app.app_context():
         # Get all registrations with their series, ordered appropriately
@@ -67,30 +68,36 @@ def get_flat_team_choices():
         
         return team_choices
 
+@cached_choices(RosterPlayersInSeries, SeriesRegistration, Series, GameType)
 def get_team_choices_with_player_count():
+    """Team choices grouped by series, labelled with roster size / team size"""
     with current_app.app_context():
-        # Get all registrations grouped by series
-        registrations = db.session.query(SeriesRegistration)\
-            .join(Series)\
+        player_counts = db.session.query(
+            RosterPlayersInSeries.registration_id,
+            func.count(RosterPlayersInSeries.player_id).label('player_count')
+        ).group_by(RosterPlayersInSeries.registration_id).subquery()
+
+        # One query for all registrations, their series, game type and roster size
+        registrations = db.session.query(
+            SeriesRegistration.id,
+            SeriesRegistration.team_name,
+            Series.name,
+            Series.year,
+            GameType.team_player_amount,
+            func.coalesce(player_counts.c.player_count, 0)
+        ).join(Series, SeriesRegistration.series_id == Series.id)\
+            .join(GameType, Series.game_type_id == GameType.id)\
+            .outerjoin(player_counts, player_counts.c.registration_id == SeriesRegistration.id)\
             .filter(SeriesRegistration.team_name.isnot(None))\
             .order_by(Series.year.desc(), Series.name, SeriesRegistration.team_name)\
             .all()
 
         # Group by series
         series_groups = {}
-        for reg in registrations:
-            series_key = f"{reg.series.name} {reg.series.year}"
-            if series_key not in series_groups:
-                series_groups[series_key] = []
-            
-            # Get player count for this registration
-            player_count = db.session.query(RosterPlayersInSeries)\
-                .filter_by(registration_id=reg.id).count()
-            # Get team_player_amount from the series game type
-            team_player_amount = reg.series.game_type.team_player_amount
-            
-            series_groups[series_key].append(
-                (str(reg.id), f"{reg.team_name} ({player_count}/{team_player_amount})")
+        for reg_id, team_name, series_name, year, team_player_amount, player_count in registrations:
+            series_key = f"{series_name} {year}"
+            series_groups.setdefault(series_key, []).append(
+                (str(reg_id), f"{team_name} ({player_count}/{team_player_amount})")
             )
 
         return [(series_name, team_list) for series_name, team_list in series_groups.items()]
@@ -138,33 +145,38 @@ def get_team_players(team_id, session=None):
 
 def get_registration_choices():
     """Returns a list of tuples containing (id, label) for all registrations"""
+    try:
+        return _get_registration_choices()
+    except Exception as e:
+        logging.error(f"Database error in get_registration_choices: {e}")
+        return [('', 'Error loading registrations')]
+
+@cached_choices(SeriesRegistration, Series, Player)
+def _get_registration_choices():
     with current_app.app_context():
-        try:
-            registrations = db.session.query(SeriesRegistration)\
-                .join(Series)\
-                .order_by(Series.year.desc(), Series.name, SeriesRegistration.team_name)\
-                .all()
-            
-            if not registrations:
-                return [('', 'No registrations available')]
-            
-            choices = []
-            for reg in registrations:
-                try:
-                    series_info = f"({reg.series.name} {reg.series.year})"
-                    if reg.team_name:  # Team registration
-                        label = f"{reg.team_name} {series_info}"
-                    else:  # Personal registration
-                        label = f"{reg.contact_player.name} {series_info}"
-                    choices.append((str(reg.id), label))
-                except Exception as e:
-                    logging.error(f"Error processing registration {reg.id}: {e}")
-                    continue
-            
-            return choices if choices else [('', 'No valid registrations found')]
-        except Exception as e:
-            logging.error(f"Database error in get_registration_choices: {e}")
-            return [('', 'Error loading registrations')]
+        registrations = db.session.query(SeriesRegistration)\
+            .join(Series)\
+            .options(joinedload(SeriesRegistration.series), joinedload(SeriesRegistration.contact_player))\
+            .order_by(Series.year.desc(), Series.name, SeriesRegistration.team_name)\
+            .all()
+
+        if not registrations:
+            return [('', 'No registrations available')]
+
+        choices = []
+        for reg in registrations:
+            try:
+                series_info = f"({reg.series.name} {reg.series.year})"
+                if reg.team_name:  # Team registration
+                    label = f"{reg.team_name} {series_info}"
+                else:  # Personal registration
+                    label = f"{reg.contact_player.name} {series_info}"
+                choices.append((str(reg.id), label))
+            except Exception as e:
+                logging.error(f"Error processing registration {reg.id}: {e}")
+                continue
+
+        return choices if choices else [('', 'No valid registrations found')]
 
 def get_series_participant_choices(series_id: int):
     """Get participant choices (teams or players) for a specific series.
@@ -175,45 +187,49 @@ def get_series_participant_choices(series_id: int):
     Returns:
         List of tuples (id, name) for form choices
     """
+    try:
+        return _get_series_participant_choices(series_id)
+    except Exception as e:
+        logging.error(f"Error getting series participant choices: {e}")
+        return []
+
+@cached_choices(SeriesRegistration, Series, GameType, Player)
+def _get_series_participant_choices(series_id: int):
     with current_app.app_context():
-        try:
-            # Get series game type info
-            series_query = db.session.query(Series)\
-                .join(GameType)\
-                .filter(Series.id == series_id)\
-                .first()
-            
-            if not series_query:
-                return []
-
-            # For personal leagues (team_player_amount = 1)
-            if series_query.game_type.team_player_amount == 1:
-                participants = db.session.query(
-                    SeriesRegistration.id,
-                    Player.name
-                ).join(
-                    Player,
-                    SeriesRegistration.contact_player_id == Player.id
-                ).filter(
-                    SeriesRegistration.series_id == series_id
-                ).order_by(
-                    Player.name
-                ).all()
-            else:
-                # For team leagues
-                participants = db.session.query(
-                    SeriesRegistration.id,
-                    SeriesRegistration.team_name
-                ).filter(
-                    SeriesRegistration.series_id == series_id,
-                    SeriesRegistration.team_name.isnot(None)
-                ).order_by(
-                    SeriesRegistration.team_name
-                ).all()
-
-            return [(str(p.id), p.name if hasattr(p, 'name') else p.team_name) 
-                    for p in participants]
-            
-        except Exception as e:
-            logging.error(f"Error getting series participant choices: {e}")
+        # Get series game type info
+        series_query = db.session.query(Series)\
+            .join(GameType)\
+            .options(joinedload(Series.game_type))\
+            .filter(Series.id == series_id)\
+            .first()
+
+        if not series_query:
             return []
+
+        # For personal leagues (team_player_amount = 1)
+        if series_query.game_type.team_player_amount == 1:
+            participants = db.session.query(
+                SeriesRegistration.id,
+                Player.name
+            ).join(
+                Player,
+                SeriesRegistration.contact_player_id == Player.id
+            ).filter(
+                SeriesRegistration.series_id == series_id
+            ).order_by(
+                Player.name
+            ).all()
+        else:
+            # For team leagues
+            participants = db.session.query(
+                SeriesRegistration.id,
+                SeriesRegistration.team_name
+            ).filter(
+                SeriesRegistration.series_id == series_id,
+                SeriesRegistration.team_name.isnot(None)
+            ).order_by(
+                SeriesRegistration.team_name
+            ).all()
+
+        return [(str(p.id), p.name if hasattr(p, 'name') else p.team_name) 
+                for p in participants]
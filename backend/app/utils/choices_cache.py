@@ -0,0 +1,70 @@
+import functools
+from collections import defaultdict
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.utils.cache import TTLCache
+from app.utils.constants import ChoicesCache
+
+# Form choices are read on every admin form render but change rarely. Entries
+# are dropped when a transaction that inserted, updated or deleted a model they
+# are built from commits in this process; the TTL bounds staleness in other
+# worker processes.
+_cache = TTLCache(ttl=ChoicesCache.TTL, name='choices')
+_dependents = defaultdict(set)
+_MISSING = object()
+_PENDING_KEY = 'invalidated_choices'
+
+def _invalidate_dependents(mapper, connection, target):
+    """Remember the namespaces a flushed ORM change affects until its transaction ends.
+
+    The mapper events fire at flush, before commit; invalidating there would
+    let another request cache the old rows again for the whole TTL. Core and
+    bulk statements (session.execute(insert(...)) etc.) bypass these events
+    and do not invalidate anything.
+    """
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).update(_dependents[mapper.class_])
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session):
+    for namespace in session.info.pop(_PENDING_KEY, ()):
+        _cache.invalidate(namespace)
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_rolled_back(session, previous_transaction):
+    # A savepoint rollback keeps the changes of the outer transaction
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+def cached_choices(*models):
+    """Cache a choice provider until one of ``models`` changes.
+
+    The provider's positional arguments are part of the cache key. Cached
+    values are shared between requests, so callers must not mutate them.
+    Exceptions are not cached.
+    """
+    def decorator(func):
+        namespace = func.__name__
+        for model in models:
+            if not _dependents[model]:
+                for event_name in ('after_insert', 'after_update', 'after_delete'):
+                    event.listen(model, event_name, _invalidate_dependents)
+            _dependents[model].add(namespace)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (namespace, *args)
+            value = _cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args)
+                _cache.set(key, value)
+            return value
+
+        wrapper.invalidate = lambda: _cache.invalidate(namespace)
+        return wrapper
+    return decorator
+
+def invalidate_choices():
+    """Drop all cached choices"""
+    _cache.invalidate()
@@ -1,24 +1,10 @@
 from enum import Enum
+from app.models.score_limits import GameScores  # noqa: F401
 
-class GameScores:
-    SINGLE_THROW_MIN = -40 # kaikki pappi-kyykät rajalta sisään
-    SINGLE_THROW_MAX = 80 #kaikki kyykät ulos
-    ROUND_SCORE_MIN = -80 # 40 kyykkää * 2p 
-    ROUND_SCORE_MAX = 19 # yhdellä heitolla kaiki kyykät ulos ja 1 piste käyttämättömästä heitosta henkkarikentällä
-    TOTAL_SCORE_MIN = ROUND_SCORE_MIN * 2  # -160
-    TOTAL_SCORE_MAX = ROUND_SCORE_MAX * 2  # 38
-
-    @classmethod
-    def validate_throw(cls, value: int) -> bool:
-        return cls.SINGLE_THROW_MIN <= value <= cls.SINGLE_THROW_MAX
-
-    @classmethod
-    def validate_round_score(cls, value: int) -> bool:
-        return cls.ROUND_SCORE_MIN <= value <= cls.ROUND_SCORE_MAX
-
-    @classmethod
-    def validate_total_score(cls, value: int) -> bool:
-        return cls.TOTAL_SCORE_MIN <= value <= cls.TOTAL_SCORE_MAX
+class StandingsPoints:
+    WIN = 2
+    DRAW = 1
+    LOSS = 0
 
 class FormDefaults:
     NO_PLAYER_CHOICE = ('-1', '-- Select Player --')
@@ -36,3 +22,11 @@ class FormFields:
     SCORE_1_2 = 'score_1_2'
     SCORE_2_1 = 'score_2_1'
     SCORE_2_2 = 'score_2_2'
+
+class Pagination:
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+    TOTAL_COUNT_TTL = 60  # sekuntia
+
+class ChoicesCache:
+    TTL = 300  # sekuntia
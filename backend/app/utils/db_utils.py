@@ -0,0 +1,12 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+def dialect_insert(session, table):
+    """Return an INSERT construct supporting ON CONFLICT for the session's database.
+
+    Postgres is used in production, SQLite in the test suite; both dialects
+    provide ``on_conflict_do_update`` with the same signature.
+    """
+    if session.get_bind().dialect.name == 'sqlite':
+        return sqlite_insert(table)
+    return pg_insert(table)
@@ -1,19 +1,60 @@
 from app.models import SeriesRegistration, Series, Player  # Changed from SeriesRegistration
+from flask import g, has_request_context
 from flask_babel import gettext as _
+from sqlalchemy.orm import joinedload
 from app.main import app
 import logging
 
+def _lookup_cache():
+    """Per-request cache of display lookups, None outside of a request"""
+    if not has_request_context():
+        return None
+    if 'display_lookups' not in g:
+        g.display_lookups = {}
+    return g.display_lookups
+
+def _get(session, model, id):
+    cache = _lookup_cache()
+    if cache is None:
+        return session.query(model).get(id)
+    key = (model, int(id))
+    if key not in cache:
+        cache[key] = session.query(model).get(id)
+    return cache[key]
+
+def prefetch_display_lookups(session, team_ids=(), series_ids=(), player_ids=()):
+    """Load the rows the formatters below need for a list page up front.
+
+    One IN query per model replaces a query per formatted cell; the rows are
+    kept in a request scoped cache that the formatters consult.
+    """
+    cache = _lookup_cache()
+    if cache is None:
+        return
+    lookups = (
+        (SeriesRegistration, team_ids, [joinedload(SeriesRegistration.contact_player)]),
+        (Series, series_ids, []),
+        (Player, player_ids, []),
+    )
+    for model, ids, options in lookups:
+        missing = {int(id) for id in ids if id} - {key[1] for key in cache if key[0] is model}
+        if not missing:
+            continue
+        found = {row.id: row for row in session.query(model).options(*options).filter(model.id.in_(missing))}
+        for id in missing:
+            cache[(model, id)] = found.get(id)
+
 def format_player_name(session, player_id):
     """Format player name for display in admin views"""
     if player_id:
-        player = session.query(Player).get(player_id)
+        player = _get(session, Player, player_id)
         return player.name if player else str(player_id)
     return ''
 
 def format_series_name(session, series_id):
     """Format series name for display in admin views"""
     if series_id:
-        series = session.query(Series).get(series_id)
+        series = _get(session, Series, series_id)
         return f"{series.name} ({series.year})" if series else str(series_id)
     return ''
 
@@ -21,7 +62,7 @@ def format_team_name(session, team_id):
     """Format team name for display in admin views"""
     if not team_id:
         return ""
-    reg = session.query(SeriesRegistration).get(team_id)  # Changed from TeamInSeries
+    reg = _get(session, SeriesRegistration, team_id)  # Changed from TeamInSeries
     if reg:
         return f"{reg.team_name} ({reg.team_abbreviation})" if reg.team_name else reg.contact_player.name
     return ""
@@ -29,7 +70,7 @@ def format_team_name(session, team_id):
 def format_player_contact_info(session, player_id):
     """Format player name and email for display in admin views"""
     if player_id:
-        player = session.query(Player).get(player_id)
+        player = _get(session, Player, player_id)
         return f"{player.name} ({player.email})" if player else str(player_id)
     return ''
 
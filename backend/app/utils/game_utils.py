@@ -1,7 +1,8 @@
-from app.models.models import SingleRoundThrow, SingleThrow, ThrowType
+from app.models.models import SingleRoundThrow, ThrowType
 from app.utils.throw_input import ThrowInputField
 import logging
 from wtforms import StringField
+from sqlalchemy.orm import joinedload
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -60,10 +61,47 @@ def _add_field_if_missing(form, field_name, field_type=StringField):
             form._fields = {}
         form._fields[field_name] = getattr(form, field_name)
 
+def load_game_round_throws(session, game_id):
+    """Load all round rows of a game together with their four throws.
+
+    The throws are joined in the same SELECT so building the score sheet
+    does not issue a query per throw.
+    """
+    return session.query(SingleRoundThrow)\
+        .options(
+            joinedload(SingleRoundThrow.throws_1),
+            joinedload(SingleRoundThrow.throws_2),
+            joinedload(SingleRoundThrow.throws_3),
+            joinedload(SingleRoundThrow.throws_4)
+        )\
+        .filter(SingleRoundThrow.game_id == game_id)\
+        .all()
+
+def build_throw_field_values(round_throws):
+    """Map score sheet field names to display values for loaded round rows"""
+    values = {}
+    for round_throw in round_throws:
+        team_num = 1 if round_throw.home_team else 2
+        set_index = round_throw.game_set_index
+        round_num = round_throw.throw_position
+        throws = [round_throw.throws_1, round_throw.throws_2, round_throw.throws_3, round_throw.throws_4]
+
+        # Player 1 throws throw_1 and throw_2, player 2 throws throw_3 and throw_4
+        for player_num, single_throw in [(1, throws[0]), (2, throws[2])]:
+            if single_throw:
+                field_name = _create_form_field_name(set_index, round_num, team_num, 'player', player_num)
+                values[field_name] = str(single_throw.player_id)
+
+        for throw_num, single_throw in enumerate(throws, 1):
+            if single_throw:
+                field_name = _create_form_field_name(set_index, round_num, team_num, 'throw', throw_num)
+                values[field_name] = ThrowInputField.convert_to_display_value(single_throw)
+    return values
+
 def load_existing_throws(session, form, game):
     """Load existing throws into form"""
-    throws = session.query(SingleRoundThrow).filter_by(game_id=game.id).all()
-    logger.debug(f"Loading throws for game {game.id}: found {len(throws)} throws")
+    round_throws = load_game_round_throws(session, game.id)
+    logger.debug(f"Loading throws for game {game.id}: found {len(round_throws)} rounds")
 
     # First load game scores
     form.score_1_1.data = game.score_1_1
@@ -72,63 +110,18 @@ def load_existing_throws(session, form, game):
     form.score_2_2.data = game.score_2_2
 
     # Then load throws
-    for throw in throws:
-        try:
-            # Determine prefix
-            team_num = 1 if throw.home_team else 2
-            set_index = throw.game_set_index
-            round_num = throw.throw_position
-
-            # Create fields for this round if they don't exist
-            for field_type in ['player', 'throw']:
-                for num in range(1, 5):
-                    field_name = _create_form_field_name(set_index, round_num, team_num, field_type, num)
-                    _add_field_if_missing(form, field_name)
-                    logger.debug(f"Ensured field exists: {field_name}")
-
-            # Load player IDs
-            if throw.throw_1:
-                player1 = session.query(SingleThrow).get(throw.throw_1)
-                if player1:
-                    field_name = _create_form_field_name(set_index, round_num, team_num, 'player', 1)
-                    form._fields[field_name].data = str(player1.player_id)
-                    logger.debug(f"Set {field_name}={player1.player_id}")
-
-            if throw.throw_3:
-                player2 = session.query(SingleThrow).get(throw.throw_3)
-                if player2:
-                    field_name = _create_form_field_name(set_index, round_num, team_num, 'player', 2)
-                    form._fields[field_name].data = str(player2.player_id)
-                    logger.debug(f"Set {field_name}={player2.player_id}")
-
-            # Load throws
-            throws_map = {
-                1: throw.throw_1,
-                2: throw.throw_2,
-                3: throw.throw_3,
-                4: throw.throw_4
-            }
-
-            for throw_num, throw_id in throws_map.items():
-                if throw_id:
-                    single_throw = session.query(SingleThrow).get(throw_id)
-                    if single_throw:
-                        field_name = _create_form_field_name(set_index, round_num, team_num, 'throw', throw_num)
-                        
-                        # Convert throw to display format
-                        value = {
-                            ThrowType.VALID: str(single_throw.throw_score),
-                            ThrowType.HAUKI: 'H',
-                            ThrowType.FAULT: 'F',
-                            ThrowType.E: 'E'
-                        }.get(single_throw.throw_type, 'E')
-                        
-                        form._fields[field_name].data = value
-                        logger.debug(f"Set {field_name}={value}")
-
-        except Exception as e:
-            logger.error(f"Error loading throw data: {e}", exc_info=True)
-            continue
+    for round_throw in round_throws:
+        # Create fields for this round if they don't exist
+        for field_type in ['player', 'throw']:
+            for num in range(1, 5):
+                field_name = _create_form_field_name(
+                    round_throw.game_set_index, round_throw.throw_position,
+                    1 if round_throw.home_team else 2, field_type, num
+                )
+                _add_field_if_missing(form, field_name)
+
+    for field_name, value in build_throw_field_values(round_throws).items():
+        form._fields[field_name].data = value
 
 import logging
 from app.models.models import ThrowType
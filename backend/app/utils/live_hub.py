@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+class LiveGameHub:
+    """In-process fan-out of game events to the subscribers of each game.
+
+    Every subscriber gets its own bounded queue, so a slow client only loses
+    its own oldest events instead of blocking the scorekeeper. Events reach
+    the subscribers of this process only: with several workers, spectators
+    and scorekeepers of a game must hit the same worker (sticky sessions),
+    or the hub has to be replaced with a broker such as PostgreSQL NOTIFY.
+    """
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers = defaultdict(set)
+
+    @asynccontextmanager
+    async def subscribe(self, game_id: int):
+        """Yield a queue receiving the events published for ``game_id``"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[game_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[game_id].discard(queue)
+            if not self._subscribers[game_id]:
+                del self._subscribers[game_id]
+
+    def publish(self, game_id: int, event: dict) -> int:
+        """Queue ``event`` for every subscriber of the game, return the subscriber count"""
+        queues = self._subscribers.get(game_id, ())
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+                logger.debug(f"Dropped oldest live event of game {game_id} for a slow subscriber")
+            queue.put_nowait(event)
+        return len(queues)
+
+    def subscriber_count(self, game_id: int) -> int:
+        return len(self._subscribers.get(game_id, ()))
+
+live_hub = LiveGameHub()
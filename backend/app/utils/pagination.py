@@ -0,0 +1,44 @@
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.utils.cache import TTLCache
+from app.utils.constants import Pagination
+
+# Total counts change rarely compared to how often lists are read
+total_count_cache = TTLCache(ttl=Pagination.TOTAL_COUNT_TTL, name='total_count')
+
+def keyset_page(query, id_column, limit: Optional[int] = None, after: Optional[int] = None):
+    """Restrict a select to one page ordered by id.
+
+    ``after`` is the id of the last row of the previous page, so the
+    database seeks directly to the page through the primary key index
+    instead of scanning and discarding rows like OFFSET does.
+    """
+    if after is not None:
+        query = query.where(id_column > after)
+    query = query.order_by(id_column)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+async def cached_total_count(db: AsyncSession, query, cache_key: tuple) -> int:
+    """Count the rows of an unpaginated select, caching the result by key"""
+    total = total_count_cache.get(cache_key)
+    if total is None:
+        result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+        total = result.scalar_one()
+        total_count_cache.set(cache_key, total)
+    return total
+
+def set_page_headers(response, items, limit: int, total: int) -> None:
+    """Expose the total count and the cursor of the next page as headers.
+
+    The response body stays a plain list so existing clients keep working.
+    """
+    response.headers["X-Total-Count"] = str(total)
+    if len(items) == limit:
+        response.headers["X-Next-After"] = str(items[-1].id)
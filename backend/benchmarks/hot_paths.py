@@ -0,0 +1,272 @@
+"""Benchmarks for the score sheet save/load paths, admin lists and API lists.
+
+Seeds a database with generated series, games and throws, then times each
+hot path and counts the SQL statements it issues:
+
+    python benchmarks/hot_paths.py                        # temporary SQLite file
+    python benchmarks/hot_paths.py --series 10 --games 100 --repeat 20
+    DATABASE_URL=postgresql://... python benchmarks/hot_paths.py --no-seed
+
+Use an empty scratch database with DATABASE_URL, the seed data is inserted
+with fixed ids. Results can be written as JSON (--json) and compared between
+runs to catch regressions.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the score sheet, admin list and API list hot paths")
+    parser.add_argument("--series", type=int, default=3, help="series to seed")
+    parser.add_argument("--teams", type=int, default=8, help="teams per series")
+    parser.add_argument("--games", type=int, default=40, help="games per series")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per benchmark")
+    parser.add_argument("--no-seed", action="store_true", help="use the data already in DATABASE_URL")
+    parser.add_argument("--json", help="write the results to this file")
+    return parser.parse_args()
+
+args = parse_args()
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import event, select, func
+from app.main import app, db
+from app.models.models import (
+    Base, Game, GameType, Player, RosterPlayersInSeries, Series, SeriesRegistration, SingleRoundThrow
+)
+from app.services.game_service import GameService
+from app.services.throw_service import ThrowService
+from app.utils.game_utils import load_existing_throws
+
+THROW_VALUES = ["1", "2", "0", "H", "F", "3", "E", "5"]
+ADMIN_LIST_URLS = [
+    "/admin/game/",
+    "/admin/seriesregistration/",
+    "/admin/rosterplayersinseries/",
+    "/admin/player/",
+]
+API_LIST_URLS = [
+    "/api/v1/games/?limit=50",
+    "/api/v1/players/?limit=50",
+    "/api/v1/series/?limit=50",
+    "/api/v1/players/leaderboard?limit=50",
+]
+
+class QueryCounter:
+    """Count statements executed on an engine"""
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+class Results:
+    def __init__(self):
+        self.rows = []
+
+    def add(self, name, timings, queries):
+        self.rows.append({
+            "name": name,
+            "runs": len(timings),
+            "mean_ms": round(statistics.mean(timings) * 1000, 2),
+            "min_ms": round(min(timings) * 1000, 2),
+            "max_ms": round(max(timings) * 1000, 2),
+            "queries_per_run": round(queries / len(timings), 1),
+        })
+
+    def print(self):
+        print(f"{'benchmark':<45} {'runs':>5} {'mean ms':>9} {'min ms':>9} {'max ms':>9} {'queries':>8}")
+        for row in self.rows:
+            print(f"{row['name']:<45} {row['runs']:>5} {row['mean_ms']:>9} {row['min_ms']:>9} "
+                  f"{row['max_ms']:>9} {row['queries_per_run']:>8}")
+
+@contextmanager
+def measured(counter, timings, queries):
+    start_count = counter.count
+    start = time.perf_counter()
+    yield
+    timings.append(time.perf_counter() - start)
+    queries.append(counter.count - start_count)
+
+def run_sync(results, counter, name, func, repeat):
+    func()  # warm up caches and lazily compiled statements
+    timings, queries = [], []
+    for i in range(repeat):
+        with measured(counter, timings, queries):
+            func(i)
+    results.add(name, timings, sum(queries))
+
+def seed(session, series_count, team_count, games_per_series):
+    """Insert series with teams, rosters, games and full score sheets for half of the games"""
+    session.add(GameType(id=1, name="Pari", team_player_amount=4, game_player_amount=4, throw_round_amount=4))
+    player_id = 0
+    registration_id = 0
+    game_id = 0
+    game_rounds = []
+    for series_id in range(1, series_count + 1):
+        session.add(Series(id=series_id, name=f"Sarja {series_id}", year=2000 + series_id, game_type_id=1))
+        registrations = []
+        for team in range(team_count):
+            registration_id += 1
+            registrations.append(registration_id)
+            session.add(SeriesRegistration(
+                id=registration_id, series_id=series_id,
+                team_name=f"Joukkue {registration_id}", team_abbreviation=f"J{registration_id}"
+            ))
+            for _ in range(4):
+                player_id += 1
+                session.add(Player(id=player_id, name=f"Pelaaja {player_id}", email=f"p{player_id}@example.com"))
+                session.add(RosterPlayersInSeries(registration_id=registration_id, player_id=player_id))
+        session.flush()
+
+        for n in range(games_per_series):
+            game_id += 1
+            team_1 = registrations[n % team_count]
+            team_2 = registrations[(n + 1 + n // team_count) % team_count]
+            if team_1 == team_2:
+                team_2 = registrations[(n + 1) % team_count]
+            session.add(Game(
+                id=game_id, series_id=series_id, game_date=date(2000 + series_id, 1, 1) + timedelta(days=n),
+                round=str(n + 1), team_1_id=team_1, team_2_id=team_2,
+                score_1_1=-10, score_1_2=5, score_2_1=-20, score_2_2=-3
+            ))
+            if n % 2 == 0:
+                game_rounds.extend((game_id, entry) for entry in round_entries(team_1, team_2))
+        session.flush()
+
+    ThrowService().insert_game_rounds(session, game_rounds)
+    session.commit()
+
+def round_entries(team_1, team_2, offset=0):
+    """Full score sheet: 2 sets, 4 rounds, both teams"""
+    entries = []
+    for set_index in (1, 2):
+        for round_num in range(1, 5):
+            for is_home_team, team_id in ((True, team_1), (False, team_2)):
+                first_player = (team_id - 1) * 4 + 1
+                player_1 = first_player + ((round_num - 1) % 2) * 2
+                entries.append({
+                    'game_set_index': set_index,
+                    'throw_round': round_num,
+                    'is_home_team': is_home_team,
+                    'team_id': team_id,
+                    'player_1_id': str(player_1),
+                    'player_2_id': str(player_1 + 1),
+                    'throws': [THROW_VALUES[(offset + round_num + i) % len(THROW_VALUES)] for i in range(4)],
+                })
+    return entries
+
+def score_sheet_form_data(entries):
+    data = {}
+    for entry in entries:
+        prefix = f"set_{entry['game_set_index']}_round_{entry['throw_round']}_team_{1 if entry['is_home_team'] else 2}"
+        data[f"{prefix}_player_1"] = entry['player_1_id']
+        data[f"{prefix}_player_2"] = entry['player_2_id']
+        for i, value in enumerate(entry['throws'], 1):
+            data[f"{prefix}_throw_{i}"] = value
+    return data
+
+def score_form():
+    return SimpleNamespace(**{f"score_{team}_{set_index}": SimpleNamespace(data=0)
+                              for team in (1, 2) for set_index in (1, 2)})
+
+def benchmark_score_sheet(results, counter, repeat):
+    session = db.session
+    game_service = GameService()
+    games = session.execute(
+        select(Game.id, Game.team_1_id, Game.team_2_id, func.count(SingleRoundThrow.id))
+        .outerjoin(SingleRoundThrow, SingleRoundThrow.game_id == Game.id)
+        .group_by(Game.id, Game.team_1_id, Game.team_2_id).order_by(Game.id)
+    ).all()
+    saved = [game for game in games if game[3]]
+    empty = [game for game in games if not game[3]]
+    if not saved:
+        print("No games with throws, skipping score sheet benchmarks")
+        return
+
+    def save(game, offset):
+        form_data = score_sheet_form_data(round_entries(game[1], game[2], offset))
+        with app.test_request_context("/", method="POST", data=form_data):
+            game_service.process_game_throws(game[0], score_form(), session)
+
+    if empty:
+        run_sync(results, counter, "process_game_throws (new sheet)",
+                 lambda i=None: save(empty.pop(), 0), min(repeat, len(empty) - 1))
+    run_sync(results, counter, "process_game_throws (resave, changed)",
+             lambda i=0: save(saved[0], i + 1), repeat)
+    run_sync(results, counter, "process_game_throws (resave, unchanged)",
+             lambda i=None: save(saved[1 % len(saved)], 0), repeat)
+
+    def load(i=None):
+        session.expire_all()
+        game = session.get(Game, saved[0][0])
+        load_existing_throws(session, score_form(), game)
+
+    run_sync(results, counter, "load_existing_throws", load, repeat)
+
+def benchmark_admin_lists(results, counter, repeat):
+    client = app.test_client()
+    for url in ADMIN_LIST_URLS:
+        def get(i=None, url=url):
+            response = client.get(url)
+            assert response.status_code == 200, f"{url}: {response.status_code}"
+        run_sync(results, counter, f"admin GET {url}", get, repeat)
+
+async def benchmark_api_lists(results, repeat):
+    try:
+        import httpx
+        from fastapi import FastAPI
+        from app.api.router import api_router
+        from database.database import engine
+    except (ImportError, RuntimeError) as e:
+        # e.g. FastAPI extras that are only installed in the API image
+        print(f"Skipping API benchmarks: {e}")
+        return
+
+    api = FastAPI()
+    api.include_router(api_router, prefix="/api/v1")
+    counter = QueryCounter(engine.sync_engine)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=api), base_url="http://bench") as client:
+        for url in API_LIST_URLS:
+            await client.get(url)
+            timings, queries = [], []
+            for _ in range(repeat):
+                with measured(counter, timings, queries):
+                    response = await client.get(url)
+                assert response.status_code == 200, f"{url}: {response.status_code}"
+            results.add(f"api GET {url}", timings, sum(queries))
+    await engine.dispose()
+
+def main():
+    results = Results()
+    with app.app_context():
+        if not args.no_seed:
+            Base.metadata.create_all(db.engine)
+            start = time.perf_counter()
+            seed(db.session, args.series, args.teams, args.games)
+            print(f"Seeded {args.series} series, {args.series * args.games} games "
+                  f"in {time.perf_counter() - start:.2f}s ({db.engine.url.render_as_string()})")
+        counter = QueryCounter(db.engine)
+        benchmark_score_sheet(results, counter, args.repeat)
+        benchmark_admin_lists(results, counter, args.repeat)
+    asyncio.run(benchmark_api_lists(results, args.repeat))
+
+    results.print()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results.rows, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+-- Materialized sarjataulukko, päivitetään inkrementaalisesti pelien tallennuksen yhteydessä
+CREATE TABLE series_standings (
+    series_id INTEGER NOT NULL REFERENCES series(id) ON DELETE CASCADE,
+    registration_id INTEGER NOT NULL REFERENCES series_registrations(id) ON DELETE CASCADE,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,   -- voitto 2p, tasapeli 1p, tappio 0p
+    score_for INTEGER NOT NULL DEFAULT 0,
+    score_against INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (series_id, registration_id)
+);
+
+-- Backfill from existing regular season games
+INSERT INTO series_standings (
+    series_id, registration_id, games_played, wins, draws, losses, points, score_for, score_against
+)
+SELECT
+    results.series_id,
+    results.registration_id,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE results.own > results.opponent),
+    COUNT(*) FILTER (WHERE results.own = results.opponent),
+    COUNT(*) FILTER (WHERE results.own < results.opponent),
+    SUM(CASE WHEN results.own > results.opponent THEN 2
+             WHEN results.own = results.opponent THEN 1
+             ELSE 0 END),
+    SUM(results.own),
+    SUM(results.opponent)
+FROM (
+    SELECT series_id, team_1_id AS registration_id,
+           score_1_1 + score_1_2 AS own, score_2_1 + score_2_2 AS opponent
+    FROM games WHERE is_playoff IS NOT TRUE
+    UNION ALL
+    SELECT series_id, team_2_id AS registration_id,
+           score_2_1 + score_2_2 AS own, score_1_1 + score_1_2 AS opponent
+    FROM games WHERE is_playoff IS NOT TRUE
+) results
+GROUP BY results.series_id, results.registration_id;
@@ -0,0 +1,5 @@
+-- Trigram indexes for the player autocomplete (ILIKE '%term%' on name and email)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_players_name_trgm ON players USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_players_email_trgm ON players USING gin (email gin_trgm_ops);
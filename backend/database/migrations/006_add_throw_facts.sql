@@ -0,0 +1,47 @@
+-- Denormalized heitot analytiikkaa varten: yksi rivi per heitto pelin, sarjan,
+-- erän, kierroksen, joukkueen ja pelaajan kanssa. ThrowService rakentaa pelin
+-- rivit uudelleen aina kun pelin heittoja tallennetaan.
+CREATE TABLE throw_facts (
+    throw_id INTEGER PRIMARY KEY REFERENCES single_throw(id) ON DELETE CASCADE,
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    series_id INTEGER NOT NULL REFERENCES series(id) ON DELETE CASCADE,
+    game_set_index INTEGER NOT NULL,
+    throw_round INTEGER NOT NULL,
+    round_throw_number INTEGER NOT NULL,  -- 1-4, single_round_throws.throw_N
+    home_team BOOLEAN NOT NULL,
+    team_id INTEGER REFERENCES series_registrations(id),
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    throw_index INTEGER NOT NULL,
+    throw_type throw_result NOT NULL,
+    throw_score INTEGER NOT NULL
+);
+
+CREATE INDEX ix_throw_facts_player_series ON throw_facts (player_id, series_id);
+CREATE INDEX ix_throw_facts_series_player ON throw_facts (series_id, player_id);
+CREATE INDEX ix_throw_facts_game ON throw_facts (game_id);
+
+-- Backfill from existing rounds
+INSERT INTO throw_facts (
+    throw_id, game_id, series_id, game_set_index, throw_round, round_throw_number,
+    home_team, team_id, player_id, throw_index, throw_type, throw_score
+)
+SELECT
+    st.id,
+    srt.game_id,
+    g.series_id,
+    srt.game_set_index,
+    srt.throw_position,
+    rt.round_throw_number,
+    srt.home_team,
+    srt.team_id,
+    st.player_id,
+    st.throw_index,
+    st.throw_type,
+    st.throw_score
+FROM single_round_throws srt
+JOIN games g ON g.id = srt.game_id
+CROSS JOIN LATERAL (
+    VALUES (1, srt.throw_1), (2, srt.throw_2), (3, srt.throw_3), (4, srt.throw_4)
+) AS rt (round_throw_number, throw_id)
+JOIN single_throw st ON st.id = rt.throw_id
+ON CONFLICT (throw_id) DO NOTHING;
@@ -0,0 +1,173 @@
+-- Korvaa rivitason validointitriggerit statement-tason triggereillä, jotka
+-- tarkistavat koko lauseen rivit transition tablesta yhdellä kyselyllä.
+-- Rosterin kaksi päällekkäistä triggeriä yhdistetään yhdeksi.
+DROP TRIGGER IF EXISTS validate_team_player_count_trigger ON roster_players_in_series;
+DROP TRIGGER IF EXISTS validate_roster_for_personal_league_trigger ON roster_players_in_series;
+DROP TRIGGER IF EXISTS validate_game_trigger ON games;
+DROP TRIGGER IF EXISTS validate_registration_type_trigger ON series_registrations;
+DROP FUNCTION IF EXISTS validate_team_player_count();
+DROP FUNCTION IF EXISTS validate_roster_for_personal_league();
+
+-- Rosterin tarkistukset yhdellä statement-tason triggerillä: henkilökohtaisen
+-- sarjan joukkueeseen ei lisätä pelaajia ja joukkueen pelaajamäärä on rajattu.
+-- Transition table sisältää kaikki lauseen lisäämät rivit, joten massalataus
+-- tarkistetaan yhdellä kyselyllä per ehto.
+CREATE OR REPLACE FUNCTION validate_roster_players()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_game_type_name VARCHAR(100);
+    v_team_player_amount INTEGER;
+BEGIN
+    -- Personal leagues don't have rosters
+    PERFORM 1
+    FROM (SELECT DISTINCT registration_id FROM new_roster) nr
+    JOIN series_registrations sr ON sr.id = nr.registration_id
+    JOIN series s ON s.id = sr.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount = 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Cannot add players to a personal league team';
+    END IF;
+
+    -- Roster size, counted after the statement so the new rows are included
+    SELECT gt.team_player_amount, gt.name INTO v_team_player_amount, v_game_type_name
+    FROM (SELECT DISTINCT registration_id FROM new_roster) nr
+    JOIN series_registrations sr ON sr.id = nr.registration_id
+    JOIN series s ON s.id = sr.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    JOIN LATERAL (
+        SELECT COUNT(*) AS player_count
+        FROM roster_players_in_series r
+        WHERE r.registration_id = nr.registration_id
+    ) roster ON true
+    WHERE roster.player_count > gt.team_player_amount
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Player limit exceeded: Maximum % players allowed for game type %',
+            v_team_player_amount, v_game_type_name;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow only one event per trigger
+DROP TRIGGER IF EXISTS validate_roster_players_insert_trigger ON roster_players_in_series;
+CREATE TRIGGER validate_roster_players_insert_trigger
+AFTER INSERT ON roster_players_in_series
+REFERENCING NEW TABLE AS new_roster
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_roster_players();
+
+DROP TRIGGER IF EXISTS validate_roster_players_update_trigger ON roster_players_in_series;
+CREATE TRIGGER validate_roster_players_update_trigger
+AFTER UPDATE ON roster_players_in_series
+REFERENCING NEW TABLE AS new_roster
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_roster_players();
+
+-- Pelien tarkistus statement-tasolla, kaikki lauseen pelit yhdellä joinilla
+CREATE OR REPLACE FUNCTION validate_game()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_game_series_year INTEGER;
+BEGIN
+    -- Basic check that teams are different
+    PERFORM 1 FROM new_games WHERE team_1_id = team_2_id;
+    IF FOUND THEN
+        RAISE EXCEPTION 'Team cannot play against itself';
+    END IF;
+
+    -- Check years match for all participants
+    SELECT s.year INTO v_game_series_year
+    FROM new_games g
+    JOIN series s ON s.id = g.series_id
+    JOIN series_registrations sr1 ON sr1.id = g.team_1_id
+    JOIN series s1 ON s1.id = sr1.series_id
+    JOIN series_registrations sr2 ON sr2.id = g.team_2_id
+    JOIN series s2 ON s2.id = sr2.series_id
+    WHERE s1.year != s.year OR s2.year != s.year
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Teams must be from the same year as the game series (year: %)', v_game_series_year;
+    END IF;
+
+    -- For non-cup series, teams must be from the same series as the game
+    PERFORM 1
+    FROM new_games g
+    JOIN series s ON s.id = g.series_id
+    JOIN series_registrations sr1 ON sr1.id = g.team_1_id
+    JOIN series_registrations sr2 ON sr2.id = g.team_2_id
+    WHERE NOT s.is_cup_league
+      AND (sr1.series_id != g.series_id OR sr2.series_id != g.series_id);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Teams must be from the same series as the game in non-cup series';
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS validate_game_insert_trigger ON games;
+CREATE TRIGGER validate_game_insert_trigger
+AFTER INSERT ON games
+REFERENCING NEW TABLE AS new_games
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_game();
+
+DROP TRIGGER IF EXISTS validate_game_update_trigger ON games;
+CREATE TRIGGER validate_game_update_trigger
+AFTER UPDATE ON games
+REFERENCING NEW TABLE AS new_games
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_game();
+
+-- Ilmoittautumisen tyyppi (joukkue vs henkilökohtainen) statement-tasolla
+CREATE OR REPLACE FUNCTION validate_registration_type()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Team league validation
+    PERFORM 1
+    FROM new_registrations r
+    JOIN series s ON s.id = r.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount > 1
+      AND (r.team_name IS NULL OR r.team_abbreviation IS NULL);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Team leagues require team name and abbreviation';
+    END IF;
+
+    -- Personal league validation
+    PERFORM 1
+    FROM new_registrations r
+    JOIN series s ON s.id = r.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount <= 1
+      AND (r.team_name IS NOT NULL OR r.team_abbreviation IS NOT NULL);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Personal leagues cannot have team name or abbreviation';
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS validate_registration_type_insert_trigger ON series_registrations;
+CREATE TRIGGER validate_registration_type_insert_trigger
+AFTER INSERT ON series_registrations
+REFERENCING NEW TABLE AS new_registrations
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_registration_type();
+
+DROP TRIGGER IF EXISTS validate_registration_type_update_trigger ON series_registrations;
+CREATE TRIGGER validate_registration_type_update_trigger
+AFTER UPDATE ON series_registrations
+REFERENCING NEW TABLE AS new_registrations
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_registration_type();
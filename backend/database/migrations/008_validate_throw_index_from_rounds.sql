@@ -0,0 +1,93 @@
+-- validate_throw_index (002) haki pelityypin ehdolla
+-- srt.throw_1 = NEW.id OR srt.throw_2 = NEW.id OR ..., mikä ei voi käyttää
+-- indeksiä, ja se ajettiin ennen kuin kierros edes viittasi heittoon.
+-- Tarkistus tehdään nyt single_round_throws-puolelta, kun kierros liitetään
+-- heittoihin, ja heittojen throw_index-muutoksille erikseen.
+DROP TRIGGER IF EXISTS validate_throw_index_trigger ON single_throw;
+DROP FUNCTION IF EXISTS validate_throw_index();
+
+-- Throw lookups from the single_throw side (this check, orphan cleanup, throw_facts)
+CREATE INDEX IF NOT EXISTS ix_single_round_throws_throw_1 ON single_round_throws (throw_1);
+CREATE INDEX IF NOT EXISTS ix_single_round_throws_throw_2 ON single_round_throws (throw_2);
+CREATE INDEX IF NOT EXISTS ix_single_round_throws_throw_3 ON single_round_throws (throw_3);
+CREATE INDEX IF NOT EXISTS ix_single_round_throws_throw_4 ON single_round_throws (throw_4);
+
+-- Rounds: every referenced throw must fit the game type of the round's game
+CREATE OR REPLACE FUNCTION validate_round_throw_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_throw_index INTEGER;
+    v_max_throw_index INTEGER;
+BEGIN
+    SELECT st.throw_index, gt.max_throw_index INTO v_throw_index, v_max_throw_index
+    FROM new_rounds srt
+    CROSS JOIN LATERAL (VALUES (srt.throw_1), (srt.throw_2), (srt.throw_3), (srt.throw_4)) AS rt (throw_id)
+    JOIN single_throw st ON st.id = rt.throw_id
+    JOIN games g ON g.id = srt.game_id
+    JOIN series s ON s.id = g.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE st.throw_index > gt.max_throw_index
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'throw_index (%) exceeds maximum allowed (%) for this game type',
+            v_throw_index, v_max_throw_index;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS validate_round_throw_index_insert_trigger ON single_round_throws;
+CREATE TRIGGER validate_round_throw_index_insert_trigger
+AFTER INSERT ON single_round_throws
+REFERENCING NEW TABLE AS new_rounds
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_round_throw_index();
+
+DROP TRIGGER IF EXISTS validate_round_throw_index_update_trigger ON single_round_throws;
+CREATE TRIGGER validate_round_throw_index_update_trigger
+AFTER UPDATE ON single_round_throws
+REFERENCING NEW TABLE AS new_rounds
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_round_throw_index();
+
+-- Throws edited in place: look up their rounds through the throw_N indexes
+CREATE OR REPLACE FUNCTION validate_throw_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_throw_index INTEGER;
+    v_max_throw_index INTEGER;
+BEGIN
+    SELECT nt.throw_index, gt.max_throw_index INTO v_throw_index, v_max_throw_index
+    FROM new_throws nt
+    JOIN (
+        SELECT game_id, throw_1 AS throw_id FROM single_round_throws WHERE throw_1 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_2 FROM single_round_throws WHERE throw_2 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_3 FROM single_round_throws WHERE throw_3 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_4 FROM single_round_throws WHERE throw_4 IN (SELECT id FROM new_throws)
+    ) rt ON rt.throw_id = nt.id
+    JOIN games g ON g.id = rt.game_id
+    JOIN series s ON s.id = g.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE nt.throw_index > gt.max_throw_index
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'throw_index (%) exceeds maximum allowed (%) for this game type',
+            v_throw_index, v_max_throw_index;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS validate_throw_index_trigger ON single_throw;
+CREATE TRIGGER validate_throw_index_trigger
+AFTER UPDATE ON single_throw
+REFERENCING NEW TABLE AS new_throws
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_throw_index();
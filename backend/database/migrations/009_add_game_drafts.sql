@@ -0,0 +1,9 @@
+-- Pöytäkirjaluonnokset palvelimelle: mobiililomake tallentaa yhden solun
+-- kerrallaan, ja lopullinen tallennus tehdään luonnoksesta yhdellä kertaa.
+-- cells: kentän nimi -> [arvo, version joka kirjoitti sen viimeksi]
+CREATE TABLE IF NOT EXISTS game_drafts (
+    game_id INTEGER PRIMARY KEY REFERENCES games(id) ON DELETE CASCADE,
+    cells JSONB NOT NULL DEFAULT '{}',
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,150 @@
+"""SQL statement instrumentation for the Flask and FastAPI engines.
+
+Counts the statements and database time of every request and logs slow
+statements. Request summaries go to the ``app.sql`` logger (logs/sql.log
+in the Flask app), the counts are also sent as X-DB-Query-Count and
+X-DB-Time-Ms response headers in debug mode.
+
+    DB_SLOW_QUERY_MS              statements slower than this are logged (200)
+    DB_SLOW_REQUEST_QUERIES       requests with more statements are logged (50)
+    DB_QUERY_HEADERS              send the headers outside debug mode (false)
+"""
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+
+SLOWEST_KEPT = 3
+STATEMENT_MAX_LENGTH = 300
+
+logger = logging.getLogger('app.sql')
+
+_current: ContextVar[Optional['RequestQueryStats']] = ContextVar('request_query_stats', default=None)
+
+@dataclass
+class RequestQueryStats:
+    """SQL statements executed while handling one request"""
+    count: int = 0
+    total_time: float = 0.0
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record(self, duration: float, statement: str) -> None:
+        self.count += 1
+        self.total_time += duration
+        if len(self.slowest) < SLOWEST_KEPT or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, statement[:STATEMENT_MAX_LENGTH]))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def headers(self) -> dict:
+        return {
+            'X-DB-Query-Count': str(self.count),
+            'X-DB-Time-Ms': f"{self.total_time * 1000:.1f}",
+        }
+
+    def summary(self, label: str) -> str:
+        slowest = '; '.join(f"{duration * 1000:.1f}ms {statement}" for duration, statement in self.slowest)
+        return f"{label}: {self.count} queries in {self.total_time * 1000:.1f}ms, slowest: {slowest}"
+
+def _headers_enabled() -> bool:
+    return os.getenv('DB_QUERY_HEADERS', '').lower() in ('1', 'true', 'yes')
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, '') else default
+
+def _slow_query_seconds() -> float:
+    return _env_int('DB_SLOW_QUERY_MS', 200) / 1000
+
+# The start time is kept on the execution context rather than conn.info:
+# after_cursor_execute does not fire for a failing statement, and a value
+# left on the pooled connection would outlive it.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, '_query_start_time', None)
+    if start_time is None:
+        return
+    duration = time.perf_counter() - start_time
+    stats = _current.get()
+    if stats is not None:
+        stats.record(duration, statement)
+    if duration >= _slow_query_seconds():
+        logger.warning(f"Slow query ({duration * 1000:.1f}ms): {statement[:STATEMENT_MAX_LENGTH]}")
+
+def instrument_engine(engine) -> None:
+    """Record statement timings of an engine (a sync Engine or AsyncEngine.sync_engine)"""
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+def start_request():
+    """Start collecting statistics for the current request, returns a token for finish_request"""
+    return _current.set(RequestQueryStats())
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+def finish_request(token, label: str) -> Optional[RequestQueryStats]:
+    """Stop collecting, log the request summary and return its statistics"""
+    stats = _current.get()
+    _current.reset(token)
+    if stats is None:
+        return None
+    if stats.count >= _env_int('DB_SLOW_REQUEST_QUERIES', 50) or stats.total_time >= _slow_query_seconds():
+        logger.info(stats.summary(label))
+    else:
+        logger.debug(stats.summary(label))
+    return stats
+
+def init_flask(app, engine) -> None:
+    """Collect per-request statistics in a Flask app"""
+    from flask import g, request
+
+    instrument_engine(engine)
+
+    @app.before_request
+    def _start_query_stats():
+        g.query_stats_token = start_request()
+
+    @app.after_request
+    def _finish_query_stats(response):
+        token = g.pop('query_stats_token', None)
+        if token is not None:
+            stats = finish_request(token, f"{request.method} {request.path}")
+            if app.debug or _headers_enabled():
+                response.headers.update(stats.headers())
+        return response
+
+class QueryStatsMiddleware:
+    """ASGI middleware doing the same for the FastAPI app:
+    ``app.add_middleware(QueryStatsMiddleware, headers=True)``
+    """
+    def __init__(self, app, headers: Optional[bool] = None):
+        self.app = app
+        self.show_headers = _headers_enabled() if headers is None else headers
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request()
+        stats = _current.get()
+
+        async def send_with_headers(message):
+            if message['type'] == 'http.response.start' and self.show_headers:
+                headers = list(message.get('headers', []))
+                headers.extend((key.lower().encode(), value.encode()) for key, value in stats.headers().items())
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            finish_request(token, f"{scope['method']} {scope['path']}")
@@ -176,6 +176,10 @@ CREATE TABLE single_round_throws (
 
 -- Add index for performance
 CREATE INDEX idx_single_round_throws_team_id ON single_round_throws(team_id);
+CREATE INDEX ix_single_round_throws_throw_1 ON single_round_throws(throw_1);
+CREATE INDEX ix_single_round_throws_throw_2 ON single_round_throws(throw_2);
+CREATE INDEX ix_single_round_throws_throw_3 ON single_round_throws(throw_3);
+CREATE INDEX ix_single_round_throws_throw_4 ON single_round_throws(throw_4);
 
 CREATE TABLE single_throw (
     id SERIAL PRIMARY KEY,
@@ -200,112 +204,122 @@ CREATE TABLE single_throw (
 -- 1 erän 1 heittokierros on yhden pelaajan 4 heittoa
 -- 2 erän 1 heittokierros on yhden pelaajan 4 heittoa jne
 -- Yksinkertaiset tarkistukset tietokannassa
-CREATE OR REPLACE FUNCTION validate_team_player_count()
+-- Rosterin tarkistukset yhdellä statement-tason triggerillä: henkilökohtaisen
+-- sarjan joukkueeseen ei lisätä pelaajia ja joukkueen pelaajamäärä on rajattu.
+-- Transition table sisältää kaikki lauseen lisäämät rivit, joten massalataus
+-- tarkistetaan yhdellä kyselyllä per ehto.
+CREATE OR REPLACE FUNCTION validate_roster_players()
 RETURNS TRIGGER AS $$
 DECLARE
-    v_team_player_amount INTEGER;
     v_game_type_name VARCHAR(100);
-    v_series_id INTEGER;
+    v_team_player_amount INTEGER;
 BEGIN
-    -- Get the series_id for this registration
-    SELECT series_id INTO v_series_id
-    FROM series_registrations
-    WHERE id = NEW.registration_id;
-
-    -- Get the game type details from the series
-    SELECT gt.team_player_amount, gt.name 
-    INTO v_team_player_amount, v_game_type_name
-    FROM game_types gt
-    JOIN series s ON gt.id = s.game_type_id
-    WHERE s.id = v_series_id;
-
-    -- For personal leagues (team_player_amount = 1), don't allow roster additions
-    IF v_team_player_amount = 1 THEN
-        RAISE EXCEPTION 'Cannot add players to roster in personal leagues (game type: %)', 
-            v_game_type_name;
+    -- Personal leagues don't have rosters
+    PERFORM 1
+    FROM (SELECT DISTINCT registration_id FROM new_roster) nr
+    JOIN series_registrations sr ON sr.id = nr.registration_id
+    JOIN series s ON s.id = sr.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount = 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Cannot add players to a personal league team';
     END IF;
 
-    -- For team leagues, validate the roster size
-    IF v_team_player_amount > 1 THEN
-        -- Check current roster size
-        IF (
-            SELECT COUNT(*) 
-            FROM roster_players_in_series 
-            WHERE registration_id = NEW.registration_id
-        ) >= v_team_player_amount THEN
-            RAISE EXCEPTION 'Player limit exceeded: Maximum % players allowed for game type %',
-                v_team_player_amount, v_game_type_name;
-        END IF;
+    -- Roster size, counted after the statement so the new rows are included
+    SELECT gt.team_player_amount, gt.name INTO v_team_player_amount, v_game_type_name
+    FROM (SELECT DISTINCT registration_id FROM new_roster) nr
+    JOIN series_registrations sr ON sr.id = nr.registration_id
+    JOIN series s ON s.id = sr.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    JOIN LATERAL (
+        SELECT COUNT(*) AS player_count
+        FROM roster_players_in_series r
+        WHERE r.registration_id = nr.registration_id
+    ) roster ON true
+    WHERE roster.player_count > gt.team_player_amount
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Player limit exceeded: Maximum % players allowed for game type %',
+            v_team_player_amount, v_game_type_name;
     END IF;
 
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Triggerin luominen
-CREATE TRIGGER validate_team_player_count_trigger
-BEFORE INSERT OR UPDATE ON roster_players_in_series
-FOR EACH ROW
-EXECUTE FUNCTION validate_team_player_count();
+-- Transition tables allow only one event per trigger
+CREATE TRIGGER validate_roster_players_insert_trigger
+AFTER INSERT ON roster_players_in_series
+REFERENCING NEW TABLE AS new_roster
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_roster_players();
+
+CREATE TRIGGER validate_roster_players_update_trigger
+AFTER UPDATE ON roster_players_in_series
+REFERENCING NEW TABLE AS new_roster
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_roster_players();
 
 -- Drop the old triggers first
 DROP TRIGGER IF EXISTS validate_game_teams_trigger ON games;
 DROP TRIGGER IF EXISTS validate_game_participants_trigger ON games;
 
--- Create consolidated game validation function
+-- Pelien tarkistus statement-tasolla, kaikki lauseen pelit yhdellä joinilla
 CREATE OR REPLACE FUNCTION validate_game()
 RETURNS TRIGGER AS $$
 DECLARE
-    v_game_series_id INTEGER;
-    v_team1_series_id INTEGER;
-    v_team2_series_id INTEGER;
-    v_is_cup BOOLEAN;
     v_game_series_year INTEGER;
-    v_team1_series_year INTEGER;
-    v_team2_series_year INTEGER;
 BEGIN
-    -- Get the game's series info
-    SELECT s.id, s.is_cup_league, s.year 
-    INTO v_game_series_id, v_is_cup, v_game_series_year
-    FROM series s
-    WHERE s.id = NEW.series_id;
-
-    -- Get team series info
-    SELECT s.id, s.year INTO v_team1_series_id, v_team1_series_year
-    FROM series_registrations sr
-    JOIN series s ON sr.series_id = s.id
-    WHERE sr.id = NEW.team_1_id;
-
-    SELECT s.id, s.year INTO v_team2_series_id, v_team2_series_year
-    FROM series_registrations sr
-    JOIN series s ON sr.series_id = s.id
-    WHERE sr.id = NEW.team_2_id;
-
     -- Basic check that teams are different
-    IF NEW.team_1_id = NEW.team_2_id THEN
+    PERFORM 1 FROM new_games WHERE team_1_id = team_2_id;
+    IF FOUND THEN
         RAISE EXCEPTION 'Team cannot play against itself';
     END IF;
 
     -- Check years match for all participants
-    IF v_team1_series_year != v_game_series_year OR v_team2_series_year != v_game_series_year THEN
+    SELECT s.year INTO v_game_series_year
+    FROM new_games g
+    JOIN series s ON s.id = g.series_id
+    JOIN series_registrations sr1 ON sr1.id = g.team_1_id
+    JOIN series s1 ON s1.id = sr1.series_id
+    JOIN series_registrations sr2 ON sr2.id = g.team_2_id
+    JOIN series s2 ON s2.id = sr2.series_id
+    WHERE s1.year != s.year OR s2.year != s.year
+    LIMIT 1;
+
+    IF FOUND THEN
         RAISE EXCEPTION 'Teams must be from the same year as the game series (year: %)', v_game_series_year;
     END IF;
 
     -- For non-cup series, teams must be from the same series as the game
-    IF NOT v_is_cup THEN
-        IF v_team1_series_id != NEW.series_id OR v_team2_series_id != NEW.series_id THEN
-            RAISE EXCEPTION 'Teams must be from the same series as the game in non-cup series';
-        END IF;
+    PERFORM 1
+    FROM new_games g
+    JOIN series s ON s.id = g.series_id
+    JOIN series_registrations sr1 ON sr1.id = g.team_1_id
+    JOIN series_registrations sr2 ON sr2.id = g.team_2_id
+    WHERE NOT s.is_cup_league
+      AND (sr1.series_id != g.series_id OR sr2.series_id != g.series_id);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Teams must be from the same series as the game in non-cup series';
     END IF;
 
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Create single trigger for game validation
-CREATE TRIGGER validate_game_trigger
-BEFORE INSERT OR UPDATE ON games
-FOR EACH ROW
+CREATE TRIGGER validate_game_insert_trigger
+AFTER INSERT ON games
+REFERENCING NEW TABLE AS new_games
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_game();
+
+CREATE TRIGGER validate_game_update_trigger
+AFTER UPDATE ON games
+REFERENCING NEW TABLE AS new_games
+FOR EACH STATEMENT
 EXECUTE FUNCTION validate_game();
 
 -- Create a view that combines both team and personal registrations
@@ -335,57 +349,125 @@ WHERE
     (game_type.team_player_amount > 1 AND registration.team_name IS NOT NULL) OR
     (game_type.team_player_amount = 1 AND registration.team_name IS NULL);
 
-CREATE OR REPLACE FUNCTION validate_roster_for_personal_league()
+-- Ilmoittautumisen tyyppi (joukkue vs henkilökohtainen) statement-tasolla
+CREATE OR REPLACE FUNCTION validate_registration_type()
 RETURNS TRIGGER AS $$
 BEGIN
-    -- Tarkista, onko joukkue henkilökohtainen sarja
-    IF (SELECT gt.team_player_amount
-        FROM game_types gt
-        JOIN series s ON gt.id = s.game_type_id
-        JOIN series_registrations t ON s.id = t.series_id
-        WHERE t.id = NEW.registration_id) = 1 THEN
-        RAISE EXCEPTION 'Cannot add players to a personal league team';
+    -- Team league validation
+    PERFORM 1
+    FROM new_registrations r
+    JOIN series s ON s.id = r.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount > 1
+      AND (r.team_name IS NULL OR r.team_abbreviation IS NULL);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Team leagues require team name and abbreviation';
+    END IF;
+
+    -- Personal league validation
+    PERFORM 1
+    FROM new_registrations r
+    JOIN series s ON s.id = r.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE gt.team_player_amount <= 1
+      AND (r.team_name IS NOT NULL OR r.team_abbreviation IS NOT NULL);
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Personal leagues cannot have team name or abbreviation';
     END IF;
-    RETURN NEW;
+
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER validate_roster_for_personal_league_trigger
-BEFORE INSERT OR UPDATE ON roster_players_in_series
-FOR EACH ROW
-EXECUTE FUNCTION validate_roster_for_personal_league();
+CREATE TRIGGER validate_registration_type_insert_trigger
+AFTER INSERT ON series_registrations
+REFERENCING NEW TABLE AS new_registrations
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_registration_type();
+
+CREATE TRIGGER validate_registration_type_update_trigger
+AFTER UPDATE ON series_registrations
+REFERENCING NEW TABLE AS new_registrations
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_registration_type();
+
+-- throw_index tarkistetaan kierroksen puolelta, kun kierros liitetään
+-- heittoihin, ja heittojen throw_index-muutoksille erikseen (ks. 008).
+-- Rounds: every referenced throw must fit the game type of the round's game
+CREATE OR REPLACE FUNCTION validate_round_throw_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_throw_index INTEGER;
+    v_max_throw_index INTEGER;
+BEGIN
+    SELECT st.throw_index, gt.max_throw_index INTO v_throw_index, v_max_throw_index
+    FROM new_rounds srt
+    CROSS JOIN LATERAL (VALUES (srt.throw_1), (srt.throw_2), (srt.throw_3), (srt.throw_4)) AS rt (throw_id)
+    JOIN single_throw st ON st.id = rt.throw_id
+    JOIN games g ON g.id = srt.game_id
+    JOIN series s ON s.id = g.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE st.throw_index > gt.max_throw_index
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'throw_index (%) exceeds maximum allowed (%) for this game type',
+            v_throw_index, v_max_throw_index;
+    END IF;
 
--- Add validation trigger function
-CREATE OR REPLACE FUNCTION validate_registration_type()
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER validate_round_throw_index_insert_trigger
+AFTER INSERT ON single_round_throws
+REFERENCING NEW TABLE AS new_rounds
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_round_throw_index();
+
+CREATE TRIGGER validate_round_throw_index_update_trigger
+AFTER UPDATE ON single_round_throws
+REFERENCING NEW TABLE AS new_rounds
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_round_throw_index();
+
+-- Throws edited in place: look up their rounds through the throw_N indexes
+CREATE OR REPLACE FUNCTION validate_throw_index()
 RETURNS TRIGGER AS $$
 DECLARE
-    v_team_player_amount INTEGER;
+    v_throw_index INTEGER;
+    v_max_throw_index INTEGER;
 BEGIN
-    -- Get the team_player_amount for this registration's series
-    SELECT gt.team_player_amount INTO v_team_player_amount
-    FROM series s
-    JOIN game_types gt ON s.game_type_id = gt.id
-    WHERE s.id = NEW.series_id;
-
-    -- Validate based on game type
-    IF v_team_player_amount > 1 THEN
-        -- Team league validation
-        IF NEW.team_name IS NULL OR NEW.team_abbreviation IS NULL THEN
-            RAISE EXCEPTION 'Team leagues require team name and abbreviation';
-        END IF;
-    ELSE
-        -- Personal league validation
-        IF NEW.team_name IS NOT NULL OR NEW.team_abbreviation IS NOT NULL THEN
-            RAISE EXCEPTION 'Personal leagues cannot have team name or abbreviation';
-        END IF;
+    SELECT nt.throw_index, gt.max_throw_index INTO v_throw_index, v_max_throw_index
+    FROM new_throws nt
+    JOIN (
+        SELECT game_id, throw_1 AS throw_id FROM single_round_throws WHERE throw_1 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_2 FROM single_round_throws WHERE throw_2 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_3 FROM single_round_throws WHERE throw_3 IN (SELECT id FROM new_throws)
+        UNION ALL
+        SELECT game_id, throw_4 FROM single_round_throws WHERE throw_4 IN (SELECT id FROM new_throws)
+    ) rt ON rt.throw_id = nt.id
+    JOIN games g ON g.id = rt.game_id
+    JOIN series s ON s.id = g.series_id
+    JOIN game_types gt ON gt.id = s.game_type_id
+    WHERE nt.throw_index > gt.max_throw_index
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'throw_index (%) exceeds maximum allowed (%) for this game type',
+            v_throw_index, v_max_throw_index;
     END IF;
 
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Create trigger
-CREATE TRIGGER validate_registration_type_trigger
-BEFORE INSERT OR UPDATE ON series_registrations
-FOR EACH ROW
-EXECUTE FUNCTION validate_registration_type();
\ No newline at end of file
+CREATE TRIGGER validate_throw_index_trigger
+AFTER UPDATE ON single_throw
+REFERENCING NEW TABLE AS new_throws
+FOR EACH STATEMENT
+EXECUTE FUNCTION validate_throw_index();
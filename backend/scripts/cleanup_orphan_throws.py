@@ -0,0 +1,21 @@
+import sys
+import os
+import argparse
+
+# Add the parent directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app, db
+from app.services.throw_service import ThrowService
+
+def run_cleanup(batch_size):
+    with app.app_context():
+        print("Deleting orphaned throws...")
+        deleted = ThrowService().delete_orphan_throws(db.session, batch_size=batch_size)
+        print(f"Deleted {deleted} orphaned throws")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete single_throw rows not referenced by any round")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    run_cleanup(args.batch_size)
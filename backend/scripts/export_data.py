@@ -0,0 +1,26 @@
+import sys
+import os
+import argparse
+
+# Add the parent directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app, db
+from app.services.export_service import export_to_file, EXPORT_QUERIES, EXPORT_FORMATS
+
+def run_export(dataset, path, file_format, series_id, year):
+    with app.app_context():
+        print(f"Exporting {dataset} to {path}...")
+        with open(path, 'wb') as target:
+            count = export_to_file(db.session, dataset, target, file_format, series_id=series_id, year=year)
+        print(f"Exported {count} rows")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream throws or games to a CSV or Parquet file")
+    parser.add_argument("dataset", choices=sorted(EXPORT_QUERIES))
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--series-id", type=int)
+    parser.add_argument("--year", type=int)
+    args = parser.parse_args()
+    run_export(args.dataset, args.file, args.format, args.series_id, args.year)
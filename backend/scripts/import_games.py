@@ -0,0 +1,27 @@
+import sys
+import os
+import argparse
+
+# Add the parent directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app, db
+from app.services.import_service import GameImportService
+
+def run_import(path, file_format, batch_size):
+    with app.app_context():
+        print(f"Importing games from {path}...")
+        with open(path, newline='', encoding='utf-8') as stream:
+            summary = GameImportService(batch_size=batch_size).import_file(db.session, stream, file_format)
+        print(f"Imported {summary['games']} games, {summary['rounds']} rounds and {summary['throws']} throws")
+        for line, error in summary['errors']:
+            print(f"  line {line}: {error}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import game results and throws from a CSV or JSON file")
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=("csv", "json"), help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    file_format = args.format or os.path.splitext(args.file)[1].lstrip('.').lower().replace('jsonl', 'json')
+    run_import(args.file, file_format, args.batch_size)
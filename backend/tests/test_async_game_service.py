@@ -0,0 +1,149 @@
+import pytest
+import pytest_asyncio
+from datetime import date
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from app.models.models import Base, Series, SeriesRegistration, SeriesStanding, SingleRoundThrow, SingleThrow, ThrowFact
+from app.models.schemas import GameCreate, GameDetail, Game as GameSchema, LiveThrowCreate, ThrowCorrection
+from app.services import game_service
+
+@pytest_asyncio.fixture
+async def game_db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(Series(id=1, name="OKL", year=2024, game_type_id=3))
+        session.add_all([
+            SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+            SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB"),
+        ])
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+def _game_data(**overrides):
+    data = dict(round="1", series_id=1, game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                score_1_1=-10, score_1_2=5, score_2_1=-20, score_2_2=-3)
+    data.update(overrides)
+    return GameCreate(**data)
+
+async def _points(db, registration_id):
+    standing = await db.get(SeriesStanding, (1, registration_id), populate_existing=True)
+    return standing.points
+
+@pytest.mark.asyncio
+async def test_create_and_get_game(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+    game_db.add(SingleRoundThrow(game_id=game_id, game_set_index=1, throw_position=1, home_team=True, team_id=1))
+    await game_db.commit()
+
+    loaded = GameDetail.model_validate(await game_service.get_game(game_db, game_id))
+
+    assert loaded.type_id == 3
+    assert loaded.team_1.team_name == "Team A"
+    assert len(loaded.throw_rounds) == 1
+    assert await _points(game_db, 1) == 2
+
+@pytest.mark.asyncio
+async def test_list_games_serializes_without_lazy_loads(game_db):
+    await game_service.create_game(game_db, _game_data())
+    await game_service.create_game(game_db, _game_data(round="2"))
+    game_db.expunge_all()
+
+    games = await game_service.list_games(game_db, limit=10, series_id=1)
+
+    assert [GameSchema.model_validate(game).team_2.team_abbreviation for game in games] == ["TB", "TB"]
+
+@pytest.mark.asyncio
+async def test_update_game_moves_standings(game_db):
+    game = await game_service.create_game(game_db, _game_data())
+
+    updated = await game_service.update_game(game_db, game.id, _game_data(score_2_1=10))
+
+    assert updated.score_2_1 == 10
+    assert await _points(game_db, 1) == 0
+    assert await _points(game_db, 2) == 2
+
+@pytest.mark.asyncio
+async def test_delete_game(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+    await game_service.append_throw(game_db, game_id, _live_throw())
+    await game_service.append_throw(game_db, game_id, _live_throw(round_throw_number=3, value="H"))
+
+    assert await game_service.delete_game(game_db, game_id) is True
+    assert await game_service.get_game(game_db, game_id) is None
+    assert (await game_db.execute(select(SingleRoundThrow))).scalars().all() == []
+    assert (await game_db.execute(select(SingleThrow))).scalars().all() == []
+    assert (await game_db.execute(select(ThrowFact))).scalars().all() == []
+    assert await _points(game_db, 1) == 0
+    assert await game_service.delete_game(game_db, game_id) is False
+
+def _live_throw(**overrides):
+    data = dict(game_set_index=1, throw_round=1, is_home_team=True, round_throw_number=1, player_id=1, value="3")
+    data.update(overrides)
+    return LiveThrowCreate(**data)
+
+@pytest.mark.asyncio
+async def test_append_throw_returns_round_and_set_totals(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+
+    await game_service.append_throw(game_db, game_id, _live_throw())
+    await game_service.append_throw(game_db, game_id, _live_throw(round_throw_number=2, value="H"))
+    await game_service.append_throw(game_db, game_id, _live_throw(throw_round=2, value="5"))
+    totals = await game_service.append_throw(game_db, game_id, _live_throw(is_home_team=False, value="E"))
+
+    assert [(r['throw_round'], r['is_home_team'], r['score'], r['throw_count']) for r in totals['rounds']] == [
+        (1, True, 3, 2), (1, False, 1, 1), (2, True, 5, 1)
+    ]
+    assert totals['sets'] == [
+        {'game_set_index': 1, 'is_home_team': True, 'score': 8},
+        {'game_set_index': 1, 'is_home_team': False, 'score': 1},
+    ]
+    rounds = (await game_db.execute(select(SingleRoundThrow))).scalars().all()
+    assert len(rounds) == 3
+    assert [(r.throw_position, r.team_id) for r in rounds] == [(1, 1), (2, 1), (1, 2)]
+
+@pytest.mark.asyncio
+async def test_append_throw_corrects_stored_throw(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+    await game_service.append_throw(game_db, game_id, _live_throw())
+
+    totals = await game_service.append_throw(game_db, game_id, _live_throw(value="7"))
+
+    assert totals['sets'][0]['score'] == 7
+    assert (await game_db.execute(select(func.count(SingleThrow.id)))).scalar() == 1
+
+@pytest.mark.asyncio
+async def test_append_throw_rejects_invalid_value(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+
+    with pytest.raises(ValueError):
+        await game_service.append_throw(game_db, game_id, _live_throw(value="X"))
+    assert await game_service.append_throw(game_db, 999, _live_throw()) is None
+
+@pytest.mark.asyncio
+async def test_correct_throw_updates_one_row_and_returns_set_totals(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+    await game_service.append_throw(game_db, game_id, _live_throw())
+    await game_service.append_throw(game_db, game_id, _live_throw(round_throw_number=2, value="2"))
+    await game_service.append_throw(game_db, game_id, _live_throw(game_set_index=2, value="4"))
+    throw_ids = (await game_db.execute(select(SingleThrow.id).order_by(SingleThrow.id))).scalars().all()
+
+    totals = await game_service.correct_throw(
+        game_db, game_id, 1, 1, True, 2, ThrowCorrection(value="H", player_id=2)
+    )
+
+    assert totals['sets'] == [{'game_set_index': 1, 'is_home_team': True, 'score': 3}]
+    assert (await game_db.execute(select(SingleThrow.id).order_by(SingleThrow.id))).scalars().all() == throw_ids
+    fact = (await game_db.execute(select(ThrowFact).where(ThrowFact.throw_id == throw_ids[1]))).scalar_one()
+    assert (fact.throw_score, fact.player_id) == (0, 2)
+
+@pytest.mark.asyncio
+async def test_correct_missing_throw_returns_none(game_db):
+    game_id = (await game_service.create_game(game_db, _game_data())).id
+    await game_service.append_throw(game_db, game_id, _live_throw())
+
+    assert await game_service.correct_throw(game_db, game_id, 1, 1, True, 3, ThrowCorrection(value="1")) is None
+    with pytest.raises(ValueError):
+        await game_service.correct_throw(game_db, game_id, 1, 1, True, 1, ThrowCorrection(value="99"))
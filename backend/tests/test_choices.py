@@ -0,0 +1,118 @@
+import pytest
+from types import SimpleNamespace
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.models.models import Base, GameType, Player, Series, SeriesRegistration, RosterPlayersInSeries
+from app.utils import choices
+from app.utils.choices_cache import invalidate_choices
+
+@pytest.fixture
+def choices_session(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        GameType(id=1, name="Pari", team_player_amount=2),
+        Series(id=1, name="OKL", year=2024, game_type_id=1),
+        Series(id=2, name="OKL", year=2023, game_type_id=1),
+        SeriesRegistration(id=1, series_id=1, team_name="Team A"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B"),
+        SeriesRegistration(id=3, series_id=2, team_name="Team C"),
+        Player(id=1, name="Matti", email="matti@example.com"),
+        Player(id=2, name="Teppo", email="teppo@example.com"),
+        RosterPlayersInSeries(registration_id=1, player_id=1),
+        RosterPlayersInSeries(registration_id=1, player_id=2),
+    ])
+    session.commit()
+    monkeypatch.setattr(choices, "db", SimpleNamespace(session=session))
+    invalidate_choices()
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    with app.app_context():
+        yield session, statements
+    session.close()
+    engine.dispose()
+
+def test_team_choices_single_query(choices_session):
+    session, statements = choices_session
+
+    result = choices.get_team_choices_with_player_count()
+
+    assert result == [
+        ("OKL 2024", [("1", "Team A (2/2)"), ("2", "Team B (0/2)")]),
+        ("OKL 2023", [("3", "Team C (0/2)")]),
+    ]
+    assert len(statements) == 1
+
+def test_team_choices_cached_until_roster_changes(choices_session):
+    session, statements = choices_session
+    choices.get_team_choices_with_player_count()
+    choices.get_team_choices_with_player_count()
+    assert len(statements) == 1
+
+    session.add(RosterPlayersInSeries(registration_id=2, player_id=1))
+    session.commit()
+
+    result = dict(choices.get_team_choices_with_player_count())
+    assert ("2", "Team B (1/2)") in result["OKL 2024"]
+
+def test_game_type_choices_single_query(choices_session):
+    session, statements = choices_session
+    session.add(GameType(id=2, name="Joukkue", team_player_amount=8))
+    session.commit()
+    statements.clear()
+
+    game_types, default = choices.get_game_type_choices()
+    assert choices.get_game_type_choices() == (game_types, default)
+    assert sorted(game_types) == [("1", "Pari"), ("2", "Joukkue")]
+    assert default == "2"
+    assert len(statements) == 1
+
+def test_player_choices_invalidated_on_update(choices_session):
+    session, statements = choices_session
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo", "teppo@example.com")]
+
+    session.get(Player, 2).name = "Teppo Testaaja"
+    session.commit()
+
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo Testaaja", "teppo@example.com")]
+
+def test_player_choices_invalidated_on_commit_only(choices_session):
+    session, statements = choices_session
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo", "teppo@example.com")]
+
+    session.get(Player, 2).name = "Teppo Testaaja"
+    session.flush()
+    # A flushed but uncommitted change must not be cached by another reader
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo", "teppo@example.com")]
+    session.rollback()
+    queries = len(statements)
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo", "teppo@example.com")]
+    assert len(statements) == queries
+
+    session.get(Player, 2).name = "Teppo Testaaja"
+    session.commit()
+    assert choices.get_player_choices_with_contact() == [(1, "Matti", "matti@example.com"), (2, "Teppo Testaaja", "teppo@example.com")]
+
+def test_participant_choices_cached_per_series(choices_session):
+    session, statements = choices_session
+
+    assert choices.get_series_participant_choices(1) == [("1", "Team A"), ("2", "Team B")]
+    assert choices.get_series_participant_choices(2) == [("3", "Team C")]
+    queries = len(statements)
+    assert choices.get_series_participant_choices(1) == [("1", "Team A"), ("2", "Team B")]
+    assert len(statements) == queries
+
+    session.delete(session.get(SeriesRegistration, 2))
+    session.commit()
+    assert choices.get_series_participant_choices(1) == [("1", "Team A")]
+
+def test_registration_choices_errors_are_not_cached(choices_session, monkeypatch):
+    session, statements = choices_session
+    monkeypatch.setattr(choices, "db", None)
+    assert choices.get_registration_choices() == [('', 'Error loading registrations')]
+
+    monkeypatch.setattr(choices, "db", SimpleNamespace(session=session))
+    assert choices.get_registration_choices()[0] == ("1", "Team A (OKL 2024)")
@@ -0,0 +1,64 @@
+from database.config import (
+    async_database_url, sync_database_url, async_engine_options, sync_engine_options
+)
+
+def test_urls_from_db_variables(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setenv("DB_USER", "kyykka")
+    monkeypatch.setenv("DB_PASSWORD", "secret")
+    monkeypatch.setenv("DB_HOST", "db")
+    monkeypatch.setenv("DB_PORT", "5433")
+    monkeypatch.setenv("DB_NAME", "kanta")
+
+    assert async_database_url().render_as_string(hide_password=False) == \
+        "postgresql+asyncpg://kyykka:secret@db:5433/kanta"
+    assert sync_database_url().render_as_string(hide_password=False) == \
+        "postgresql+psycopg2://kyykka:secret@db:5433/kanta"
+
+def test_database_url_overrides_driver(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@localhost/x")
+    assert sync_database_url().drivername == "postgresql+psycopg2"
+
+def test_engine_options_defaults(monkeypatch):
+    for name in ("DB_ECHO", "DB_POOL_SIZE", "DB_STATEMENT_TIMEOUT_MS", "DB_STATEMENT_CACHE_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@localhost/x")
+
+    options = async_engine_options(async_database_url())
+
+    assert options["echo"] is False
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == 5
+    assert options["connect_args"] == {
+        "statement_cache_size": 100,
+        "server_settings": {"statement_timeout": "30000"},
+    }
+    assert sync_engine_options(sync_database_url())["connect_args"] == {"options": "-c statement_timeout=30000"}
+
+def test_engine_options_from_env(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@localhost/x")
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_ECHO", "true")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "0")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "0")
+
+    options = async_engine_options(async_database_url())
+
+    assert (options["pool_size"], options["echo"]) == (20, True)
+    assert options["connect_args"] == {"statement_cache_size": 0}
+    assert "connect_args" not in sync_engine_options(sync_database_url())
+
+def test_sqlite_skips_pool_sizing(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
+
+    options = async_engine_options(async_database_url())
+
+    assert async_database_url().drivername == "sqlite+aiosqlite"
+    assert "pool_size" not in options and "connect_args" not in options
+
+def test_sqlite_url_gets_driver_per_app(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///./bench.db")
+
+    assert async_database_url().drivername == "sqlite+aiosqlite"
+    assert sync_database_url().drivername == "sqlite"
+    assert sync_database_url().database == "./bench.db"
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.models.models import Base, Player, Series, SeriesRegistration
+from app.utils.display import prefetch_display_lookups, format_team_name, format_series_name
+
+@pytest.fixture
+def display_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Player(id=1, name="Matti", email="matti@example.com"),
+        Series(id=1, name="OKL", year=2024, game_type_id=1),
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+        SeriesRegistration(id=2, series_id=1, contact_player_id=1),
+    ])
+    session.commit()
+    session.expunge_all()
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    yield session, statements
+    session.close()
+    engine.dispose()
+
+def test_formatters_use_prefetched_rows(display_session):
+    session, statements = display_session
+    with app.test_request_context():
+        prefetch_display_lookups(session, team_ids=[1, 2, 1, 3], series_ids=[1])
+        assert len(statements) == 2
+
+        names = [format_team_name(session, team_id) for team_id in (1, 2, 3)]
+        series = format_series_name(session, 1)
+
+    assert names == ["Team A (TA)", "Matti", ""]
+    assert series == "OKL (2024)"
+    assert len(statements) == 2
+
+def test_formatters_without_request_context(display_session):
+    session, statements = display_session
+    assert format_team_name(session, 1) == "Team A (TA)"
+    assert len(statements) == 1
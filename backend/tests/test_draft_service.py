@@ -0,0 +1,91 @@
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from app.models.models import (
+    Base, GameType, Series, SeriesRegistration, Game, GameDraft, SingleRoundThrow, ThrowFact
+)
+from app.services.draft_service import DraftService
+from app.services.game_service import GameService
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(GameType(id=1, name="Pari", team_player_amount=2, game_player_amount=2, throw_round_amount=4))
+    session.add(Series(id=1, name="OKL", year=2024, game_type_id=1))
+    session.add_all([
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB"),
+    ])
+    session.add(Game(id=1, series_id=1, round="1", game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                     score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def test_patch_creates_and_merges_draft(session):
+    drafts = DraftService()
+
+    first = drafts.patch_draft(session, 1, {'set_1_round_1_team_1_throw_1': '3'})
+    second = drafts.patch_draft(session, 1, {'set_1_round_1_team_1_throw_2': 'H'}, base_version=first['version'])
+
+    assert second['version'] == 2
+    assert second['conflicts'] == []
+    assert drafts.get_cells(session, 1) == {
+        'set_1_round_1_team_1_throw_1': '3',
+        'set_1_round_1_team_1_throw_2': 'H',
+    }
+
+def test_stale_patch_reports_conflicting_cells(session):
+    drafts = DraftService()
+    drafts.patch_draft(session, 1, {'set_1_round_1_team_1_throw_1': '3'})
+    drafts.patch_draft(session, 1, {'set_1_round_1_team_1_throw_1': '4', 'score_1_1': '-5'}, base_version=1)
+
+    # Another device still at version 1
+    merged = drafts.patch_draft(session, 1, {'set_1_round_1_team_1_throw_1': '5', 'score_2_1': '2'}, base_version=1)
+
+    assert merged['conflicts'] == [{'field': 'set_1_round_1_team_1_throw_1', 'value': '4'}]
+    assert merged['cells'] == {'set_1_round_1_team_1_throw_1': '5', 'score_1_1': '-5', 'score_2_1': '2'}
+
+def test_patch_rejects_unknown_fields(session):
+    with pytest.raises(ValueError):
+        DraftService().patch_draft(session, 1, {'csrf_token': 'x'})
+
+def test_promote_draft_saves_throws_and_removes_draft(session):
+    cells = {'score_1_1': '-4'}
+    for team in (1, 2):
+        cells[f'set_1_round_1_team_{team}_player_1'] = '1'
+        cells[f'set_1_round_1_team_{team}_player_2'] = '2'
+        for i, value in enumerate(['3', 'H', '2', 'E'], 1):
+            cells[f'set_1_round_1_team_{team}_throw_{i}'] = value
+    DraftService().patch_draft(session, 1, cells)
+    session.commit()
+
+    assert GameService().promote_draft(session, 1) is True
+
+    assert session.get(Game, 1).score_1_1 == -4
+    assert session.scalars(select(SingleRoundThrow)).all()[0].team_id == 1
+    assert len(session.scalars(select(ThrowFact)).all()) == 8
+    assert session.get(GameDraft, 1) is None
+    assert GameService().promote_draft(session, 1) is False
+
+def test_promote_partial_draft_edits_stored_round(session):
+    cells = {'set_1_round_1_team_1_player_1': '1', 'set_1_round_1_team_1_player_2': '2'}
+    for i, value in enumerate(['3', 'H', '2', 'E'], 1):
+        cells[f'set_1_round_1_team_1_throw_{i}'] = value
+    DraftService().patch_draft(session, 1, cells)
+    GameService().promote_draft(session, 1)
+
+    DraftService().patch_draft(session, 1, {'set_1_round_1_team_1_throw_1': '5'})
+    session.commit()
+    assert GameService().promote_draft(session, 1) is True
+    session.expire_all()
+
+    round_throw = session.scalars(select(SingleRoundThrow)).one()
+    assert round_throw.throws_1.throw_score == 5
+    assert (round_throw.throws_2.throw_score, round_throw.throws_3.throw_score) == (0, 2)
+    assert (round_throw.throws_1.player_id, round_throw.throws_3.player_id) == (1, 2)
+    assert session.get(GameDraft, 1) is None
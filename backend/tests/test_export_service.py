@@ -0,0 +1,92 @@
+import csv
+import io
+import pytest
+import pytest_asyncio
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base, Game, Player, Series, SeriesRegistration
+from app.services import export_service
+from app.services.throw_service import ThrowService
+
+def _seed(session):
+    session.add_all([
+        Series(id=1, name="OKL", year=2024, game_type_id=1),
+        Series(id=2, name="OKL", year=2023, game_type_id=1),
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB"),
+        Player(id=1, name="Matti", email="matti@example.com"),
+        Player(id=2, name="Teppo", email="teppo@example.com"),
+        Game(id=1, series_id=1, game_date=date(2024, 1, 6), round="1", team_1_id=1, team_2_id=2,
+             score_1_1=-10, score_1_2=5, score_2_1=-20, score_2_2=-3),
+        Game(id=2, series_id=2, game_date=date(2023, 1, 6), round="1", team_1_id=1, team_2_id=2,
+             score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0),
+    ])
+    session.flush()
+
+def _rows(data: bytes):
+    return list(csv.DictReader(io.StringIO(data.decode('utf-8'))))
+
+@pytest.fixture
+def export_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    _seed(session)
+    ThrowService().insert_game_rounds(session, [(1, {
+        'game_set_index': 1, 'throw_round': 1, 'is_home_team': True, 'team_id': 1,
+        'player_1_id': 1, 'player_2_id': 2, 'throws': ['10', 'H', 'F', '2'],
+    })])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def test_throws_csv_export(export_session, monkeypatch):
+    monkeypatch.setattr(export_service, 'EXPORT_BATCH_SIZE', 3)
+    target = io.BytesIO()
+
+    count = export_service.export_to_file(export_session, 'throws', target)
+
+    rows = _rows(target.getvalue())
+    assert count == len(rows) == 4
+    assert [row['throw_type'] for row in rows] == ['VALID', 'HAUKI', 'FAULT', 'VALID']
+    assert rows[0]['player_name'] == 'Matti' and rows[2]['player_name'] == 'Teppo'
+    assert {row['team_abbreviation'] for row in rows} == {'TA'}
+    assert [row['round_throw_number'] for row in rows] == ['1', '2', '3', '4']
+
+def test_games_export_filters_by_year(export_session):
+    target = io.BytesIO()
+
+    export_service.export_to_file(export_session, 'games', target, year=2023)
+
+    rows = _rows(target.getvalue())
+    assert [row['game_id'] for row in rows] == ['2']
+    assert (rows[0]['team_1_abbreviation'], rows[0]['team_2_abbreviation']) == ('TA', 'TB')
+
+def test_empty_export_writes_header(export_session):
+    target = io.BytesIO()
+
+    assert export_service.export_to_file(export_session, 'games', target, series_id=99) == 0
+    assert target.getvalue().decode('utf-8').startswith('game_id,game_date')
+
+def test_unknown_dataset_and_format(export_session):
+    with pytest.raises(ValueError):
+        export_service.export_query('players')
+    with pytest.raises(ValueError):
+        export_service.export_to_file(export_session, 'games', io.BytesIO(), 'xlsx')
+
+@pytest.mark.asyncio
+async def test_async_stream_export():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        await session.run_sync(_seed)
+        await session.commit()
+
+        chunks = [chunk async for chunk in export_service.stream_export(session, 'games')]
+
+    assert [row['game_id'] for row in _rows(b''.join(chunks))] == ['1', '2']
+    await engine.dispose()
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base
+from app.services.throw_service import ThrowService
+from app.utils.game_utils import load_game_round_throws, build_throw_field_values
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def seeded_session(sqlite_engine):
+    session = sessionmaker(bind=sqlite_engine)()
+    entries = [
+        {'game_set_index': set_index, 'throw_round': round_num, 'is_home_team': is_home,
+         'team_id': 1 if is_home else 2, 'player_1_id': '1', 'player_2_id': '2',
+         'throws': ["10", "H", "F", "E"]}
+        for set_index in [1, 2] for round_num in range(1, 5) for is_home in [True, False]
+    ]
+    ThrowService().save_game_throws(session, 1, entries)
+    session.commit()
+    session.expunge_all()
+    yield session
+    session.close()
+
+def test_load_game_round_throws_single_query(sqlite_engine, seeded_session):
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    round_throws = load_game_round_throws(seeded_session, 1)
+    values = build_throw_field_values(round_throws)
+
+    assert len(round_throws) == 16
+    assert len(statements) == 1
+    assert len(values) == 16 * 6
+
+def test_build_throw_field_values(seeded_session):
+    values = build_throw_field_values(load_game_round_throws(seeded_session, 1))
+
+    assert values['set_1_round_1_team_1_player_1'] == '1'
+    assert values['set_2_round_4_team_2_player_2'] == '2'
+    assert values['set_1_round_3_team_2_throw_1'] == '10'
+    assert values['set_1_round_3_team_2_throw_2'] == 'H'
+    assert values['set_1_round_3_team_2_throw_3'] == 'F'
+    assert values['set_1_round_3_team_2_throw_4'] == 'E'
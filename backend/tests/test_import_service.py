@@ -0,0 +1,127 @@
+import io
+import json
+import pytest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.models import (
+    Base, Game, GameType, Player, Series, SeriesRegistration, SeriesStanding, SingleRoundThrow, SingleThrow, ThrowType
+)
+from app.services.import_service import GameImportService, read_csv_games, read_json_games
+
+CSV_HEADER = ("series_id,game_date,round,is_playoff,team_1,team_2,score_1_1,score_1_2,score_2_1,score_2_2,"
+              "set,throw_round,team,player_1,player_2,throw_1,throw_2,throw_3,throw_4\n")
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(GameType(id=1, name="Henkilökohtainen", team_player_amount=2, throw_round_amount=4))
+    session.add(Series(id=1, name="OKL", year=2024, game_type_id=1))
+    session.add_all([
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB"),
+        Player(id=1, name="Matti", email="matti@example.com"),
+        Player(id=2, name="Teppo", email="teppo@example.com"),
+        Player(id=3, name="Liisa", email="liisa@example.com"),
+        Player(id=4, name="Liisa", email="liisa2@example.com"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def _game(round_name="1", rounds=None, **overrides):
+    return {
+        'series_id': 1, 'game_date': '2024-01-06', 'round': round_name, 'is_playoff': False,
+        'team_1': 'TA', 'team_2': 'Team B',
+        'score_1_1': -10, 'score_1_2': 5, 'score_2_1': -20, 'score_2_2': -3,
+        'rounds': rounds if rounds is not None else [
+            {'set': 1, 'throw_round': 1, 'team': 1, 'player_1': 'Matti', 'player_2': 'teppo',
+             'throws': ['10', 'H', 'F', '']},
+        ],
+        **overrides,
+    }
+
+def test_read_csv_groups_rows_per_game():
+    stream = io.StringIO(
+        CSV_HEADER
+        + "1,2024-01-06,1,,TA,TB,0,0,0,0,1,1,1,Matti,Teppo,1,2,3,4\n"
+        + "1,2024-01-06,1,,TA,TB,0,0,0,0,1,1,2,Matti,Teppo,H,H,H,H\n"
+        + "1,2024-01-06,2,,TA,TB,0,0,0,0,,,,,,,,,\n"
+    )
+    games = list(read_csv_games(stream))
+
+    assert [game['round'] for game in games] == ['1', '2']
+    assert [r['throws'] for r in games[0]['rounds']] == [['1', '2', '3', '4'], ['H', 'H', 'H', 'H']]
+    assert games[1]['rounds'] == []
+
+def test_read_json_accepts_array_and_lines():
+    records = [_game('1'), _game('2')]
+    assert len(list(read_json_games(io.StringIO(json.dumps(records))))) == 2
+    lines = "\n".join(json.dumps(record) for record in records) + "\n"
+    assert [game['round'] for game in read_json_games(io.StringIO(lines))] == ['1', '2']
+
+def test_import_writes_games_throws_and_standings(sqlite_session):
+    summary = GameImportService(batch_size=1).import_records(sqlite_session, [_game('1'), _game('2')])
+
+    assert summary == {'games': 2, 'rounds': 2, 'throws': 8, 'errors': []}
+    game = sqlite_session.query(Game).filter_by(round='1').one()
+    assert (game.team_1_id, game.team_2_id, game.game_date) == (1, 2, date(2024, 1, 6))
+    round_throw = sqlite_session.query(SingleRoundThrow).filter_by(game_id=game.id).one()
+    throw_1 = sqlite_session.get(SingleThrow, round_throw.throw_1)
+    throw_2 = sqlite_session.get(SingleThrow, round_throw.throw_2)
+    assert (throw_1.throw_type, throw_1.throw_score, throw_1.player_id) == (ThrowType.VALID, 10, 1)
+    assert throw_2.throw_type == ThrowType.HAUKI
+    assert sqlite_session.get(SeriesStanding, (1, 1)).games_played == 2
+
+def test_invalid_and_duplicate_records_are_reported(sqlite_session):
+    records = [
+        _game('1'),
+        _game('1'),
+        _game('2', team_2='XX'),
+        _game('3', score_1_1=99),
+        _game('4', rounds=[{'set': 1, 'throw_round': 1, 'team': 1, 'player_1': 'Liisa',
+                            'player_2': 'Matti', 'throws': ['1', '2', '3', '4']}]),
+        _game('5', rounds=[{'set': 1, 'throw_round': 5, 'team': 2, 'player_1': 'Matti',
+                            'player_2': 'Teppo', 'throws': ['1', '2', '3', '4']}]),
+        _game('6', rounds=[{'set': 1, 'throw_round': 1, 'team': 2, 'player_1': 'Matti',
+                            'player_2': 'Teppo', 'throws': ['1', '2', '3', '100']}]),
+    ]
+    summary = GameImportService().import_records(sqlite_session, [{'line': i, **r} for i, r in enumerate(records, 1)])
+
+    assert summary['games'] == 1
+    errors = dict(summary['errors'])
+    assert errors[2] == "Game already exists"
+    assert "Unknown team" in errors[3]
+    assert "score_1_1" in errors[4]
+    assert "Ambiguous player" in errors[5]
+    assert "throw round" in errors[6]
+    assert "throw value" in errors[7]
+
+def test_existing_games_are_skipped(sqlite_session):
+    service = GameImportService()
+    service.import_records(sqlite_session, [_game('1')])
+    summary = service.import_records(sqlite_session, [_game('1')])
+
+    assert summary['games'] == 0
+    assert sqlite_session.query(Game).count() == 1
+
+def test_rows_of_failed_batch_are_not_duplicates(sqlite_session, monkeypatch):
+    service = GameImportService(batch_size=1)
+    insert_game_rounds = service.throw_service.insert_game_rounds
+    calls = []
+
+    def fail_first_batch(session, game_rounds):
+        calls.append(game_rounds)
+        if len(calls) == 1:
+            raise RuntimeError("connection lost")
+        return insert_game_rounds(session, game_rounds)
+
+    monkeypatch.setattr(service.throw_service, "insert_game_rounds", fail_first_batch)
+    summary = service.import_records(sqlite_session, [{'line': 1, **_game('1')}, {'line': 2, **_game('1')}])
+
+    assert summary['games'] == 1
+    assert [line for line, _ in summary['errors']] == [1]
+    assert sqlite_session.query(Game).count() == 1
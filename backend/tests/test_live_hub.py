@@ -0,0 +1,21 @@
+import pytest
+from app.utils.live_hub import LiveGameHub
+
+@pytest.mark.asyncio
+async def test_publish_reaches_subscribers_of_the_game():
+    hub = LiveGameHub()
+    async with hub.subscribe(1) as first, hub.subscribe(1) as second, hub.subscribe(2) as other:
+        assert hub.publish(1, {'n': 1}) == 2
+        assert first.get_nowait() == {'n': 1}
+        assert second.get_nowait() == {'n': 1}
+        assert other.empty()
+    assert hub.subscriber_count(1) == 0
+    assert hub.publish(1, {'n': 2}) == 0
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events():
+    hub = LiveGameHub(queue_size=2)
+    async with hub.subscribe(1) as queue:
+        for n in range(3):
+            hub.publish(1, {'n': n})
+        assert [queue.get_nowait()['n'] for _ in range(2)] == [1, 2]
@@ -0,0 +1,70 @@
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine
+from app import metrics
+from app.utils.cache import TTLCache, registered_caches
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram('test_seconds', 'Test', ('route',), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route='/a')
+    histogram.observe(0.5, route='/a')
+
+    lines = histogram.collect()
+
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'test_seconds_count{route="/a"} 2' in lines
+
+def test_cache_hits_and_misses():
+    cache = TTLCache(ttl=60, name='test_metrics')
+    cache.get('key')
+    cache.set('key', 1)
+    cache.get('key')
+
+    assert registered_caches()['test_metrics'] is cache
+    assert (cache.hits, cache.misses, cache.size) == (1, 1, 1)
+    assert 'kyykka_cache_hits_total{cache="test_metrics"} 1' in metrics.REGISTRY.render()
+
+def test_flask_requests_are_timed_per_route(tmp_path, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "secret")
+    app = Flask(__name__)
+    # A file database gets a QueuePool, which reports its connections
+    metrics.init_flask(app, create_engine(f"sqlite:///{tmp_path}/metrics.db"))
+
+    @app.route("/games/<int:game_id>")
+    def game(game_id):
+        return "ok"
+
+    client = app.test_client()
+    client.get("/games/1")
+    client.get("/games/2")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+    body = response.data.decode()
+
+    assert response.content_type == metrics.CONTENT_TYPE
+    assert 'kyykka_http_request_duration_seconds_count{app="flask",method="GET",route="/games/<int:game_id>",status="200"} 2' in body
+    assert 'kyykka_db_pool_connections{engine="flask",state="checkedout"} 0' in body
+
+def test_metrics_are_not_served_without_token(monkeypatch):
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    app = Flask(__name__)
+    metrics.init_flask(app, create_engine("sqlite://"))
+
+    assert app.test_client().get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_records_status():
+    async def endpoint(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 404, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def send(message):
+        pass
+
+    await metrics.MetricsMiddleware(endpoint)({'type': 'http', 'method': 'POST', 'path': '/x'}, None, send)
+
+    assert 'kyykka_http_request_duration_seconds_count{app="api",method="POST",route="unmatched",status="404"} 1' \
+        in metrics.REGISTRY.render()
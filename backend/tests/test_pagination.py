@@ -0,0 +1,70 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from app.models.models import Base, Player
+from app.services import player_service
+from app.utils.cache import TTLCache
+from app.utils.pagination import keyset_page, total_count_cache
+
+@pytest_asyncio.fixture
+async def player_db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add_all([
+            Player(id=i, name=name, email=f"{name.lower()}@example.com")
+            for i, name in enumerate(["Aino", "Antti", "Bertta", "Ville_", "Villu"], start=1)
+        ])
+        await session.commit()
+        total_count_cache.invalidate()
+        yield session
+    await engine.dispose()
+
+def test_keyset_page_seeks_after_cursor():
+    sql = str(keyset_page(select(Player), Player.id, limit=10, after=5))
+    assert "players.id >" in sql
+    assert "ORDER BY players.id" in sql
+    assert "OFFSET" not in sql
+
+@pytest.mark.asyncio
+async def test_list_players_pages(player_db):
+    first = await player_service.list_players(player_db, limit=2)
+    second = await player_service.list_players(player_db, limit=2, after=first[-1].id)
+
+    assert [p.id for p in first] == [1, 2]
+    assert [p.id for p in second] == [3, 4]
+
+@pytest.mark.asyncio
+async def test_list_players_name_prefix_is_literal(player_db):
+    players = await player_service.list_players(player_db, name_prefix="Ville_")
+    assert [p.name for p in players] == ["Ville_"]
+
+    players = await player_service.list_players(player_db, name_prefix="a")
+    assert [p.name for p in players] == ["Aino", "Antti"]
+
+@pytest.mark.asyncio
+async def test_count_players_is_cached(player_db):
+    assert await player_service.count_players(player_db) == 5
+
+    player_db.add(Player(name="Cecilia", email="cecilia@example.com"))
+    await player_db.commit()
+    assert await player_service.count_players(player_db) == 5
+
+    total_count_cache.invalidate('players')
+    assert await player_service.count_players(player_db) == 6
+
+def test_ttl_cache_expiry_and_namespaces(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set(('players', None), 1)
+    cache.set(('series', None), 2)
+
+    cache.invalidate('players')
+    assert cache.get(('players', None)) is None
+    assert cache.get(('series', None)) == 2
+
+    now[0] += 11
+    assert cache.get(('series', None)) is None
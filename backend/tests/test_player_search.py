@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base, Player
+from app.services.player_service import player_search_query
+from app.admin_views.views.roster_admin import PlayerSearchAjaxLoader
+
+@pytest.fixture
+def search_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Player(id=1, name="Antti Virtanen", email="antti@example.com"),
+        Player(id=2, name="Matti Anttila", email="matti@example.com"),
+        Player(id=3, name="Liisa Pelaaja", email="liisa.antti@example.com"),
+        Player(id=4, name="Teppo 100%", email="teppo@example.com"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def _names(session, term, **kwargs):
+    return [p.name for p in session.execute(player_search_query(term, **kwargs)).scalars()]
+
+def test_search_matches_name_and_email_prefix_first(search_session):
+    assert _names(search_session, "antti") == ["Antti Virtanen", "Liisa Pelaaja", "Matti Anttila"]
+
+def test_search_limit_and_offset(search_session):
+    assert _names(search_session, "antti", limit=1, offset=1) == ["Liisa Pelaaja"]
+
+def test_search_escapes_wildcards(search_session):
+    assert _names(search_session, "0%") == ["Teppo 100%"]
+    assert _names(search_session, "%") == ["Teppo 100%"]
+
+def test_roster_player_ajax_loader(search_session):
+    loader = PlayerSearchAjaxLoader('player', search_session, Player, fields=['name', 'email'])
+
+    players = loader.get_list("matti")
+
+    assert [loader.format(p) for p in players] == [(2, "Matti Anttila (matti@example.com)")]
+    assert loader.format(None) is None
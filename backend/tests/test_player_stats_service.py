@@ -0,0 +1,88 @@
+import pytest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base, Game, Player, Series, SeriesRegistration, SingleThrow, ThrowType
+from app.services.throw_service import ThrowService
+from app.services.player_stats_service import (
+    player_totals_query, throw_index_query, season_query, leaderboard_query
+)
+
+@pytest.fixture
+def stats_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Player(id=1, name="Alice", email="alice@example.com"),
+        Player(id=2, name="Bob", email="bob@example.com"),
+        Player(id=3, name="Carol", email="carol@example.com"),
+        Series(id=1, name="OKL", season_type="winter", year=2023, game_type_id=1),
+        Series(id=2, name="OKL", season_type="winter", year=2024, game_type_id=1),
+        SeriesRegistration(id=1, series_id=1, team_name="Team A"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B"),
+    ])
+    session.add_all([
+        Game(id=1, series_id=1, game_date=date(2023, 1, 1), team_1_id=1, team_2_id=2,
+             score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0),
+        Game(id=2, series_id=2, game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+             score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0),
+    ])
+    session.flush()
+
+    throw_service = ThrowService()
+    # Alice throws 1st and 2nd, Bob 3rd and 4th in every round, Carol never
+    throw_service.save_game_throws(session, 1, [
+        {'game_set_index': 1, 'throw_round': 1, 'is_home_team': True, 'team_id': 1,
+         'player_1_id': '1', 'player_2_id': '2', 'throws': ["4", "H", "F", "0"]},
+    ])
+    throw_service.save_game_throws(session, 2, [
+        {'game_set_index': 1, 'throw_round': 1, 'is_home_team': True, 'team_id': 1,
+         'player_1_id': '1', 'player_2_id': '2', 'throws': ["2", "2", "1", "1"]},
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def test_player_totals(stats_session):
+    rows = {row.player_id: row for row in stats_session.execute(player_totals_query()).all()}
+
+    assert set(rows) == {1, 2}
+    alice = rows[1]
+    assert (alice.throw_count, alice.total_score, alice.hauki_count) == (4, 8, 1)
+    assert float(alice.average_score) == 2.0
+    assert float(alice.hauki_rate) == 0.25
+    bob = rows[2]
+    assert (bob.fault_count, bob.zero_count) == (1, 1)
+    assert float(bob.zero_rate) == 0.25
+
+def test_orphan_throws_are_not_counted(stats_session):
+    stats_session.add(SingleThrow(throw_type=ThrowType.VALID, throw_score=80, player_id=1, throw_index=1))
+    stats_session.commit()
+
+    alice = stats_session.execute(player_totals_query(1)).one()
+    assert (alice.throw_count, alice.total_score) == (4, 8)
+    assert [row.total_score for row in stats_session.execute(throw_index_query(1)).all()] == [6, 2]
+
+def test_throw_index_distribution(stats_session):
+    rows = stats_session.execute(throw_index_query(1)).all()
+
+    assert [row.throw_index for row in rows] == [1, 2]
+    assert [row.total_score for row in rows] == [6, 2]
+
+def test_season_splits(stats_session):
+    rows = stats_session.execute(season_query(2)).all()
+
+    assert [(row.year, row.game_count, row.throw_count) for row in rows] == [(2024, 1, 2), (2023, 1, 2)]
+    assert rows[1].fault_count == 1
+
+def test_leaderboard_ordering(stats_session):
+    rows = stats_session.execute(leaderboard_query('average_score')).all()
+
+    assert [(row.rank, row.player_name) for row in rows] == [(1, "Alice"), (2, "Bob")]
+    assert stats_session.execute(leaderboard_query(min_throws=5)).all() == []
+
+def test_leaderboard_invalid_order():
+    with pytest.raises(ValueError):
+        leaderboard_query('email')
@@ -0,0 +1,88 @@
+import logging
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from database import query_stats
+
+def test_request_stats_count_and_keep_slowest():
+    engine = create_engine("sqlite://")
+    query_stats.instrument_engine(engine)
+
+    token = query_stats.start_request()
+    with engine.connect() as conn:
+        for i in range(5):
+            conn.execute(text(f"SELECT {i}"))
+    stats = query_stats.finish_request(token, "test")
+
+    assert stats.count == 5
+    assert len(stats.slowest) == query_stats.SLOWEST_KEPT
+    assert stats.slowest[0][0] >= stats.slowest[-1][0]
+    assert query_stats.current_stats() is None
+
+def test_failed_statements_leave_nothing_on_the_connection():
+    engine = create_engine("sqlite://")
+    query_stats.instrument_engine(engine)
+
+    token = query_stats.start_request()
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert 'query_start_time' not in conn.info
+    stats = query_stats.finish_request(token, "test")
+
+    assert stats.count == 1
+
+def test_slow_queries_are_logged(monkeypatch, caplog):
+    monkeypatch.setenv("DB_SLOW_QUERY_MS", "0")
+    engine = create_engine("sqlite://")
+    query_stats.instrument_engine(engine)
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"), engine.connect() as conn:
+        conn.execute(text("SELECT 42"))
+
+    assert "Slow query" in caplog.text and "SELECT 42" in caplog.text
+
+def test_flask_headers(monkeypatch):
+    monkeypatch.setenv("DB_QUERY_HEADERS", "true")
+    engine = create_engine("sqlite://")
+    app = Flask(__name__)
+    query_stats.init_flask(app, engine)
+
+    @app.route("/queries")
+    def queries():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return "ok"
+
+    response = app.test_client().get("/queries")
+
+    assert response.headers["X-DB-Query-Count"] == "2"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_counts_async_engine_queries():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    query_stats.instrument_engine(engine.sync_engine)
+
+    async def endpoint(scope, receive, send):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+            await conn.execute(text("SELECT 3"))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok'})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = query_stats.QueryStatsMiddleware(endpoint, headers=True)
+    await middleware({'type': 'http', 'method': 'GET', 'path': '/'}, None, send)
+    await engine.dispose()
+
+    headers = dict(messages[0]['headers'])
+    assert headers[b'x-db-query-count'] == b'3'
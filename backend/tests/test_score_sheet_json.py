@@ -0,0 +1,67 @@
+import pytest
+from datetime import date
+from pydantic import ValidationError
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base, GameType, Series, SeriesRegistration, Game, SingleRoundThrow, ThrowFact
+from app.models.schemas import ScoreSheet
+from app.services.game_service import GameService
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(GameType(id=1, name="Pari", team_player_amount=2, game_player_amount=2, throw_round_amount=2))
+    session.add(Series(id=1, name="OKL", year=2024, game_type_id=1))
+    session.add_all([
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB"),
+    ])
+    session.add(Game(id=1, series_id=1, round="1", game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                     score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def _round(*throws):
+    return {'players': [1, 2], 'throws': list(throws)}
+
+def test_save_score_sheet(session):
+    sheet = ScoreSheet.model_validate({
+        'scores': [[-4, 2], [1, 0]],
+        'sets': [
+            [[_round('3', 'H', '2', 'E'), _round('1', '1', '1', '1')], [_round('F', '0', '2', '2'), None]],
+            [[None, None]],
+        ],
+    })
+
+    GameService().save_score_sheet(session, 1, sheet)
+
+    game = session.get(Game, 1)
+    assert (game.score_1_1, game.score_1_2, game.score_2_1, game.score_2_2) == (-4, 2, 1, 0)
+    rounds = session.scalars(select(SingleRoundThrow).order_by(SingleRoundThrow.id)).all()
+    assert [(r.game_set_index, r.throw_position, r.home_team, r.team_id) for r in rounds] == [
+        (1, 1, True, 1), (1, 1, False, 2), (1, 2, True, 1)
+    ]
+    assert len(session.scalars(select(ThrowFact)).all()) == 12
+
+def test_rounds_beyond_game_type_are_rejected(session):
+    sheet = ScoreSheet.model_validate({'scores': [[0, 0], [0, 0]], 'sets': [[[None, None]] * 3, []]})
+
+    with pytest.raises(ValueError):
+        GameService().save_score_sheet(session, 1, sheet)
+
+def test_schema_reports_every_error_at_once():
+    with pytest.raises(ValidationError) as exc_info:
+        ScoreSheet.model_validate({
+            'scores': [[0, 100], [0, 0]],
+            'sets': [[[_round('3', 'X', '2', 'E'), {'players': [1], 'throws': ['1'] * 4}]], []],
+        })
+
+    assert {error['loc'] for error in exc_info.value.errors()} == {
+        ('scores', 0, 1),
+        ('sets', 0, 0, 0, 'throws'),
+        ('sets', 0, 0, 1, 'players'),
+    }
@@ -0,0 +1,80 @@
+import pytest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.models import Base, Game, Series, SeriesRegistration, SeriesStanding
+from app.services.standings_service import StandingsService
+
+@pytest.fixture
+def standings_service():
+    return StandingsService()
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Series(id=1, name="OKL", year=2024, game_type_id=1))
+    session.add_all([
+        SeriesRegistration(id=1, series_id=1, team_name="Team A", team_abbreviation="TA", lohko="A"),
+        SeriesRegistration(id=2, series_id=1, team_name="Team B", team_abbreviation="TB", lohko="A"),
+        SeriesRegistration(id=3, series_id=1, team_name="Team C", team_abbreviation="TC", lohko="B"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def _add_game(service, session, team_1_id, team_2_id, scores, round_name="1"):
+    game = Game(series_id=1, game_date=date(2024, 1, 1), round=round_name, is_playoff=False,
+                team_1_id=team_1_id, team_2_id=team_2_id,
+                score_1_1=scores[0], score_1_2=scores[1], score_2_1=scores[2], score_2_2=scores[3])
+    session.add(game)
+    service.apply_game_change(session, None, service.game_snapshot(game))
+    session.commit()
+    return game
+
+def _standing(session, registration_id):
+    return session.get(SeriesStanding, (1, registration_id))
+
+def test_new_game_updates_both_teams(standings_service, sqlite_session):
+    _add_game(standings_service, sqlite_session, 1, 2, (-10, 5, -20, -3))
+
+    winner, loser = _standing(sqlite_session, 1), _standing(sqlite_session, 2)
+    assert (winner.games_played, winner.wins, winner.points) == (1, 1, 2)
+    assert (winner.score_for, winner.score_against) == (-5, -23)
+    assert (loser.losses, loser.points) == (1, 0)
+
+def test_edited_game_applies_delta(standings_service, sqlite_session):
+    game = _add_game(standings_service, sqlite_session, 1, 2, (-10, 5, -20, -3))
+
+    game.score_2_1 = 10
+    previous = standings_service.game_snapshot(game, committed=True)
+    standings_service.apply_game_change(sqlite_session, previous, standings_service.game_snapshot(game))
+    sqlite_session.commit()
+
+    first, second = _standing(sqlite_session, 1), _standing(sqlite_session, 2)
+    assert (first.games_played, first.wins, first.losses, first.points) == (1, 0, 1, 0)
+    assert (second.games_played, second.wins, second.points, second.score_for) == (1, 1, 2, 7)
+
+def test_deleted_game_is_subtracted(standings_service, sqlite_session):
+    game = _add_game(standings_service, sqlite_session, 1, 2, (0, 0, 0, 0))
+    assert _standing(sqlite_session, 1).draws == 1
+
+    standings_service.apply_game_change(sqlite_session, standings_service.game_snapshot(game, committed=True), None)
+    sqlite_session.commit()
+
+    assert _standing(sqlite_session, 1).games_played == 0
+    assert _standing(sqlite_session, 2).points == 0
+
+def test_rebuild_matches_incremental(standings_service, sqlite_session):
+    _add_game(standings_service, sqlite_session, 1, 2, (-10, 5, -20, -3), round_name="1")
+    _add_game(standings_service, sqlite_session, 2, 3, (1, 1, -1, -1), round_name="2")
+    incremental = standings_service.get_standings(sqlite_session, 1)
+
+    standings_service.rebuild_series(sqlite_session, 1)
+    sqlite_session.commit()
+
+    assert standings_service.get_standings(sqlite_session, 1) == incremental
+    assert [row['registration_id'] for row in incremental['A']] == [1, 2]
+    assert incremental['B'][0]['score_difference'] == -4
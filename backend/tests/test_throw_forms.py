@@ -0,0 +1,41 @@
+import pytest
+from types import SimpleNamespace
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+from app.forms.throw_forms import GameScoreSheetForm, score_sheet_form, score_sheet_form_class
+
+@pytest.fixture
+def request_context():
+    with Flask(__name__).test_request_context():
+        yield
+
+def test_form_class_is_built_once_per_round_count():
+    assert score_sheet_form_class(4) is score_sheet_form_class(4)
+    assert score_sheet_form_class(4) is not score_sheet_form_class(5)
+    assert issubclass(score_sheet_form_class(4), GameScoreSheetForm)
+
+def test_team_forms_have_the_rounds_of_the_game_type(request_context):
+    form = score_sheet_form(SimpleNamespace(throw_round_amount=5))
+
+    team_form = form.team_1_round_throws.entries[0]
+    assert [name for name in team_form.form._fields if name.startswith('round_')] == [
+        'round_1', 'round_2', 'round_3', 'round_4', 'round_5'
+    ]
+    assert team_form.get_round(3).form.throw_position.data == 3
+    assert team_form.get_round(6) is None
+
+def test_form_reads_posted_scores(request_context):
+    game_type = SimpleNamespace(throw_round_amount=4)
+
+    form = score_sheet_form(game_type, MultiDict({'score_1_1': '-5', 'score_2_2': '3'}))
+
+    assert form.game_type is game_type
+    assert (form.score_1_1.data, form.score_2_2.data) == (-5, 3)
+
+def test_rounds_are_validated_only_when_posted(request_context):
+    game_type = SimpleNamespace(throw_round_amount=4)
+    scores = {'score_1_1': '-5', 'score_1_2': '1', 'score_2_1': '2', 'score_2_2': '3'}
+
+    assert score_sheet_form(game_type, MultiDict(scores)).validate()
+    posted_round = MultiDict({**scores, 'team_1_round_throws-0-round_1-throw_1': '3'})
+    assert not score_sheet_form(game_type, posted_round).validate()
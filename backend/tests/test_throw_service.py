@@ -1,8 +1,11 @@
 import pytest
 import pytest_asyncio
 from app.services.throw_service import ThrowService
-from app.models.models import ThrowType, SingleThrow
+from datetime import date
+from app.models.models import Base, ThrowType, SingleThrow, SingleRoundThrow, ThrowFact, Game
 from unittest.mock import Mock, patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
 
 @pytest_asyncio.fixture
 def throw_service():
@@ -92,3 +95,137 @@ def test_process_throw_data(throw_service):
     throw_type, throw_score = throw_service._process_throw_data("H")
     assert throw_type == ThrowType.HAUKI.value
     assert throw_score == 0
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def _round_entry(set_index, throw_round, is_home_team, throws):
+    return {
+        'game_set_index': set_index,
+        'throw_round': throw_round,
+        'is_home_team': is_home_team,
+        'team_id': 1 if is_home_team else 2,
+        'player_1_id': '1',
+        'player_2_id': '2',
+        'throws': throws
+    }
+
+def test_save_game_throws_bulk(throw_service, sqlite_session):
+    entries = [
+        _round_entry(1, 1, True, ["10", "H", "5", "F"]),
+        _round_entry(1, 1, False, ["E", "0", "-2", "3"]),
+    ]
+
+    assert throw_service.save_game_throws(sqlite_session, 1, entries) == 8
+
+    rounds = sqlite_session.query(SingleRoundThrow).order_by(SingleRoundThrow.home_team.desc()).all()
+    assert len(rounds) == 2
+    home = rounds[0]
+    assert home.throws_1.throw_score == 10 and home.throws_1.player_id == 1
+    assert home.throws_2.throw_type == ThrowType.HAUKI
+    assert home.throws_3.player_id == 2 and home.throws_3.throw_index == 3
+    assert home.throws_4.throw_type == ThrowType.FAULT
+
+def test_save_game_throws_resave_updates_in_place(throw_service, sqlite_session):
+    throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 2, True, ["1", "2", "3", "4"])])
+    original_ids = [t.id for t in sqlite_session.query(SingleThrow).order_by(SingleThrow.id)]
+
+    written = throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 2, True, ["1", "2", "7", "H"])])
+    sqlite_session.flush()
+
+    assert written == 2
+    assert [t.id for t in sqlite_session.query(SingleThrow).order_by(SingleThrow.id)] == original_ids
+    round_throw = sqlite_session.query(SingleRoundThrow).one()
+    assert round_throw.throws_3.throw_score == 7
+    assert round_throw.throws_4.throw_type == ThrowType.HAUKI
+    assert round_throw.throws_1.throw_index == 5
+
+def test_save_game_throws_unchanged_writes_nothing(throw_service, sqlite_session):
+    entries = [_round_entry(2, 1, False, ["1", "2", "3", "4"])]
+    throw_service.save_game_throws(sqlite_session, 1, entries)
+
+    assert throw_service.save_game_throws(sqlite_session, 1, entries) == 0
+
+def test_delete_orphan_throws(throw_service, sqlite_session):
+    throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 1, True, ["1", "2", "3", "4"])])
+    sqlite_session.add_all([
+        SingleThrow(throw_type=ThrowType.VALID, throw_score=5, player_id=1, throw_index=1)
+        for _ in range(5)
+    ])
+    sqlite_session.commit()
+
+    assert throw_service.delete_orphan_throws(sqlite_session, batch_size=2) == 5
+    assert sqlite_session.query(SingleThrow).count() == 4
+
+def test_save_game_throws_invalid_value(throw_service, sqlite_session):
+    with pytest.raises(ValueError):
+        throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 1, True, ["10", "X", "5", "F"])])
+
+def test_save_game_throws_maintains_throw_facts(throw_service, sqlite_session):
+    sqlite_session.add(Game(id=1, series_id=3, game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                            score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0))
+    throw_service.save_game_throws(sqlite_session, 1, [
+        _round_entry(1, 1, True, ["10", "H", "5", "F"]),
+        _round_entry(1, 1, False, ["E", "0", "-2", "3"]),
+    ])
+
+    facts = sqlite_session.query(ThrowFact).order_by(ThrowFact.home_team.desc(), ThrowFact.round_throw_number).all()
+    assert len(facts) == 8
+    assert {(fact.game_id, fact.series_id, fact.game_set_index, fact.throw_round) for fact in facts} == {(1, 3, 1, 1)}
+    assert [(fact.player_id, fact.throw_type, fact.throw_score) for fact in facts[:2]] == [
+        (1, ThrowType.VALID, 10), (1, ThrowType.HAUKI, 0)
+    ]
+    assert (facts[4].team_id, facts[4].throw_type) == (2, ThrowType.E)
+
+    throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 1, True, ["10", "H", "7", "F"])])
+    sqlite_session.expire_all()
+
+    changed = sqlite_session.query(ThrowFact).filter_by(home_team=True, round_throw_number=3).one()
+    assert changed.throw_score == 7
+    assert sqlite_session.query(ThrowFact).count() == 8
+
+def test_save_game_throws_completes_appended_round(throw_service, sqlite_session):
+    game = Game(id=1, series_id=3, game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0)
+    sqlite_session.add(game)
+    throw_service.append_throw(sqlite_session, game, 1, 1, True, 2, 1, "H")
+    appended_id = sqlite_session.query(SingleThrow.id).scalar()
+
+    written = throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 1, True, ["10", "6", "5", "F"])])
+    sqlite_session.flush()
+    sqlite_session.expire_all()
+
+    assert written == 4
+    assert sqlite_session.query(SingleThrow).count() == 4
+    round_throw = sqlite_session.query(SingleRoundThrow).one()
+    assert round_throw.throw_2 == appended_id
+    assert [t.throw_score for t in (round_throw.throws_1, round_throw.throws_2,
+                                    round_throw.throws_3, round_throw.throws_4)] == [10, 6, 5, 0]
+    assert sqlite_session.query(ThrowFact).count() == 4
+
+def test_append_throw_refreshes_only_its_fact_row(throw_service, sqlite_session):
+    game = Game(id=1, series_id=3, game_date=date(2024, 1, 1), team_1_id=1, team_2_id=2,
+                score_1_1=0, score_1_2=0, score_2_1=0, score_2_2=0)
+    sqlite_session.add(game)
+    throw_service.save_game_throws(sqlite_session, 1, [_round_entry(1, 1, True, ["10", "H", "5", "F"])])
+    sqlite_session.flush()
+    deleted_facts = []
+    event.listen(sqlite_session.get_bind(), "after_cursor_execute",
+                 lambda conn, cursor, statement, *args: statement.startswith("DELETE FROM throw_facts")
+                 and deleted_facts.append(cursor.rowcount))
+
+    throw_service.append_throw(sqlite_session, game, 1, 2, False, 3, 2, "4")
+    throw_service.append_throw(sqlite_session, game, 1, 1, True, 1, 1, "7")
+
+    assert deleted_facts == [0, 1]
+    assert sqlite_session.query(ThrowFact).count() == 5
+    appended = sqlite_session.query(ThrowFact).filter_by(throw_round=2).one()
+    assert (appended.home_team, appended.round_throw_number, appended.throw_score, appended.team_id) == (False, 3, 4, 2)
+    corrected = sqlite_session.query(ThrowFact).filter_by(throw_round=1, round_throw_number=1).one()
+    assert corrected.throw_score == 7